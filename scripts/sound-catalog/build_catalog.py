@@ -19,1480 +19,1297 @@ Sound sources:
 - Drum Machines: 72 machines with standard kit sounds (from tidal-drum-machines)
 - VCSL: ~80 instruments (Versilian Community Sample Library)
 - Built-in Synths: 6 oscillators
+
+The per-source tables below are tuples of tuples rather than nested dicts:
+each row costs one tuple instead of a dict header + hash table + tag list,
+and SoundEntry dicts are only materialized once, in build_catalog().
 """
 
+import bisect
+import functools
+import itertools
 import json
+import pickle
+import re
+import sys
+from collections import Counter
+from enum import IntEnum
 from pathlib import Path
-from typing import TypedDict
+from typing import NamedTuple
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback; orjson is in requirements.txt
+    orjson = None
+
+
+class SoundEntry(NamedTuple):
+    """One catalog entry.
 
+    A NamedTuple costs a fraction of an equivalent dict per entry and gives
+    C-level field access; dicts are only materialized at JSON emit time via
+    _asdict().
+    """
 
-class SoundEntry(TypedDict):
     id: str
     name: str
     description: str
     source: str
     category: str
-    tags: list[str]
+    tags: tuple[str, ...]
     example: str
 
 
-def build_catalog() -> list[SoundEntry]:
-    """Build the complete sound catalog."""
-    sounds: list[SoundEntry] = []
-
-    # ===========================================
-    # GM SOUNDFONTS (General MIDI - 125 instruments)
-    # High-quality sampled acoustic instruments
-    # ===========================================
-
-    gm_soundfonts = {
-        # Keyboards
-        "gm_acoustic_grand_piano": {
-            "description": "Grand piano, realistic sampled acoustic piano. Best for classical, jazz, ballads. Warm, full-bodied tone with natural resonance.",
-            "category": "keyboards",
-            "tags": ["piano", "acoustic", "classical", "jazz", "ballad", "warm", "orchestral"],
-            "example": 'note("c4 e4 g4").s("gm_acoustic_grand_piano")'
-        },
-        "gm_bright_acoustic_piano": {
-            "description": "Bright acoustic piano with more presence in high frequencies. Cuts through mixes well. Good for pop and contemporary.",
-            "category": "keyboards",
-            "tags": ["piano", "acoustic", "bright", "pop", "contemporary"],
-            "example": 'note("c4 e4 g4").s("gm_bright_acoustic_piano")'
-        },
-        "gm_electric_grand_piano": {
-            "description": "Electric grand piano, hybrid between acoustic and electric. Vintage 70s sound.",
-            "category": "keyboards",
-            "tags": ["piano", "electric", "vintage", "70s"],
-            "example": 'note("c4 e4 g4").s("gm_electric_grand_piano")'
-        },
-        "gm_honky_tonk_piano": {
-            "description": "Detuned saloon piano with ragtime character. Slightly out of tune for authentic honky-tonk feel.",
-            "category": "keyboards",
-            "tags": ["piano", "honky-tonk", "ragtime", "detuned", "vintage", "saloon"],
-            "example": 'note("c4 e4 g4").s("gm_honky_tonk_piano")'
-        },
-        "gm_epiano1": {
-            "description": "Electric piano 1, Rhodes-like warm electric piano. Classic soul, R&B, jazz fusion sound. Smooth and bell-like.",
-            "category": "keyboards",
-            "tags": ["piano", "electric", "rhodes", "soul", "r&b", "jazz", "warm", "bell-like"],
-            "example": 'note("c4 e4 g4").s("gm_epiano1")'
-        },
-        "gm_epiano2": {
-            "description": "Electric piano 2, brighter electric piano variant. More bite than epiano1. FM-style tines.",
-            "category": "keyboards",
-            "tags": ["piano", "electric", "bright", "fm", "tines"],
-            "example": 'note("c4 e4 g4").s("gm_epiano2")'
-        },
-        "gm_harpsichord": {
-            "description": "Baroque harpsichord with plucked string character. Essential for baroque and renaissance music.",
-            "category": "keyboards",
-            "tags": ["harpsichord", "baroque", "renaissance", "plucked", "classical", "historical"],
-            "example": 'note("c4 e4 g4").s("gm_harpsichord")'
-        },
-        "gm_clavinet": {
-            "description": "Funky clavinet, percussive keyboard. Classic funk and soul sound. Wah-wah compatible.",
-            "category": "keyboards",
-            "tags": ["clavinet", "funk", "soul", "percussive", "wah"],
-            "example": 'note("c4 e4 g4").s("gm_clavinet")'
-        },
-        "gm_celesta": {
-            "description": "Celesta, magical bell-like keyboard. Sparkling, ethereal quality. Think Nutcracker Suite.",
-            "category": "keyboards",
-            "tags": ["celesta", "bells", "magical", "ethereal", "orchestral", "christmas"],
-            "example": 'note("c5 e5 g5").s("gm_celesta")'
-        },
-        "gm_music_box": {
-            "description": "Music box, delicate mechanical bell sound. Nostalgic, toy-like, innocent quality.",
-            "category": "keyboards",
-            "tags": ["music-box", "bells", "toy", "nostalgic", "innocent", "delicate"],
-            "example": 'note("c5 e5 g5").s("gm_music_box")'
-        },
-
-        # Chromatic Percussion
-        "gm_vibraphone": {
-            "description": "Vibraphone, mellow mallet percussion with motor vibrato. Jazz standard, smooth and warm.",
-            "category": "chromatic_percussion",
-            "tags": ["vibraphone", "vibes", "jazz", "mellow", "mallet", "smooth"],
-            "example": 'note("c4 e4 g4").s("gm_vibraphone")'
-        },
-        "gm_marimba": {
-            "description": "Marimba, warm wooden mallet percussion. African and Latin influences. Rich low end.",
-            "category": "chromatic_percussion",
-            "tags": ["marimba", "mallet", "wooden", "african", "latin", "warm"],
-            "example": 'note("c4 e4 g4").s("gm_marimba")'
-        },
-        "gm_xylophone": {
-            "description": "Xylophone, bright wooden mallet percussion. Crisp attack, short decay. Cartoon-like.",
-            "category": "chromatic_percussion",
-            "tags": ["xylophone", "mallet", "wooden", "bright", "crisp", "cartoon"],
-            "example": 'note("c5 e5 g5").s("gm_xylophone")'
-        },
-        "gm_glockenspiel": {
-            "description": "Glockenspiel, bright metallic bells. High-pitched, sparkling, orchestral.",
-            "category": "chromatic_percussion",
-            "tags": ["glockenspiel", "bells", "metallic", "bright", "sparkling", "orchestral"],
-            "example": 'note("c6 e6 g6").s("gm_glockenspiel")'
-        },
-        "gm_tubular_bells": {
-            "description": "Tubular bells, orchestral chimes. Majestic, ceremonial, church-like.",
-            "category": "chromatic_percussion",
-            "tags": ["tubular-bells", "chimes", "orchestral", "majestic", "church", "ceremonial"],
-            "example": 'note("c4 e4 g4").s("gm_tubular_bells")'
-        },
-
-        # Organs
-        "gm_church_organ": {
-            "description": "Pipe organ, majestic church organ with full stops. Sacred, powerful, reverberant.",
-            "category": "organ",
-            "tags": ["organ", "pipe", "church", "sacred", "majestic", "classical"],
-            "example": 'note("c3 e3 g3").s("gm_church_organ")'
-        },
-        "gm_reed_organ": {
-            "description": "Reed organ, harmonium-style pump organ. Vintage, folk, Americana.",
-            "category": "organ",
-            "tags": ["organ", "reed", "harmonium", "vintage", "folk", "americana"],
-            "example": 'note("c4 e4 g4").s("gm_reed_organ")'
-        },
-        "gm_accordion": {
-            "description": "Accordion, bellows-driven free-reed instrument. French, tango, folk music.",
-            "category": "organ",
-            "tags": ["accordion", "bellows", "french", "tango", "folk", "musette"],
-            "example": 'note("c4 e4 g4").s("gm_accordion")'
-        },
-        "gm_harmonica": {
-            "description": "Harmonica, blues harp. Expressive, bending notes, folk and blues essential.",
-            "category": "organ",
-            "tags": ["harmonica", "blues", "harp", "folk", "expressive"],
-            "example": 'note("c4 e4 g4").s("gm_harmonica")'
-        },
-
-        # Guitars
-        "gm_acoustic_guitar_nylon": {
-            "description": "Classical nylon-string guitar. Soft, warm, fingerpicking. Spanish, classical, bossa nova.",
-            "category": "guitar",
-            "tags": ["guitar", "acoustic", "nylon", "classical", "spanish", "bossa-nova", "fingerpicking"],
-            "example": 'note("c4 e4 g4").s("gm_acoustic_guitar_nylon")'
-        },
-        "gm_acoustic_guitar_steel": {
-            "description": "Steel-string acoustic guitar. Bright, strumming, folk and country. Singer-songwriter staple.",
-            "category": "guitar",
-            "tags": ["guitar", "acoustic", "steel", "folk", "country", "strumming", "bright"],
-            "example": 'note("c4 e4 g4").s("gm_acoustic_guitar_steel")'
-        },
-        "gm_electric_guitar_clean": {
-            "description": "Clean electric guitar. Clear, bell-like, versatile. Funk, jazz, pop rhythm.",
-            "category": "guitar",
-            "tags": ["guitar", "electric", "clean", "funk", "jazz", "pop", "rhythm"],
-            "example": 'note("c4 e4 g4").s("gm_electric_guitar_clean")'
-        },
-        "gm_electric_guitar_jazz": {
-            "description": "Jazz electric guitar. Warm, hollow-body tone. Smooth jazz, bebop.",
-            "category": "guitar",
-            "tags": ["guitar", "electric", "jazz", "warm", "hollow-body", "bebop"],
-            "example": 'note("c4 e4 g4").s("gm_electric_guitar_jazz")'
-        },
-        "gm_electric_guitar_muted": {
-            "description": "Muted electric guitar. Palm-muted, chunky, rhythmic. Funk and rock rhythm.",
-            "category": "guitar",
-            "tags": ["guitar", "electric", "muted", "palm-mute", "funk", "rock", "rhythmic"],
-            "example": 'note("c4 e4 g4").s("gm_electric_guitar_muted")'
-        },
-        "gm_overdriven_guitar": {
-            "description": "Overdriven electric guitar. Crunchy, warm distortion. Classic rock, blues rock.",
-            "category": "guitar",
-            "tags": ["guitar", "electric", "overdrive", "crunch", "rock", "blues"],
-            "example": 'note("c4 e4 g4").s("gm_overdriven_guitar")'
-        },
-        "gm_distortion_guitar": {
-            "description": "Distorted electric guitar. Heavy, aggressive, saturated. Hard rock, metal.",
-            "category": "guitar",
-            "tags": ["guitar", "electric", "distortion", "heavy", "metal", "rock", "aggressive"],
-            "example": 'note("c4 e4 g4").s("gm_distortion_guitar")'
-        },
-        "gm_guitar_harmonics": {
-            "description": "Guitar harmonics. Bell-like overtones, ethereal. Ambient textures.",
-            "category": "guitar",
-            "tags": ["guitar", "harmonics", "bell-like", "ethereal", "ambient", "overtones"],
-            "example": 'note("c5 e5 g5").s("gm_guitar_harmonics")'
-        },
-
-        # Bass
-        "gm_acoustic_bass": {
-            "description": "Upright acoustic bass, double bass. Jazz, orchestral, warm woody tone.",
-            "category": "bass",
-            "tags": ["bass", "acoustic", "upright", "double-bass", "jazz", "orchestral", "woody"],
-            "example": 'note("c2 e2 g2").s("gm_acoustic_bass")'
-        },
-        "gm_electric_bass_finger": {
-            "description": "Electric bass, fingerstyle. Round, warm, versatile. Most common bass sound.",
-            "category": "bass",
-            "tags": ["bass", "electric", "finger", "warm", "round", "versatile"],
-            "example": 'note("c2 e2 g2").s("gm_electric_bass_finger")'
-        },
-        "gm_electric_bass_pick": {
-            "description": "Electric bass, picked. Punchy, bright attack. Rock, punk.",
-            "category": "bass",
-            "tags": ["bass", "electric", "pick", "punchy", "bright", "rock", "punk"],
-            "example": 'note("c2 e2 g2").s("gm_electric_bass_pick")'
-        },
-        "gm_slap_bass_1": {
-            "description": "Slap bass. Funky, percussive, thumb-slap technique. Funk, disco.",
-            "category": "bass",
-            "tags": ["bass", "slap", "funk", "percussive", "disco", "thumb"],
-            "example": 'note("c2 e2 g2").s("gm_slap_bass_1")'
-        },
-        "gm_slap_bass_2": {
-            "description": "Slap bass variant. Different slap bass character, more aggressive.",
-            "category": "bass",
-            "tags": ["bass", "slap", "funk", "aggressive"],
-            "example": 'note("c2 e2 g2").s("gm_slap_bass_2")'
-        },
-        "gm_synth_bass_1": {
-            "description": "Synth bass 1. Electronic, punchy, subby. EDM, electronic, pop.",
-            "category": "bass",
-            "tags": ["bass", "synth", "electronic", "sub", "edm", "punchy"],
-            "example": 'note("c2 e2 g2").s("gm_synth_bass_1")'
-        },
-        "gm_synth_bass_2": {
-            "description": "Synth bass 2. Resonant, squelchy synth bass. Acid, electronic.",
-            "category": "bass",
-            "tags": ["bass", "synth", "resonant", "squelchy", "acid", "electronic"],
-            "example": 'note("c2 e2 g2").s("gm_synth_bass_2")'
-        },
-
-        # Strings
-        "gm_violin": {
-            "description": "Solo violin. Expressive, emotional, classical. Lead melodic instrument.",
-            "category": "strings",
-            "tags": ["violin", "strings", "orchestral", "classical", "solo", "expressive", "emotional"],
-            "example": 'note("c5 e5 g5").s("gm_violin")'
-        },
-        "gm_viola": {
-            "description": "Solo viola. Warmer than violin, alto range. Rich, melancholic.",
-            "category": "strings",
-            "tags": ["viola", "strings", "orchestral", "classical", "warm", "alto", "melancholic"],
-            "example": 'note("c4 e4 g4").s("gm_viola")'
-        },
-        "gm_cello": {
-            "description": "Solo cello. Deep, rich, emotional. Tenor/bass range strings. Cinematic.",
-            "category": "strings",
-            "tags": ["cello", "strings", "orchestral", "classical", "deep", "rich", "cinematic", "emotional"],
-            "example": 'note("c3 e3 g3").s("gm_cello")'
-        },
-        "gm_contrabass": {
-            "description": "Double bass, contrabass. Deepest orchestral string. Foundation, gravitas.",
-            "category": "strings",
-            "tags": ["contrabass", "double-bass", "strings", "orchestral", "deep", "foundation"],
-            "example": 'note("c2 e2 g2").s("gm_contrabass")'
-        },
-        "gm_tremolo_strings": {
-            "description": "Tremolo strings. Rapid bowing, tension, suspense. Film scores.",
-            "category": "strings",
-            "tags": ["strings", "tremolo", "tension", "suspense", "film", "orchestral"],
-            "example": 'note("c4 e4 g4").s("gm_tremolo_strings")'
-        },
-        "gm_pizzicato_strings": {
-            "description": "Pizzicato strings. Plucked, playful, staccato. Light, whimsical.",
-            "category": "strings",
-            "tags": ["strings", "pizzicato", "plucked", "playful", "staccato", "whimsical"],
-            "example": 'note("c4 e4 g4").s("gm_pizzicato_strings")'
-        },
-        "gm_orchestral_harp": {
-            "description": "Concert harp. Ethereal, sweeping, glissando. Angelic, classical, film.",
-            "category": "strings",
-            "tags": ["harp", "orchestral", "ethereal", "glissando", "angelic", "classical"],
-            "example": 'note("c4 e4 g4").s("gm_orchestral_harp")'
-        },
-        "gm_string_ensemble_1": {
-            "description": "String ensemble, full section. Lush, cinematic, emotional pads. Film scores.",
-            "category": "strings",
-            "tags": ["strings", "ensemble", "orchestral", "lush", "cinematic", "pads", "film"],
-            "example": 'note("<[c3,e3,g3] [f3,a3,c4]>").s("gm_string_ensemble_1")'
-        },
-        "gm_string_ensemble_2": {
-            "description": "String ensemble 2. Slower attack, more atmospheric. Ambient, cinematic.",
-            "category": "strings",
-            "tags": ["strings", "ensemble", "atmospheric", "ambient", "slow-attack"],
-            "example": 'note("<[c3,e3,g3] [f3,a3,c4]>").s("gm_string_ensemble_2")'
-        },
-        "gm_synth_strings_1": {
-            "description": "Synth strings 1. Electronic string pad. 80s, synthwave, warm.",
-            "category": "strings",
-            "tags": ["strings", "synth", "pad", "80s", "synthwave", "electronic", "warm"],
-            "example": 'note("<[c3,e3,g3] [f3,a3,c4]>").s("gm_synth_strings_1")'
-        },
-        "gm_synth_strings_2": {
-            "description": "Synth strings 2. Brighter synth strings. More presence.",
-            "category": "strings",
-            "tags": ["strings", "synth", "bright", "electronic"],
-            "example": 'note("<[c3,e3,g3] [f3,a3,c4]>").s("gm_synth_strings_2")'
-        },
-
-        # Brass
-        "gm_trumpet": {
-            "description": "Trumpet. Bright, powerful, cutting. Jazz, classical, fanfares, mariachi.",
-            "category": "brass",
-            "tags": ["trumpet", "brass", "bright", "powerful", "jazz", "fanfare", "classical"],
-            "example": 'note("c5 e5 g5").s("gm_trumpet")'
-        },
-        "gm_trombone": {
-            "description": "Trombone. Warm, powerful, slide. Jazz, classical, big band.",
-            "category": "brass",
-            "tags": ["trombone", "brass", "warm", "slide", "jazz", "big-band", "classical"],
-            "example": 'note("c3 e3 g3").s("gm_trombone")'
-        },
-        "gm_tuba": {
-            "description": "Tuba. Deep, powerful bass brass. Oom-pah, orchestral foundation.",
-            "category": "brass",
-            "tags": ["tuba", "brass", "deep", "bass", "orchestral", "oom-pah"],
-            "example": 'note("c2 e2 g2").s("gm_tuba")'
-        },
-        "gm_muted_trumpet": {
-            "description": "Muted trumpet. Nasal, intimate, jazz. Harmon mute, smoky clubs.",
-            "category": "brass",
-            "tags": ["trumpet", "muted", "brass", "jazz", "intimate", "harmon", "smoky"],
-            "example": 'note("c5 e5 g5").s("gm_muted_trumpet")'
-        },
-        "gm_french_horn": {
-            "description": "French horn. Noble, warm, orchestral. Romantic, cinematic, heroic.",
-            "category": "brass",
-            "tags": ["french-horn", "brass", "noble", "warm", "orchestral", "heroic", "cinematic"],
-            "example": 'note("c4 e4 g4").s("gm_french_horn")'
-        },
-        "gm_brass_section": {
-            "description": "Brass section ensemble. Powerful, big band, orchestral hits. Fanfares.",
-            "category": "brass",
-            "tags": ["brass", "section", "ensemble", "powerful", "big-band", "fanfare", "orchestral"],
-            "example": 'note("<[c4,e4,g4] [d4,f4,a4]>").s("gm_brass_section")'
-        },
-        "gm_synth_brass_1": {
-            "description": "Synth brass 1. Electronic brass stabs. 80s, disco, funk.",
-            "category": "brass",
-            "tags": ["brass", "synth", "stabs", "80s", "disco", "funk", "electronic"],
-            "example": 'note("<[c4,e4,g4]>").s("gm_synth_brass_1")'
-        },
-        "gm_synth_brass_2": {
-            "description": "Synth brass 2. Softer synth brass. Pads, atmospheric.",
-            "category": "brass",
-            "tags": ["brass", "synth", "soft", "pads", "atmospheric"],
-            "example": 'note("<[c4,e4,g4]>").s("gm_synth_brass_2")'
-        },
-
-        # Woodwinds
-        "gm_flute": {
-            "description": "Concert flute. Airy, bright, agile. Classical, jazz, folk, world.",
-            "category": "woodwind",
-            "tags": ["flute", "woodwind", "airy", "bright", "classical", "folk"],
-            "example": 'note("c5 e5 g5").s("gm_flute")'
-        },
-        "gm_piccolo": {
-            "description": "Piccolo. Highest woodwind, piercing, brilliant. Marches, orchestral.",
-            "category": "woodwind",
-            "tags": ["piccolo", "woodwind", "high", "piercing", "brilliant", "march"],
-            "example": 'note("c6 e6 g6").s("gm_piccolo")'
-        },
-        "gm_recorder": {
-            "description": "Recorder. Renaissance, folk, educational. Soft, pure tone.",
-            "category": "woodwind",
-            "tags": ["recorder", "woodwind", "renaissance", "folk", "soft", "pure"],
-            "example": 'note("c5 e5 g5").s("gm_recorder")'
-        },
-        "gm_pan_flute": {
-            "description": "Pan flute. Breathy, ethnic, Andean. Mystical, world music.",
-            "category": "woodwind",
-            "tags": ["pan-flute", "woodwind", "breathy", "andean", "mystical", "world"],
-            "example": 'note("c5 e5 g5").s("gm_pan_flute")'
-        },
-        "gm_blown_bottle": {
-            "description": "Blown bottle. Airy, hollow, ethereal. Ambient textures.",
-            "category": "woodwind",
-            "tags": ["bottle", "blown", "airy", "hollow", "ethereal", "ambient"],
-            "example": 'note("c5 e5 g5").s("gm_blown_bottle")'
-        },
-        "gm_shakuhachi": {
-            "description": "Shakuhachi. Japanese bamboo flute. Zen, meditative, breathy.",
-            "category": "woodwind",
-            "tags": ["shakuhachi", "japanese", "bamboo", "zen", "meditative", "breathy", "world"],
-            "example": 'note("c5 e5 g5").s("gm_shakuhachi")'
-        },
-        "gm_whistle": {
-            "description": "Tin whistle. Irish, Celtic, folk. Bright, agile, jigs and reels.",
-            "category": "woodwind",
-            "tags": ["whistle", "tin-whistle", "irish", "celtic", "folk", "bright"],
-            "example": 'note("c5 e5 g5").s("gm_whistle")'
-        },
-        "gm_ocarina": {
-            "description": "Ocarina. Ancient wind instrument. Pure, innocent, video game nostalgia.",
-            "category": "woodwind",
-            "tags": ["ocarina", "ancient", "pure", "innocent", "zelda", "game"],
-            "example": 'note("c5 e5 g5").s("gm_ocarina")'
-        },
-        "gm_clarinet": {
-            "description": "Clarinet. Warm, woody, agile. Jazz, classical, klezmer.",
-            "category": "woodwind",
-            "tags": ["clarinet", "woodwind", "warm", "woody", "jazz", "classical", "klezmer"],
-            "example": 'note("c4 e4 g4").s("gm_clarinet")'
-        },
-        "gm_oboe": {
-            "description": "Oboe. Nasal, expressive, penetrating. Orchestral, pastoral.",
-            "category": "woodwind",
-            "tags": ["oboe", "woodwind", "nasal", "expressive", "orchestral", "pastoral"],
-            "example": 'note("c5 e5 g5").s("gm_oboe")'
-        },
-        "gm_english_horn": {
-            "description": "English horn, cor anglais. Melancholic, warm oboe family. Romantic.",
-            "category": "woodwind",
-            "tags": ["english-horn", "cor-anglais", "woodwind", "melancholic", "warm", "romantic"],
-            "example": 'note("c4 e4 g4").s("gm_english_horn")'
-        },
-        "gm_bassoon": {
-            "description": "Bassoon. Deep, reedy, sometimes comical. Orchestral bass woodwind.",
-            "category": "woodwind",
-            "tags": ["bassoon", "woodwind", "deep", "reedy", "orchestral", "bass"],
-            "example": 'note("c3 e3 g3").s("gm_bassoon")'
-        },
-        "gm_soprano_sax": {
-            "description": "Soprano saxophone. Bright, penetrating, Kenny G. Jazz, smooth jazz.",
-            "category": "woodwind",
-            "tags": ["saxophone", "soprano", "bright", "jazz", "smooth-jazz"],
-            "example": 'note("c5 e5 g5").s("gm_soprano_sax")'
-        },
-        "gm_alto_sax": {
-            "description": "Alto saxophone. Versatile, expressive. Jazz standard, R&B, pop.",
-            "category": "woodwind",
-            "tags": ["saxophone", "alto", "versatile", "jazz", "r&b", "pop"],
-            "example": 'note("c4 e4 g4").s("gm_alto_sax")'
-        },
-        "gm_tenor_sax": {
-            "description": "Tenor saxophone. Rich, powerful, soulful. Jazz, rock, R&B solos.",
-            "category": "woodwind",
-            "tags": ["saxophone", "tenor", "rich", "powerful", "soulful", "jazz", "rock"],
-            "example": 'note("c4 e4 g4").s("gm_tenor_sax")'
-        },
-        "gm_baritone_sax": {
-            "description": "Baritone saxophone. Deep, honking, powerful. Jazz, funk, rock.",
-            "category": "woodwind",
-            "tags": ["saxophone", "baritone", "deep", "honking", "funk", "jazz"],
-            "example": 'note("c3 e3 g3").s("gm_baritone_sax")'
-        },
-
-        # Synth Lead
-        "gm_lead_1_square": {
-            "description": "Square wave lead. Retro, chiptune, 8-bit. Video game melodies.",
-            "category": "synth_lead",
-            "tags": ["synth", "lead", "square", "chiptune", "8-bit", "retro", "game"],
-            "example": 'note("c5 e5 g5").s("gm_lead_1_square")'
-        },
-        "gm_lead_2_sawtooth": {
-            "description": "Sawtooth wave lead. Bright, buzzy, classic synth. Trance, EDM.",
-            "category": "synth_lead",
-            "tags": ["synth", "lead", "sawtooth", "bright", "buzzy", "trance", "edm"],
-            "example": 'note("c5 e5 g5").s("gm_lead_2_sawtooth")'
-        },
-        "gm_lead_3_calliope": {
-            "description": "Calliope lead. Circus organ, carnival. Quirky, whimsical.",
-            "category": "synth_lead",
-            "tags": ["synth", "lead", "calliope", "circus", "carnival", "quirky"],
-            "example": 'note("c5 e5 g5").s("gm_lead_3_calliope")'
-        },
-        "gm_lead_4_chiff": {
-            "description": "Chiff lead. Breathy attack, pan flute-like. Airy, new age.",
-            "category": "synth_lead",
-            "tags": ["synth", "lead", "chiff", "breathy", "airy", "new-age"],
-            "example": 'note("c5 e5 g5").s("gm_lead_4_chiff")'
-        },
-        "gm_lead_5_charang": {
-            "description": "Charang lead. Distorted, aggressive synth. Rock, industrial.",
-            "category": "synth_lead",
-            "tags": ["synth", "lead", "charang", "distorted", "aggressive", "rock"],
-            "example": 'note("c5 e5 g5").s("gm_lead_5_charang")'
-        },
-        "gm_lead_6_voice": {
-            "description": "Voice lead synth. Vocal-like, choir synth. Ethereal, dreamy.",
-            "category": "synth_lead",
-            "tags": ["synth", "lead", "voice", "vocal", "choir", "ethereal", "dreamy"],
-            "example": 'note("c5 e5 g5").s("gm_lead_6_voice")'
-        },
-        "gm_lead_7_fifths": {
-            "description": "Fifths lead. Power chord synth, parallel fifths. Heavy, powerful.",
-            "category": "synth_lead",
-            "tags": ["synth", "lead", "fifths", "power-chord", "heavy", "powerful"],
-            "example": 'note("c5 e5 g5").s("gm_lead_7_fifths")'
-        },
-        "gm_lead_8_bass_lead": {
-            "description": "Bass and lead combo. Thick, full range synth. Monophonic bass-lead.",
-            "category": "synth_lead",
-            "tags": ["synth", "lead", "bass", "thick", "full", "monophonic"],
-            "example": 'note("c4 e4 g4").s("gm_lead_8_bass_lead")'
-        },
-
-        # Synth Pad
-        "gm_pad_1_new_age": {
-            "description": "New age pad. Warm, evolving, meditation. Ambient, relaxation.",
-            "category": "synth_pad",
-            "tags": ["synth", "pad", "new-age", "warm", "ambient", "meditation", "relaxation"],
-            "example": 'note("<[c3,e3,g3] [f3,a3,c4]>").s("gm_pad_1_new_age")'
-        },
-        "gm_pad_2_warm": {
-            "description": "Warm pad. Analog-style warmth, rich harmonics. Lush, enveloping.",
-            "category": "synth_pad",
-            "tags": ["synth", "pad", "warm", "analog", "lush", "rich"],
-            "example": 'note("<[c3,e3,g3] [f3,a3,c4]>").s("gm_pad_2_warm")'
-        },
-        "gm_pad_3_polysynth": {
-            "description": "Polysynth pad. Classic 80s pad. Synthwave, retro, detuned.",
-            "category": "synth_pad",
-            "tags": ["synth", "pad", "polysynth", "80s", "synthwave", "retro", "detuned"],
-            "example": 'note("<[c3,e3,g3] [f3,a3,c4]>").s("gm_pad_3_polysynth")'
-        },
-        "gm_pad_4_choir": {
-            "description": "Choir pad. Vocal ensemble synth. Angelic, ethereal, sacred.",
-            "category": "synth_pad",
-            "tags": ["synth", "pad", "choir", "vocal", "angelic", "ethereal", "sacred"],
-            "example": 'note("<[c3,e3,g3] [f3,a3,c4]>").s("gm_pad_4_choir")'
-        },
-        "gm_pad_5_bowed": {
-            "description": "Bowed pad. String-like attack, evolving. Cinematic, tension.",
-            "category": "synth_pad",
-            "tags": ["synth", "pad", "bowed", "string-like", "cinematic", "tension"],
-            "example": 'note("<[c3,e3,g3] [f3,a3,c4]>").s("gm_pad_5_bowed")'
-        },
-        "gm_pad_6_metallic": {
-            "description": "Metallic pad. Bell-like, shimmering. Industrial, cold, futuristic.",
-            "category": "synth_pad",
-            "tags": ["synth", "pad", "metallic", "bell", "shimmering", "industrial", "cold"],
-            "example": 'note("<[c3,e3,g3] [f3,a3,c4]>").s("gm_pad_6_metallic")'
-        },
-        "gm_pad_7_halo": {
-            "description": "Halo pad. Bright, airy, heavenly. Ambient, uplifting.",
-            "category": "synth_pad",
-            "tags": ["synth", "pad", "halo", "bright", "airy", "heavenly", "ambient"],
-            "example": 'note("<[c3,e3,g3] [f3,a3,c4]>").s("gm_pad_7_halo")'
-        },
-        "gm_pad_8_sweep": {
-            "description": "Sweep pad. Filter sweep, evolving texture. Builds, transitions.",
-            "category": "synth_pad",
-            "tags": ["synth", "pad", "sweep", "filter", "evolving", "builds", "transitions"],
-            "example": 'note("<[c3,e3,g3] [f3,a3,c4]>").s("gm_pad_8_sweep")'
-        },
-
-        # Synth Effects
-        "gm_fx_1_rain": {
-            "description": "Rain effect. Ambient rainfall texture. Weather, nature, atmosphere.",
-            "category": "synth_fx",
-            "tags": ["synth", "fx", "rain", "ambient", "weather", "nature", "atmosphere"],
-            "example": 'note("c4").s("gm_fx_1_rain")'
-        },
-        "gm_fx_2_soundtrack": {
-            "description": "Soundtrack effect. Cinematic texture, sci-fi. Film score, tension.",
-            "category": "synth_fx",
-            "tags": ["synth", "fx", "soundtrack", "cinematic", "sci-fi", "tension"],
-            "example": 'note("c4").s("gm_fx_2_soundtrack")'
-        },
-        "gm_fx_3_crystal": {
-            "description": "Crystal effect. Sparkling, magical. Fantasy, fairy tale.",
-            "category": "synth_fx",
-            "tags": ["synth", "fx", "crystal", "sparkling", "magical", "fantasy"],
-            "example": 'note("c5").s("gm_fx_3_crystal")'
-        },
-        "gm_fx_4_atmosphere": {
-            "description": "Atmosphere effect. Ambient drone, space. Sci-fi, suspense.",
-            "category": "synth_fx",
-            "tags": ["synth", "fx", "atmosphere", "ambient", "drone", "space", "sci-fi"],
-            "example": 'note("c3").s("gm_fx_4_atmosphere")'
-        },
-        "gm_fx_5_brightness": {
-            "description": "Brightness effect. Rising shimmer, uplifting. Transitions, builds.",
-            "category": "synth_fx",
-            "tags": ["synth", "fx", "brightness", "shimmer", "uplifting", "transitions"],
-            "example": 'note("c4").s("gm_fx_5_brightness")'
-        },
-        "gm_fx_6_goblins": {
-            "description": "Goblins effect. Dark, creepy texture. Horror, fantasy, tension.",
-            "category": "synth_fx",
-            "tags": ["synth", "fx", "goblins", "dark", "creepy", "horror", "fantasy"],
-            "example": 'note("c3").s("gm_fx_6_goblins")'
-        },
-        "gm_fx_7_echoes": {
-            "description": "Echoes effect. Delayed, spacious texture. Ambient, dub.",
-            "category": "synth_fx",
-            "tags": ["synth", "fx", "echoes", "delay", "spacious", "ambient", "dub"],
-            "example": 'note("c4").s("gm_fx_7_echoes")'
-        },
-        "gm_fx_8_scifi": {
-            "description": "Sci-fi effect. Futuristic, electronic texture. Space, technology.",
-            "category": "synth_fx",
-            "tags": ["synth", "fx", "scifi", "futuristic", "electronic", "space", "technology"],
-            "example": 'note("c4").s("gm_fx_8_scifi")'
-        },
-
-        # Ethnic/World
-        "gm_sitar": {
-            "description": "Sitar. Indian classical string, drone strings. Raga, world, psychedelic.",
-            "category": "ethnic",
-            "tags": ["sitar", "indian", "world", "string", "raga", "psychedelic", "drone"],
-            "example": 'note("c4 e4 g4").s("gm_sitar")'
-        },
-        "gm_banjo": {
-            "description": "Banjo. Twangy, bright plucked. Bluegrass, country, folk, Americana.",
-            "category": "ethnic",
-            "tags": ["banjo", "bluegrass", "country", "folk", "americana", "twangy", "plucked"],
-            "example": 'note("c4 e4 g4").s("gm_banjo")'
-        },
-        "gm_shamisen": {
-            "description": "Shamisen. Japanese three-string lute. Traditional, folk, kabuki.",
-            "category": "ethnic",
-            "tags": ["shamisen", "japanese", "world", "traditional", "folk", "kabuki"],
-            "example": 'note("c4 e4 g4").s("gm_shamisen")'
-        },
-        "gm_koto": {
-            "description": "Koto. Japanese zither, 13 strings. Elegant, zen, traditional.",
-            "category": "ethnic",
-            "tags": ["koto", "japanese", "world", "zither", "elegant", "zen", "traditional"],
-            "example": 'note("c4 e4 g4").s("gm_koto")'
-        },
-        "gm_kalimba": {
-            "description": "Kalimba, thumb piano. African mbira. Mellow, plucky, world.",
-            "category": "ethnic",
-            "tags": ["kalimba", "mbira", "african", "world", "thumb-piano", "mellow", "plucky"],
-            "example": 'note("c5 e5 g5").s("gm_kalimba")'
-        },
-        "gm_bagpipe": {
-            "description": "Bagpipes. Scottish/Irish drone instrument. Celtic, ceremonial, powerful.",
-            "category": "ethnic",
-            "tags": ["bagpipe", "scottish", "irish", "celtic", "drone", "ceremonial", "powerful"],
-            "example": 'note("c4 e4 g4").s("gm_bagpipe")'
-        },
-        "gm_fiddle": {
-            "description": "Fiddle. Folk violin style. Celtic, bluegrass, country, energetic.",
-            "category": "ethnic",
-            "tags": ["fiddle", "violin", "folk", "celtic", "bluegrass", "country", "energetic"],
-            "example": 'note("c5 e5 g5").s("gm_fiddle")'
-        },
-        "gm_shanai": {
-            "description": "Shanai, shehnai. Indian double-reed. Weddings, celebrations, snake charmer.",
-            "category": "ethnic",
-            "tags": ["shanai", "shehnai", "indian", "world", "double-reed", "celebration"],
-            "example": 'note("c5 e5 g5").s("gm_shanai")'
-        },
-
-        # Percussion
-        "gm_timpani": {
-            "description": "Timpani, kettle drums. Orchestral bass drums. Dramatic, thunderous.",
-            "category": "percussion",
-            "tags": ["timpani", "kettle-drums", "orchestral", "dramatic", "thunderous", "classical"],
-            "example": 'note("c2 g2").s("gm_timpani")'
-        },
-        "gm_orchestra_hit": {
-            "description": "Orchestra hit. Full orchestra stab. 80s, dramatic, impact.",
-            "category": "percussion",
-            "tags": ["orchestra-hit", "stab", "80s", "dramatic", "impact", "orchestral"],
-            "example": 'note("c4").s("gm_orchestra_hit")'
-        },
-        "gm_melodic_tom": {
-            "description": "Melodic tom drums. Tuned toms, tribal. Tom fills, ethnic.",
-            "category": "percussion",
-            "tags": ["tom", "melodic", "tuned", "tribal", "ethnic", "fills"],
-            "example": 'note("c3 e3 g3").s("gm_melodic_tom")'
-        },
-        "gm_synth_drum": {
-            "description": "Synth drum. Electronic drum hit. 80s, electronic, processed.",
-            "category": "percussion",
-            "tags": ["drum", "synth", "electronic", "80s", "processed"],
-            "example": 'note("c3").s("gm_synth_drum")'
-        },
-        "gm_taiko_drum": {
-            "description": "Taiko drum. Japanese big drum. Powerful, ceremonial, epic.",
-            "category": "percussion",
-            "tags": ["taiko", "japanese", "drum", "powerful", "ceremonial", "epic"],
-            "example": 'note("c2").s("gm_taiko_drum")'
-        },
-        "gm_woodblock": {
-            "description": "Woodblock. Hollow wooden percussion. Latin, orchestral, click.",
-            "category": "percussion",
-            "tags": ["woodblock", "wooden", "percussion", "latin", "orchestral", "click"],
-            "example": 's("gm_woodblock")'
-        },
-        "gm_steel_drums": {
-            "description": "Steel drums, steel pans. Caribbean, tropical. Bright, melodic, calypso.",
-            "category": "percussion",
-            "tags": ["steel-drums", "caribbean", "tropical", "calypso", "bright", "melodic"],
-            "example": 'note("c5 e5 g5").s("gm_steel_drums")'
-        },
-
-        # Sound Effects
-        "gm_applause": {
-            "description": "Applause sound effect. Audience clapping. Endings, live feel.",
-            "category": "sound_fx",
-            "tags": ["applause", "clapping", "audience", "sfx", "live"],
-            "example": 's("gm_applause")'
-        },
-        "gm_gunshot": {
-            "description": "Gunshot sound effect. Explosive impact. Action, cinematic.",
-            "category": "sound_fx",
-            "tags": ["gunshot", "explosion", "impact", "sfx", "action"],
-            "example": 's("gm_gunshot")'
-        },
-        "gm_helicopter": {
-            "description": "Helicopter sound effect. Rotor blades, aviation. Cinematic, action.",
-            "category": "sound_fx",
-            "tags": ["helicopter", "aviation", "sfx", "cinematic", "action"],
-            "example": 's("gm_helicopter")'
-        },
-        "gm_seashore": {
-            "description": "Seashore sound effect. Ocean waves, beach ambience. Relaxation, nature.",
-            "category": "sound_fx",
-            "tags": ["seashore", "ocean", "waves", "beach", "sfx", "relaxation", "nature"],
-            "example": 's("gm_seashore")'
-        },
-        "gm_bird_tweet": {
-            "description": "Bird tweet sound effect. Birdsong, nature. Morning, forest, peaceful.",
-            "category": "sound_fx",
-            "tags": ["bird", "tweet", "nature", "sfx", "morning", "forest", "peaceful"],
-            "example": 's("gm_bird_tweet")'
-        },
-        "gm_telephone_ring": {
-            "description": "Telephone ring sound effect. Classic phone ring. Retro, communication.",
-            "category": "sound_fx",
-            "tags": ["telephone", "ring", "phone", "sfx", "retro", "communication"],
-            "example": 's("gm_telephone_ring")'
-        },
-        "gm_breath_noise": {
-            "description": "Breath noise effect. Wind, breathing sound. Ambient, human, intimate.",
-            "category": "sound_fx",
-            "tags": ["breath", "wind", "noise", "sfx", "ambient", "human"],
-            "example": 's("gm_breath_noise")'
-        },
-    }
+# ===========================================
+# GM SOUNDFONTS (General MIDI - 125 instruments)
+# High-quality sampled acoustic instruments
+# Row: (id, description, category, tags); the example note pattern comes from
+# _GM_DEFAULT_NOTES for the row's category unless listed in _GM_NOTE_OVERRIDES
+# ===========================================
+
+GM_SOUNDFONTS = (
+    # Keyboards
+    ("gm_acoustic_grand_piano", "Grand piano, realistic sampled acoustic piano. Best for classical, jazz, ballads. Warm, full-bodied tone with natural resonance.", "keyboards", ("piano", "acoustic", "classical", "jazz", "ballad", "warm", "orchestral")),
+    ("gm_bright_acoustic_piano", "Bright acoustic piano with more presence in high frequencies. Cuts through mixes well. Good for pop and contemporary.", "keyboards", ("piano", "acoustic", "bright", "pop", "contemporary")),
+    ("gm_electric_grand_piano", "Electric grand piano, hybrid between acoustic and electric. Vintage 70s sound.", "keyboards", ("piano", "electric", "vintage", "70s")),
+    ("gm_honky_tonk_piano", "Detuned saloon piano with ragtime character. Slightly out of tune for authentic honky-tonk feel.", "keyboards", ("piano", "honky-tonk", "ragtime", "detuned", "vintage", "saloon")),
+    ("gm_epiano1", "Electric piano 1, Rhodes-like warm electric piano. Classic soul, R&B, jazz fusion sound. Smooth and bell-like.", "keyboards", ("piano", "electric", "rhodes", "soul", "r&b", "jazz", "warm", "bell-like")),
+    ("gm_epiano2", "Electric piano 2, brighter electric piano variant. More bite than epiano1. FM-style tines.", "keyboards", ("piano", "electric", "bright", "fm", "tines")),
+    ("gm_harpsichord", "Baroque harpsichord with plucked string character. Essential for baroque and renaissance music.", "keyboards", ("harpsichord", "baroque", "renaissance", "plucked", "classical", "historical")),
+    ("gm_clavinet", "Funky clavinet, percussive keyboard. Classic funk and soul sound. Wah-wah compatible.", "keyboards", ("clavinet", "funk", "soul", "percussive", "wah")),
+    ("gm_celesta", "Celesta, magical bell-like keyboard. Sparkling, ethereal quality. Think Nutcracker Suite.", "keyboards", ("celesta", "bells", "magical", "ethereal", "orchestral", "christmas")),
+    ("gm_music_box", "Music box, delicate mechanical bell sound. Nostalgic, toy-like, innocent quality.", "keyboards", ("music-box", "bells", "toy", "nostalgic", "innocent", "delicate")),
+
+    # Chromatic Percussion
+    ("gm_vibraphone", "Vibraphone, mellow mallet percussion with motor vibrato. Jazz standard, smooth and warm.", "chromatic_percussion", ("vibraphone", "vibes", "jazz", "mellow", "mallet", "smooth")),
+    ("gm_marimba", "Marimba, warm wooden mallet percussion. African and Latin influences. Rich low end.", "chromatic_percussion", ("marimba", "mallet", "wooden", "african", "latin", "warm")),
+    ("gm_xylophone", "Xylophone, bright wooden mallet percussion. Crisp attack, short decay. Cartoon-like.", "chromatic_percussion", ("xylophone", "mallet", "wooden", "bright", "crisp", "cartoon")),
+    ("gm_glockenspiel", "Glockenspiel, bright metallic bells. High-pitched, sparkling, orchestral.", "chromatic_percussion", ("glockenspiel", "bells", "metallic", "bright", "sparkling", "orchestral")),
+    ("gm_tubular_bells", "Tubular bells, orchestral chimes. Majestic, ceremonial, church-like.", "chromatic_percussion", ("tubular-bells", "chimes", "orchestral", "majestic", "church", "ceremonial")),
+
+    # Organs
+    ("gm_church_organ", "Pipe organ, majestic church organ with full stops. Sacred, powerful, reverberant.", "organ", ("organ", "pipe", "church", "sacred", "majestic", "classical")),
+    ("gm_reed_organ", "Reed organ, harmonium-style pump organ. Vintage, folk, Americana.", "organ", ("organ", "reed", "harmonium", "vintage", "folk", "americana")),
+    ("gm_accordion", "Accordion, bellows-driven free-reed instrument. French, tango, folk music.", "organ", ("accordion", "bellows", "french", "tango", "folk", "musette")),
+    ("gm_harmonica", "Harmonica, blues harp. Expressive, bending notes, folk and blues essential.", "organ", ("harmonica", "blues", "harp", "folk", "expressive")),
+
+    # Guitars
+    ("gm_acoustic_guitar_nylon", "Classical nylon-string guitar. Soft, warm, fingerpicking. Spanish, classical, bossa nova.", "guitar", ("guitar", "acoustic", "nylon", "classical", "spanish", "bossa-nova", "fingerpicking")),
+    ("gm_acoustic_guitar_steel", "Steel-string acoustic guitar. Bright, strumming, folk and country. Singer-songwriter staple.", "guitar", ("guitar", "acoustic", "steel", "folk", "country", "strumming", "bright")),
+    ("gm_electric_guitar_clean", "Clean electric guitar. Clear, bell-like, versatile. Funk, jazz, pop rhythm.", "guitar", ("guitar", "electric", "clean", "funk", "jazz", "pop", "rhythm")),
+    ("gm_electric_guitar_jazz", "Jazz electric guitar. Warm, hollow-body tone. Smooth jazz, bebop.", "guitar", ("guitar", "electric", "jazz", "warm", "hollow-body", "bebop")),
+    ("gm_electric_guitar_muted", "Muted electric guitar. Palm-muted, chunky, rhythmic. Funk and rock rhythm.", "guitar", ("guitar", "electric", "muted", "palm-mute", "funk", "rock", "rhythmic")),
+    ("gm_overdriven_guitar", "Overdriven electric guitar. Crunchy, warm distortion. Classic rock, blues rock.", "guitar", ("guitar", "electric", "overdrive", "crunch", "rock", "blues")),
+    ("gm_distortion_guitar", "Distorted electric guitar. Heavy, aggressive, saturated. Hard rock, metal.", "guitar", ("guitar", "electric", "distortion", "heavy", "metal", "rock", "aggressive")),
+    ("gm_guitar_harmonics", "Guitar harmonics. Bell-like overtones, ethereal. Ambient textures.", "guitar", ("guitar", "harmonics", "bell-like", "ethereal", "ambient", "overtones")),
+
+    # Bass
+    ("gm_acoustic_bass", "Upright acoustic bass, double bass. Jazz, orchestral, warm woody tone.", "bass", ("bass", "acoustic", "upright", "double-bass", "jazz", "orchestral", "woody")),
+    ("gm_electric_bass_finger", "Electric bass, fingerstyle. Round, warm, versatile. Most common bass sound.", "bass", ("bass", "electric", "finger", "warm", "round", "versatile")),
+    ("gm_electric_bass_pick", "Electric bass, picked. Punchy, bright attack. Rock, punk.", "bass", ("bass", "electric", "pick", "punchy", "bright", "rock", "punk")),
+    ("gm_slap_bass_1", "Slap bass. Funky, percussive, thumb-slap technique. Funk, disco.", "bass", ("bass", "slap", "funk", "percussive", "disco", "thumb")),
+    ("gm_slap_bass_2", "Slap bass variant. Different slap bass character, more aggressive.", "bass", ("bass", "slap", "funk", "aggressive")),
+    ("gm_synth_bass_1", "Synth bass 1. Electronic, punchy, subby. EDM, electronic, pop.", "bass", ("bass", "synth", "electronic", "sub", "edm", "punchy")),
+    ("gm_synth_bass_2", "Synth bass 2. Resonant, squelchy synth bass. Acid, electronic.", "bass", ("bass", "synth", "resonant", "squelchy", "acid", "electronic")),
+
+    # Strings
+    ("gm_violin", "Solo violin. Expressive, emotional, classical. Lead melodic instrument.", "strings", ("violin", "strings", "orchestral", "classical", "solo", "expressive", "emotional")),
+    ("gm_viola", "Solo viola. Warmer than violin, alto range. Rich, melancholic.", "strings", ("viola", "strings", "orchestral", "classical", "warm", "alto", "melancholic")),
+    ("gm_cello", "Solo cello. Deep, rich, emotional. Tenor/bass range strings. Cinematic.", "strings", ("cello", "strings", "orchestral", "classical", "deep", "rich", "cinematic", "emotional")),
+    ("gm_contrabass", "Double bass, contrabass. Deepest orchestral string. Foundation, gravitas.", "strings", ("contrabass", "double-bass", "strings", "orchestral", "deep", "foundation")),
+    ("gm_tremolo_strings", "Tremolo strings. Rapid bowing, tension, suspense. Film scores.", "strings", ("strings", "tremolo", "tension", "suspense", "film", "orchestral")),
+    ("gm_pizzicato_strings", "Pizzicato strings. Plucked, playful, staccato. Light, whimsical.", "strings", ("strings", "pizzicato", "plucked", "playful", "staccato", "whimsical")),
+    ("gm_orchestral_harp", "Concert harp. Ethereal, sweeping, glissando. Angelic, classical, film.", "strings", ("harp", "orchestral", "ethereal", "glissando", "angelic", "classical")),
+    ("gm_string_ensemble_1", "String ensemble, full section. Lush, cinematic, emotional pads. Film scores.", "strings", ("strings", "ensemble", "orchestral", "lush", "cinematic", "pads", "film")),
+    ("gm_string_ensemble_2", "String ensemble 2. Slower attack, more atmospheric. Ambient, cinematic.", "strings", ("strings", "ensemble", "atmospheric", "ambient", "slow-attack")),
+    ("gm_synth_strings_1", "Synth strings 1. Electronic string pad. 80s, synthwave, warm.", "strings", ("strings", "synth", "pad", "80s", "synthwave", "electronic", "warm")),
+    ("gm_synth_strings_2", "Synth strings 2. Brighter synth strings. More presence.", "strings", ("strings", "synth", "bright", "electronic")),
+
+    # Brass
+    ("gm_trumpet", "Trumpet. Bright, powerful, cutting. Jazz, classical, fanfares, mariachi.", "brass", ("trumpet", "brass", "bright", "powerful", "jazz", "fanfare", "classical")),
+    ("gm_trombone", "Trombone. Warm, powerful, slide. Jazz, classical, big band.", "brass", ("trombone", "brass", "warm", "slide", "jazz", "big-band", "classical")),
+    ("gm_tuba", "Tuba. Deep, powerful bass brass. Oom-pah, orchestral foundation.", "brass", ("tuba", "brass", "deep", "bass", "orchestral", "oom-pah")),
+    ("gm_muted_trumpet", "Muted trumpet. Nasal, intimate, jazz. Harmon mute, smoky clubs.", "brass", ("trumpet", "muted", "brass", "jazz", "intimate", "harmon", "smoky")),
+    ("gm_french_horn", "French horn. Noble, warm, orchestral. Romantic, cinematic, heroic.", "brass", ("french-horn", "brass", "noble", "warm", "orchestral", "heroic", "cinematic")),
+    ("gm_brass_section", "Brass section ensemble. Powerful, big band, orchestral hits. Fanfares.", "brass", ("brass", "section", "ensemble", "powerful", "big-band", "fanfare", "orchestral")),
+    ("gm_synth_brass_1", "Synth brass 1. Electronic brass stabs. 80s, disco, funk.", "brass", ("brass", "synth", "stabs", "80s", "disco", "funk", "electronic")),
+    ("gm_synth_brass_2", "Synth brass 2. Softer synth brass. Pads, atmospheric.", "brass", ("brass", "synth", "soft", "pads", "atmospheric")),
+
+    # Woodwinds
+    ("gm_flute", "Concert flute. Airy, bright, agile. Classical, jazz, folk, world.", "woodwind", ("flute", "woodwind", "airy", "bright", "classical", "folk")),
+    ("gm_piccolo", "Piccolo. Highest woodwind, piercing, brilliant. Marches, orchestral.", "woodwind", ("piccolo", "woodwind", "high", "piercing", "brilliant", "march")),
+    ("gm_recorder", "Recorder. Renaissance, folk, educational. Soft, pure tone.", "woodwind", ("recorder", "woodwind", "renaissance", "folk", "soft", "pure")),
+    ("gm_pan_flute", "Pan flute. Breathy, ethnic, Andean. Mystical, world music.", "woodwind", ("pan-flute", "woodwind", "breathy", "andean", "mystical", "world")),
+    ("gm_blown_bottle", "Blown bottle. Airy, hollow, ethereal. Ambient textures.", "woodwind", ("bottle", "blown", "airy", "hollow", "ethereal", "ambient")),
+    ("gm_shakuhachi", "Shakuhachi. Japanese bamboo flute. Zen, meditative, breathy.", "woodwind", ("shakuhachi", "japanese", "bamboo", "zen", "meditative", "breathy", "world")),
+    ("gm_whistle", "Tin whistle. Irish, Celtic, folk. Bright, agile, jigs and reels.", "woodwind", ("whistle", "tin-whistle", "irish", "celtic", "folk", "bright")),
+    ("gm_ocarina", "Ocarina. Ancient wind instrument. Pure, innocent, video game nostalgia.", "woodwind", ("ocarina", "ancient", "pure", "innocent", "zelda", "game")),
+    ("gm_clarinet", "Clarinet. Warm, woody, agile. Jazz, classical, klezmer.", "woodwind", ("clarinet", "woodwind", "warm", "woody", "jazz", "classical", "klezmer")),
+    ("gm_oboe", "Oboe. Nasal, expressive, penetrating. Orchestral, pastoral.", "woodwind", ("oboe", "woodwind", "nasal", "expressive", "orchestral", "pastoral")),
+    ("gm_english_horn", "English horn, cor anglais. Melancholic, warm oboe family. Romantic.", "woodwind", ("english-horn", "cor-anglais", "woodwind", "melancholic", "warm", "romantic")),
+    ("gm_bassoon", "Bassoon. Deep, reedy, sometimes comical. Orchestral bass woodwind.", "woodwind", ("bassoon", "woodwind", "deep", "reedy", "orchestral", "bass")),
+    ("gm_soprano_sax", "Soprano saxophone. Bright, penetrating, Kenny G. Jazz, smooth jazz.", "woodwind", ("saxophone", "soprano", "bright", "jazz", "smooth-jazz")),
+    ("gm_alto_sax", "Alto saxophone. Versatile, expressive. Jazz standard, R&B, pop.", "woodwind", ("saxophone", "alto", "versatile", "jazz", "r&b", "pop")),
+    ("gm_tenor_sax", "Tenor saxophone. Rich, powerful, soulful. Jazz, rock, R&B solos.", "woodwind", ("saxophone", "tenor", "rich", "powerful", "soulful", "jazz", "rock")),
+    ("gm_baritone_sax", "Baritone saxophone. Deep, honking, powerful. Jazz, funk, rock.", "woodwind", ("saxophone", "baritone", "deep", "honking", "funk", "jazz")),
+
+    # Synth Lead
+    ("gm_lead_1_square", "Square wave lead. Retro, chiptune, 8-bit. Video game melodies.", "synth_lead", ("synth", "lead", "square", "chiptune", "8-bit", "retro", "game")),
+    ("gm_lead_2_sawtooth", "Sawtooth wave lead. Bright, buzzy, classic synth. Trance, EDM.", "synth_lead", ("synth", "lead", "sawtooth", "bright", "buzzy", "trance", "edm")),
+    ("gm_lead_3_calliope", "Calliope lead. Circus organ, carnival. Quirky, whimsical.", "synth_lead", ("synth", "lead", "calliope", "circus", "carnival", "quirky")),
+    ("gm_lead_4_chiff", "Chiff lead. Breathy attack, pan flute-like. Airy, new age.", "synth_lead", ("synth", "lead", "chiff", "breathy", "airy", "new-age")),
+    ("gm_lead_5_charang", "Charang lead. Distorted, aggressive synth. Rock, industrial.", "synth_lead", ("synth", "lead", "charang", "distorted", "aggressive", "rock")),
+    ("gm_lead_6_voice", "Voice lead synth. Vocal-like, choir synth. Ethereal, dreamy.", "synth_lead", ("synth", "lead", "voice", "vocal", "choir", "ethereal", "dreamy")),
+    ("gm_lead_7_fifths", "Fifths lead. Power chord synth, parallel fifths. Heavy, powerful.", "synth_lead", ("synth", "lead", "fifths", "power-chord", "heavy", "powerful")),
+    ("gm_lead_8_bass_lead", "Bass and lead combo. Thick, full range synth. Monophonic bass-lead.", "synth_lead", ("synth", "lead", "bass", "thick", "full", "monophonic")),
+
+    # Synth Pad
+    ("gm_pad_1_new_age", "New age pad. Warm, evolving, meditation. Ambient, relaxation.", "synth_pad", ("synth", "pad", "new-age", "warm", "ambient", "meditation", "relaxation")),
+    ("gm_pad_2_warm", "Warm pad. Analog-style warmth, rich harmonics. Lush, enveloping.", "synth_pad", ("synth", "pad", "warm", "analog", "lush", "rich")),
+    ("gm_pad_3_polysynth", "Polysynth pad. Classic 80s pad. Synthwave, retro, detuned.", "synth_pad", ("synth", "pad", "polysynth", "80s", "synthwave", "retro", "detuned")),
+    ("gm_pad_4_choir", "Choir pad. Vocal ensemble synth. Angelic, ethereal, sacred.", "synth_pad", ("synth", "pad", "choir", "vocal", "angelic", "ethereal", "sacred")),
+    ("gm_pad_5_bowed", "Bowed pad. String-like attack, evolving. Cinematic, tension.", "synth_pad", ("synth", "pad", "bowed", "string-like", "cinematic", "tension")),
+    ("gm_pad_6_metallic", "Metallic pad. Bell-like, shimmering. Industrial, cold, futuristic.", "synth_pad", ("synth", "pad", "metallic", "bell", "shimmering", "industrial", "cold")),
+    ("gm_pad_7_halo", "Halo pad. Bright, airy, heavenly. Ambient, uplifting.", "synth_pad", ("synth", "pad", "halo", "bright", "airy", "heavenly", "ambient")),
+    ("gm_pad_8_sweep", "Sweep pad. Filter sweep, evolving texture. Builds, transitions.", "synth_pad", ("synth", "pad", "sweep", "filter", "evolving", "builds", "transitions")),
+
+    # Synth Effects
+    ("gm_fx_1_rain", "Rain effect. Ambient rainfall texture. Weather, nature, atmosphere.", "synth_fx", ("synth", "fx", "rain", "ambient", "weather", "nature", "atmosphere")),
+    ("gm_fx_2_soundtrack", "Soundtrack effect. Cinematic texture, sci-fi. Film score, tension.", "synth_fx", ("synth", "fx", "soundtrack", "cinematic", "sci-fi", "tension")),
+    ("gm_fx_3_crystal", "Crystal effect. Sparkling, magical. Fantasy, fairy tale.", "synth_fx", ("synth", "fx", "crystal", "sparkling", "magical", "fantasy")),
+    ("gm_fx_4_atmosphere", "Atmosphere effect. Ambient drone, space. Sci-fi, suspense.", "synth_fx", ("synth", "fx", "atmosphere", "ambient", "drone", "space", "sci-fi")),
+    ("gm_fx_5_brightness", "Brightness effect. Rising shimmer, uplifting. Transitions, builds.", "synth_fx", ("synth", "fx", "brightness", "shimmer", "uplifting", "transitions")),
+    ("gm_fx_6_goblins", "Goblins effect. Dark, creepy texture. Horror, fantasy, tension.", "synth_fx", ("synth", "fx", "goblins", "dark", "creepy", "horror", "fantasy")),
+    ("gm_fx_7_echoes", "Echoes effect. Delayed, spacious texture. Ambient, dub.", "synth_fx", ("synth", "fx", "echoes", "delay", "spacious", "ambient", "dub")),
+    ("gm_fx_8_scifi", "Sci-fi effect. Futuristic, electronic texture. Space, technology.", "synth_fx", ("synth", "fx", "scifi", "futuristic", "electronic", "space", "technology")),
+
+    # Ethnic/World
+    ("gm_sitar", "Sitar. Indian classical string, drone strings. Raga, world, psychedelic.", "ethnic", ("sitar", "indian", "world", "string", "raga", "psychedelic", "drone")),
+    ("gm_banjo", "Banjo. Twangy, bright plucked. Bluegrass, country, folk, Americana.", "ethnic", ("banjo", "bluegrass", "country", "folk", "americana", "twangy", "plucked")),
+    ("gm_shamisen", "Shamisen. Japanese three-string lute. Traditional, folk, kabuki.", "ethnic", ("shamisen", "japanese", "world", "traditional", "folk", "kabuki")),
+    ("gm_koto", "Koto. Japanese zither, 13 strings. Elegant, zen, traditional.", "ethnic", ("koto", "japanese", "world", "zither", "elegant", "zen", "traditional")),
+    ("gm_kalimba", "Kalimba, thumb piano. African mbira. Mellow, plucky, world.", "ethnic", ("kalimba", "mbira", "african", "world", "thumb-piano", "mellow", "plucky")),
+    ("gm_bagpipe", "Bagpipes. Scottish/Irish drone instrument. Celtic, ceremonial, powerful.", "ethnic", ("bagpipe", "scottish", "irish", "celtic", "drone", "ceremonial", "powerful")),
+    ("gm_fiddle", "Fiddle. Folk violin style. Celtic, bluegrass, country, energetic.", "ethnic", ("fiddle", "violin", "folk", "celtic", "bluegrass", "country", "energetic")),
+    ("gm_shanai", "Shanai, shehnai. Indian double-reed. Weddings, celebrations, snake charmer.", "ethnic", ("shanai", "shehnai", "indian", "world", "double-reed", "celebration")),
+
+    # Percussion
+    ("gm_timpani", "Timpani, kettle drums. Orchestral bass drums. Dramatic, thunderous.", "percussion", ("timpani", "kettle-drums", "orchestral", "dramatic", "thunderous", "classical")),
+    ("gm_orchestra_hit", "Orchestra hit. Full orchestra stab. 80s, dramatic, impact.", "percussion", ("orchestra-hit", "stab", "80s", "dramatic", "impact", "orchestral")),
+    ("gm_melodic_tom", "Melodic tom drums. Tuned toms, tribal. Tom fills, ethnic.", "percussion", ("tom", "melodic", "tuned", "tribal", "ethnic", "fills")),
+    ("gm_synth_drum", "Synth drum. Electronic drum hit. 80s, electronic, processed.", "percussion", ("drum", "synth", "electronic", "80s", "processed")),
+    ("gm_taiko_drum", "Taiko drum. Japanese big drum. Powerful, ceremonial, epic.", "percussion", ("taiko", "japanese", "drum", "powerful", "ceremonial", "epic")),
+    ("gm_woodblock", "Woodblock. Hollow wooden percussion. Latin, orchestral, click.", "percussion", ("woodblock", "wooden", "percussion", "latin", "orchestral", "click")),
+    ("gm_steel_drums", "Steel drums, steel pans. Caribbean, tropical. Bright, melodic, calypso.", "percussion", ("steel-drums", "caribbean", "tropical", "calypso", "bright", "melodic")),
+
+    # Sound Effects
+    ("gm_applause", "Applause sound effect. Audience clapping. Endings, live feel.", "sound_fx", ("applause", "clapping", "audience", "sfx", "live")),
+    ("gm_gunshot", "Gunshot sound effect. Explosive impact. Action, cinematic.", "sound_fx", ("gunshot", "explosion", "impact", "sfx", "action")),
+    ("gm_helicopter", "Helicopter sound effect. Rotor blades, aviation. Cinematic, action.", "sound_fx", ("helicopter", "aviation", "sfx", "cinematic", "action")),
+    ("gm_seashore", "Seashore sound effect. Ocean waves, beach ambience. Relaxation, nature.", "sound_fx", ("seashore", "ocean", "waves", "beach", "sfx", "relaxation", "nature")),
+    ("gm_bird_tweet", "Bird tweet sound effect. Birdsong, nature. Morning, forest, peaceful.", "sound_fx", ("bird", "tweet", "nature", "sfx", "morning", "forest", "peaceful")),
+    ("gm_telephone_ring", "Telephone ring sound effect. Classic phone ring. Retro, communication.", "sound_fx", ("telephone", "ring", "phone", "sfx", "retro", "communication")),
+    ("gm_breath_noise", "Breath noise effect. Wind, breathing sound. Ambient, human, intimate.", "sound_fx", ("breath", "wind", "noise", "sfx", "ambient", "human")),
+)
+
+
+class GmCategory(IntEnum):
+    """GM table categories; values index _GM_DEFAULT_NOTES."""
+
+    KEYBOARDS = 0
+    CHROMATIC_PERCUSSION = 1
+    ORGAN = 2
+    GUITAR = 3
+    BASS = 4
+    STRINGS = 5
+    BRASS = 6
+    WOODWIND = 7
+    SYNTH_LEAD = 8
+    SYNTH_PAD = 9
+    SYNTH_FX = 10
+    ETHNIC = 11
+    PERCUSSION = 12
+    SOUND_FX = 13
+
+
+# Default example note pattern per GM category, indexed by GmCategory.
+# None means unpitched: the example plays the sound via s() alone.
+_GM_DEFAULT_NOTES = (
+    "c4 e4 g4",  # keyboards
+    "c4 e4 g4",  # chromatic_percussion
+    "c4 e4 g4",  # organ
+    "c4 e4 g4",  # guitar
+    "c2 e2 g2",  # bass
+    "c4 e4 g4",  # strings
+    "c5 e5 g5",  # brass
+    "c5 e5 g5",  # woodwind
+    "c5 e5 g5",  # synth_lead
+    "<[c3,e3,g3] [f3,a3,c4]>",  # synth_pad
+    "c4",  # synth_fx
+    "c4 e4 g4",  # ethnic
+    "c2 g2",  # percussion
+    None,  # sound_fx
+)
+
+# GM sounds whose example pattern differs from their category default.
+_GM_NOTE_OVERRIDES = {
+    "gm_celesta": "c5 e5 g5",
+    "gm_music_box": "c5 e5 g5",
+    "gm_xylophone": "c5 e5 g5",
+    "gm_glockenspiel": "c6 e6 g6",
+    "gm_church_organ": "c3 e3 g3",
+    "gm_guitar_harmonics": "c5 e5 g5",
+    "gm_violin": "c5 e5 g5",
+    "gm_cello": "c3 e3 g3",
+    "gm_contrabass": "c2 e2 g2",
+    "gm_string_ensemble_1": "<[c3,e3,g3] [f3,a3,c4]>",
+    "gm_string_ensemble_2": "<[c3,e3,g3] [f3,a3,c4]>",
+    "gm_synth_strings_1": "<[c3,e3,g3] [f3,a3,c4]>",
+    "gm_synth_strings_2": "<[c3,e3,g3] [f3,a3,c4]>",
+    "gm_trombone": "c3 e3 g3",
+    "gm_tuba": "c2 e2 g2",
+    "gm_french_horn": "c4 e4 g4",
+    "gm_brass_section": "<[c4,e4,g4] [d4,f4,a4]>",
+    "gm_synth_brass_1": "<[c4,e4,g4]>",
+    "gm_synth_brass_2": "<[c4,e4,g4]>",
+    "gm_piccolo": "c6 e6 g6",
+    "gm_clarinet": "c4 e4 g4",
+    "gm_english_horn": "c4 e4 g4",
+    "gm_bassoon": "c3 e3 g3",
+    "gm_alto_sax": "c4 e4 g4",
+    "gm_tenor_sax": "c4 e4 g4",
+    "gm_baritone_sax": "c3 e3 g3",
+    "gm_lead_8_bass_lead": "c4 e4 g4",
+    "gm_fx_3_crystal": "c5",
+    "gm_fx_4_atmosphere": "c3",
+    "gm_fx_6_goblins": "c3",
+    "gm_kalimba": "c5 e5 g5",
+    "gm_fiddle": "c5 e5 g5",
+    "gm_shanai": "c5 e5 g5",
+    "gm_orchestra_hit": "c4",
+    "gm_melodic_tom": "c3 e3 g3",
+    "gm_synth_drum": "c3",
+    "gm_taiko_drum": "c2",
+    "gm_woodblock": None,
+    "gm_steel_drums": "c5 e5 g5",
+}
+
+
+# ===========================================
+# DIRT SAMPLES (from tidalcycles/dirt-samples)
+# Complete list of ~200 sample banks
+# Row: (id, description, category, tags); example is s("<id>")
+# ===========================================
+
+DIRT_SAMPLES = (
+    # 808/909 drum machines
+    ("808", "Roland TR-808 drum machine. Classic hip-hop, electronic. Full kit - kicks, snares, hats, claps.", "drum_machine", ("808", "roland", "drum-machine", "hip-hop", "electronic", "classic")),
+    ("808bd", "TR-808 bass drum, kick. Deep, boomy, iconic hip-hop kick.", "drums", ("808", "kick", "bass-drum", "hip-hop", "deep", "boomy")),
+    ("808cy", "TR-808 cymbal. Metallic, splashy crash.", "drums", ("808", "cymbal", "crash", "metallic")),
+    ("808hc", "TR-808 high conga. Latin percussion, electronic.", "drums", ("808", "conga", "high", "latin", "percussion")),
+    ("808ht", "TR-808 high tom. Pitched tom sound.", "drums", ("808", "tom", "high", "pitched")),
+    ("808lc", "TR-808 low conga. Deep latin percussion.", "drums", ("808", "conga", "low", "latin", "deep")),
+    ("808lt", "TR-808 low tom. Deep pitched tom.", "drums", ("808", "tom", "low", "deep")),
+    ("808mc", "TR-808 mid conga. Medium latin percussion.", "drums", ("808", "conga", "mid", "latin")),
+    ("808mt", "TR-808 mid tom. Medium pitched tom.", "drums", ("808", "tom", "mid")),
+    ("808oh", "TR-808 open hi-hat. Sizzling, sustained hat.", "drums", ("808", "hi-hat", "open", "sizzle")),
+    ("808sd", "TR-808 snare drum. Crisp, snappy electronic snare.", "drums", ("808", "snare", "crisp", "electronic")),
+    ("909", "Roland TR-909 drum machine. House, techno essential. Punchy kicks, crisp hats.", "drum_machine", ("909", "roland", "drum-machine", "house", "techno", "punchy")),
+
+    # A samples
+    ("ab", "Abstract sounds. Experimental, textural, unusual.", "experimental", ("abstract", "experimental", "texture", "unusual")),
+    ("ade", "Ade sample pack. Electronic textures.", "electronic", ("ade", "electronic", "texture")),
+    ("ades2", "Ade sample pack 2. More electronic sounds.", "electronic", ("ade", "electronic", "variant")),
+    ("ades3", "Ade sample pack 3. Electronic continuation.", "electronic", ("ade", "electronic", "variant")),
+    ("ades4", "Ade sample pack 4. Electronic sounds.", "electronic", ("ade", "electronic", "variant")),
+    ("alex", "Alex sample collection. Various sounds.", "misc", ("alex", "collection", "various")),
+    ("alphabet", "Alphabet spoken letters. A to Z voice samples.", "vocal", ("alphabet", "letters", "voice", "speech", "educational")),
+    ("amencutup", "Amen break chopped. Classic breakbeat sliced. Jungle, drum and bass.", "breaks", ("amen", "breakbeat", "chopped", "jungle", "dnb", "classic")),
+    ("armora", "Armora sounds. Metallic, armored textures.", "experimental", ("armora", "metallic", "texture")),
+    ("arp", "Arpeggio sounds. Sequenced melodic patterns.", "melodic", ("arpeggio", "sequence", "melodic", "pattern")),
+    ("arpy", "Arpy synth. Short plucky synth for arpeggios. Electronic, chiptune-ish.", "melodic", ("arpeggio", "synth", "plucky", "electronic")),
+    ("auto", "Auto sounds. Automotive, mechanical.", "sfx", ("auto", "car", "mechanical", "engine")),
+
+    # B samples
+    ("baa", "Baa sheep sound. Animal bleat.", "sfx", ("sheep", "animal", "bleat", "farm")),
+    ("baa2", "Baa sheep variant. Different sheep sounds.", "sfx", ("sheep", "animal", "bleat", "variant")),
+    ("bass", "Bass samples. General bass sounds. Low frequency foundation.", "bass", ("bass", "low", "foundation")),
+    ("bass0", "Bass variant 0. Alternative bass character.", "bass", ("bass", "variant", "low")),
+    ("bass1", "Bass variant 1. Different bass timbre.", "bass", ("bass", "variant", "low")),
+    ("bass2", "Bass variant 2. Another bass flavor.", "bass", ("bass", "variant", "low")),
+    ("bass3", "Bass variant 3. Extended bass options.", "bass", ("bass", "variant", "low")),
+    ("bassdm", "Bass drum samples. Kick drums, low percussion.", "drums", ("bass", "drum", "kick", "low")),
+    ("bassfoo", "Bass foo experimental. Unusual bass sounds.", "bass", ("bass", "experimental", "unusual")),
+    ("battles", "Battle sounds. Combat, action, warfare.", "sfx", ("battle", "combat", "action", "warfare")),
+    ("bd", "Bass drum, kick drum. Electronic and acoustic kicks. Foundation of rhythm.", "drums", ("kick", "bass-drum", "drums", "rhythm", "foundation")),
+    ("bend", "Bend sounds. Pitch bending, gliding tones.", "melodic", ("bend", "pitch", "glide", "tone")),
+    ("bev", "Bev sample collection. Various sounds.", "misc", ("bev", "collection", "various")),
+    ("bin", "Binary sounds. Digital, computer-like.", "electronic", ("binary", "digital", "computer", "data")),
+    ("birds", "Bird sounds. Birdsong, nature, chirping.", "sfx", ("birds", "nature", "chirp", "wildlife")),
+    ("birds3", "Birds variant 3. More bird sounds.", "sfx", ("birds", "nature", "chirp", "variant")),
+    ("bleep", "Bleep sounds. Electronic beeps, UI sounds.", "electronic", ("bleep", "beep", "electronic", "ui")),
+    ("blip", "Blip sounds. Short electronic beep. Glitch, UI, accent.", "electronic", ("blip", "beep", "electronic", "glitch", "ui")),
+    ("blue", "Blue sample collection. Various sounds.", "misc", ("blue", "collection", "various")),
+    ("bottle", "Bottle sounds. Glass, blown bottle, percussion.", "percussion", ("bottle", "glass", "blown", "percussion")),
+    ("breaks125", "Breakbeat loops at 125 BPM. House tempo breaks.", "breaks", ("breakbeat", "125bpm", "house", "loop")),
+    ("breaks152", "Breakbeat loops at 152 BPM. DnB tempo breaks.", "breaks", ("breakbeat", "152bpm", "dnb", "loop")),
+    ("breaks157", "Breakbeat loops at 157 BPM. Fast breaks.", "breaks", ("breakbeat", "157bpm", "fast", "loop")),
+    ("breaks165", "Breakbeat loops at 165 BPM. Jungle tempo.", "breaks", ("breakbeat", "165bpm", "jungle", "loop")),
+    ("breath", "Breath sounds. Human breathing, wind.", "sfx", ("breath", "human", "wind", "air")),
+    ("bubble", "Bubble sounds. Water bubbles, underwater.", "sfx", ("bubble", "water", "underwater", "liquid")),
+
+    # C samples
+    ("can", "Can sounds. Metal can, percussion.", "percussion", ("can", "metal", "percussion", "found-sound")),
+    ("casio", "Casio keyboard. Lo-fi keys, toy keyboard character. Nostalgic, lo-fi.", "melodic", ("casio", "keyboard", "lo-fi", "toy", "nostalgic")),
+    ("cb", "Cowbell. Metallic percussion. Funk, latin, electronic classic.", "drums", ("cowbell", "percussion", "metallic", "funk", "latin")),
+    ("cc", "CC samples. Various control sounds.", "misc", ("cc", "control", "various")),
+    ("chin", "China cymbal or chin sounds. Trashy cymbal.", "drums", ("china", "cymbal", "trashy", "crash")),
+    ("circus", "Circus sounds. Carnival, whimsical, fun.", "sfx", ("circus", "carnival", "whimsical", "fun")),
+    ("clak", "Clak percussion. Click, clack sounds.", "percussion", ("clak", "click", "clack", "percussion")),
+    ("click", "Click sounds. Digital clicks, percussion.", "percussion", ("click", "digital", "percussion", "ui")),
+    ("clubkick", "Club kick drums. Big room, EDM kicks.", "drums", ("kick", "club", "edm", "big-room")),
+    ("co", "Co sample collection. Various sounds.", "misc", ("co", "collection", "various")),
+    ("coins", "Coin sounds. Money, jingling, arcade.", "sfx", ("coins", "money", "jingle", "arcade")),
+    ("control", "Control sounds. Buttons, switches, UI.", "sfx", ("control", "button", "switch", "ui")),
+    ("cosmicg", "Cosmic G sounds. Space, sci-fi textures.", "electronic", ("cosmic", "space", "sci-fi", "texture")),
+    ("cp", "Clap, hand clap. Snappy, layered clap sound. Electronic music staple.", "drums", ("clap", "handclap", "drums", "snappy")),
+    ("cr", "Crash cymbal. Explosive cymbal hit. Accents, transitions.", "drums", ("crash", "cymbal", "drums", "accent", "transition")),
+    ("crow", "Crow sounds. Bird caw, nature.", "sfx", ("crow", "bird", "caw", "nature")),
+
+    # D samples
+    ("d", "D sample collection. Various drum sounds.", "drums", ("d", "drums", "collection")),
+    ("db", "DB samples. Database or deep bass.", "bass", ("db", "deep", "bass")),
+    ("diphone", "Diphone speech synthesis. Robotic voice.", "vocal", ("diphone", "speech", "synthesis", "robotic")),
+    ("diphone2", "Diphone variant 2. More speech synthesis.", "vocal", ("diphone", "speech", "synthesis", "variant")),
+    ("dist", "Distorted sounds. Heavy distortion, aggressive.", "electronic", ("distortion", "heavy", "aggressive", "noise")),
+    ("dork2", "Dork sounds 2. Quirky, unusual.", "experimental", ("dork", "quirky", "unusual", "fun")),
+    ("dorkbot", "Dorkbot sounds. Electronic, robotic.", "electronic", ("dorkbot", "electronic", "robotic")),
+    ("dr", "DR drum samples. Various drums.", "drums", ("dr", "drums", "various")),
+    ("dr2", "DR drums variant 2.", "drums", ("dr", "drums", "variant")),
+    ("dr55", "DR-55 drum machine. Boss Doctor Rhythm.", "drum_machine", ("dr55", "boss", "drum-machine", "vintage")),
+    ("dr_few", "DR few selected drums.", "drums", ("dr", "drums", "selected")),
+    ("drum", "General drum samples. Various drum hits.", "drums", ("drum", "hits", "various")),
+    ("drumtraks", "Sequential DrumTraks samples. Vintage drum machine.", "drum_machine", ("drumtraks", "sequential", "drum-machine", "vintage")),
+
+    # E samples
+    ("e", "E sample collection. Electronic sounds.", "electronic", ("e", "electronic", "collection")),
+    ("east", "East sounds. Eastern, Asian influenced.", "world", ("east", "asian", "eastern", "world")),
+    ("electro1", "Electro sounds 1. Electronic, 80s electro.", "electronic", ("electro", "80s", "electronic", "breakdance")),
+    ("em2", "EM2 samples. Electronic music.", "electronic", ("em2", "electronic", "music")),
+    ("erk", "Erk sounds. Unusual, experimental.", "experimental", ("erk", "unusual", "experimental")),
+
+    # F samples
+    ("f", "F sample collection. Various sounds.", "misc", ("f", "collection", "various")),
+    ("feel", "Feel samples. Textural, emotional.", "experimental", ("feel", "texture", "emotional")),
+    ("feelfx", "Feel effects. Atmospheric, textural FX.", "sfx", ("feel", "fx", "atmospheric", "texture")),
+    ("fest", "Festival sounds. Crowd, celebration.", "sfx", ("festival", "crowd", "celebration")),
+    ("fire", "Fire sounds. Flames, crackling.", "sfx", ("fire", "flames", "crackling", "nature")),
+    ("flick", "Flick sounds. Quick, snappy.", "percussion", ("flick", "quick", "snappy")),
+    ("fm", "FM synthesis sounds. Digital, bell-like, metallic.", "melodic", ("fm", "synthesis", "digital", "bell", "metallic")),
+    ("foo", "Foo samples. Various experimental sounds.", "experimental", ("foo", "experimental", "various")),
+    ("future", "Future sounds. Futuristic, sci-fi.", "electronic", ("future", "futuristic", "sci-fi")),
+
+    # G samples
+    ("gab", "Gabber sounds. Hardcore, distorted.", "electronic", ("gabber", "hardcore", "distorted", "fast")),
+    ("gabba", "Gabba kicks. Hardcore techno kicks.", "drums", ("gabba", "hardcore", "kick", "distorted")),
+    ("gabbaloud", "Gabba loud. Louder hardcore kicks.", "drums", ("gabba", "hardcore", "loud", "kick")),
+    ("gabbalouder", "Gabba even louder. Maximum hardcore.", "drums", ("gabba", "hardcore", "loudest", "extreme")),
+    ("glasstap", "Glass tap sounds. Delicate, percussive.", "percussion", ("glass", "tap", "delicate", "percussion")),
+    ("glitch", "Glitch sounds. Digital artifacts, errors. Experimental, IDM.", "electronic", ("glitch", "digital", "error", "idm", "experimental")),
+    ("glitch2", "Glitch variant 2. More digital artifacts.", "electronic", ("glitch", "digital", "variant")),
+    ("gretsch", "Gretsch drum kit. Acoustic drum samples.", "drums", ("gretsch", "acoustic", "drum-kit")),
+    ("gtr", "Electric guitar samples. Short stabs, limited. Guitar character.", "guitar", ("guitar", "electric", "stabs")),
+
+    # H samples
+    ("h", "H sample collection. Various sounds.", "misc", ("h", "collection", "various")),
+    ("hand", "Hand sounds. Claps, snaps, body percussion.", "percussion", ("hand", "clap", "snap", "body-percussion")),
+    ("hardcore", "Hardcore sounds. Intense, aggressive.", "electronic", ("hardcore", "intense", "aggressive")),
+    ("hardkick", "Hard kick drums. Punchy, powerful kicks.", "drums", ("kick", "hard", "punchy", "powerful")),
+    ("haw", "Haw sounds. Various samples.", "misc", ("haw", "various")),
+    ("hc", "Hardcore sounds or high conga.", "drums", ("hc", "hardcore", "conga")),
+    ("hh", "Hi-hat, closed hi-hat. Tight, crisp high-frequency rhythm.", "drums", ("hi-hat", "hihat", "drums", "crisp")),
+    ("hh27", "Hi-hat collection 27. Multiple hi-hat sounds.", "drums", ("hi-hat", "collection", "variety")),
+    ("hit", "Hit sounds. Impact, stabs.", "sfx", ("hit", "impact", "stab")),
+    ("hmm", "Hmm vocal sounds. Thinking, contemplation.", "vocal", ("hmm", "vocal", "thinking")),
+    ("ho", "Ho sounds. Vocal exclamations.", "vocal", ("ho", "vocal", "exclamation")),
+    ("hoover", "Hoover bass. Classic rave sound, mentasm.", "bass", ("hoover", "rave", "mentasm", "bass")),
+    ("house", "House music samples. 4/4 beats, grooves.", "electronic", ("house", "4/4", "groove", "electronic")),
+    ("ht", "High tom drum. High pitched tom. Fills, rolls.", "drums", ("tom", "high", "fills")),
+
+    # I samples
+    ("if", "IF samples. Conditional, experimental.", "experimental", ("if", "experimental")),
+    ("ifdrums", "IF drums. Experimental drum sounds.", "drums", ("if", "drums", "experimental")),
+    ("incoming", "Incoming sounds. Approaching, building.", "sfx", ("incoming", "approach", "build")),
+    ("industrial", "Industrial sounds. Factory, mechanical, harsh.", "electronic", ("industrial", "factory", "mechanical", "harsh")),
+    ("insect", "Insect sounds. Bugs, buzzing, nature.", "sfx", ("insect", "bugs", "buzzing", "nature")),
+    ("invaders", "Space invaders sounds. Retro arcade, 8-bit.", "electronic", ("invaders", "arcade", "8-bit", "retro", "game")),
+
+    # J samples
+    ("jazz", "Jazz samples. Jazz drum kit, brushes.", "drums", ("jazz", "brushes", "acoustic", "swing")),
+    ("jungbass", "Jungle bass. Sub-heavy bass for drum and bass, jungle. Deep, rolling.", "bass", ("jungle", "bass", "dnb", "sub", "deep")),
+    ("jungle", "Jungle samples. Breakbeat, DnB drums.", "breaks", ("jungle", "breakbeat", "dnb", "drums")),
+    ("juno", "Juno synth. Roland Juno character. Warm, analog, classic.", "melodic", ("juno", "roland", "synth", "analog", "warm")),
+    ("jvbass", "JV bass. Roland JV synth bass. Punchy, electronic.", "bass", ("jv", "roland", "bass", "synth", "punchy")),
+
+    # K samples
+    ("kicklinn", "Linn kick drums. LinnDrum kicks.", "drums", ("linn", "kick", "drum-machine", "80s")),
+    ("koy", "Koy samples. Various sounds.", "misc", ("koy", "various")),
+    ("kurt", "Kurt samples. Various sounds.", "misc", ("kurt", "various")),
+
+    # L samples
+    ("latibro", "Latin brother samples. Latin percussion.", "percussion", ("latin", "percussion", "brother")),
+    ("led", "LED sounds. Electronic, digital.", "electronic", ("led", "electronic", "digital")),
+    ("less", "Less samples. Minimal sounds.", "minimal", ("less", "minimal")),
+    ("lighter", "Lighter sounds. Click, flame.", "sfx", ("lighter", "click", "flame")),
+    ("linnhats", "LinnDrum hi-hats. Classic 80s hats.", "drums", ("linn", "hi-hat", "80s", "drum-machine")),
+    ("lt", "Low tom drum. Deep tom hit. Fills, tribal, floor tom.", "drums", ("tom", "low", "deep", "tribal")),
+
+    # M samples
+    ("made", "Made samples. Various processed sounds.", "misc", ("made", "processed", "various")),
+    ("made2", "Made samples variant 2.", "misc", ("made", "variant")),
+    ("mash", "Mash samples. Mashup, mixed sounds.", "electronic", ("mash", "mashup", "mixed")),
+    ("mash2", "Mash samples variant 2.", "electronic", ("mash", "variant")),
+    ("metal", "Metal sounds. Heavy, metallic, industrial.", "electronic", ("metal", "heavy", "metallic", "industrial")),
+    ("miniyeah", "Mini yeah vocal. Short vocal sample.", "vocal", ("yeah", "vocal", "short")),
+    ("monsterb", "Monster bass. Heavy, aggressive bass.", "bass", ("monster", "bass", "heavy", "aggressive")),
+    ("moog", "Moog synth. Moog synthesizer sounds. Fat, analog, bass-capable.", "melodic", ("moog", "synth", "analog", "fat")),
+    ("mouth", "Mouth sounds. Human mouth percussion. Beatbox-like.", "vocal", ("mouth", "beatbox", "percussion", "human")),
+    ("mp3", "MP3 artifacts. Compressed audio sounds.", "electronic", ("mp3", "compressed", "artifact", "digital")),
+    ("msg", "Message sounds. Communication, notification.", "sfx", ("message", "notification", "communication")),
+    ("mt", "Mid tom drum. Medium pitched tom. Fills.", "drums", ("tom", "mid", "fills")),
+    ("mute", "Muted sounds. Dampened, quiet.", "misc", ("mute", "dampened", "quiet")),
+
+    # N samples
+    ("newnotes", "New notes. Fresh melodic content.", "melodic", ("notes", "melodic", "new")),
+    ("noise", "Noise samples. White noise, static. Texture, fills, risers.", "electronic", ("noise", "white-noise", "static", "texture")),
+    ("noise2", "Noise variant 2. More noise textures.", "electronic", ("noise", "variant", "texture")),
+    ("notes", "Notes samples. Melodic sounds.", "melodic", ("notes", "melodic")),
+    ("num", "Number sounds. Numeric, counting audio.", "vocal", ("num", "number", "count", "digits")),
+    ("numbers", "Number spoken samples. Count, digits.", "vocal", ("numbers", "count", "digits", "speech")),
+
+    # O samples
+    ("oc", "OC samples. Various sounds.", "misc", ("oc", "various")),
+    ("odx", "ODX samples. Electronic sounds.", "electronic", ("odx", "electronic")),
+    ("off", "Off sounds. Switch off, ending.", "sfx", ("off", "switch", "ending")),
+    ("outdoor", "Outdoor sounds. Nature, ambient.", "sfx", ("outdoor", "nature", "ambient")),
+
+    # P samples
+    ("pad", "Synth pad. Sustained atmospheric sound. Chords, ambient, background.", "pads", ("pad", "synth", "ambient", "atmospheric")),
+    ("padlong", "Long pad. Extended sustain pad. Drones, ambient, evolving.", "pads", ("pad", "long", "drone", "ambient")),
+    ("pebbles", "Pebble sounds. Stones, gravel.", "sfx", ("pebbles", "stones", "gravel")),
+    ("perc", "General percussion. Various percussion hits. Fills, accents.", "percussion", ("percussion", "hits", "fills")),
+    ("peri", "Peri samples. Peripheral sounds.", "misc", ("peri", "peripheral")),
+    ("pluck", "Plucked string. Generic pluck sound. Melodic, pizzicato-like.", "melodic", ("pluck", "string", "melodic")),
+    ("popkick", "Pop kick drums. Modern pop kicks.", "drums", ("kick", "pop", "modern")),
+    ("print", "Print sounds. Printer, mechanical.", "sfx", ("print", "printer", "mechanical")),
+    ("proc", "Processed sounds. Manipulated audio.", "electronic", ("processed", "manipulated")),
+    ("procshort", "Short processed sounds.", "electronic", ("processed", "short")),
+    ("psr", "PSR keyboard sounds. Yamaha PSR.", "melodic", ("psr", "yamaha", "keyboard")),
+
+    # R samples
+    ("rave", "Rave sounds. 90s rave, stabs, hits.", "electronic", ("rave", "90s", "stabs", "rave-culture")),
+    ("rave2", "Rave sounds variant 2. More rave content.", "electronic", ("rave", "variant")),
+    ("ravemono", "Rave mono sounds. Monophonic rave.", "electronic", ("rave", "mono")),
+    ("realclaps", "Real claps. Acoustic hand claps.", "drums", ("clap", "real", "acoustic")),
+    ("reverbkick", "Reverb kick. Kicks with reverb tail.", "drums", ("kick", "reverb", "tail")),
+    ("rm", "RM samples. Ring modulation sounds.", "electronic", ("rm", "ring-modulation")),
+    ("rs", "Rimshot samples. Sharp rim hits.", "drums", ("rimshot", "rim", "sharp")),
+
+    # S samples
+    ("sax", "Saxophone samples. Jazz, R&B sax.", "melodic", ("saxophone", "sax", "jazz", "r&b")),
+    ("sd", "Snare drum. Sharp, cracking backbeat. Essential drum sound.", "drums", ("snare", "drums", "backbeat")),
+    ("seawolf", "Sea wolf sounds. Ocean, nautical.", "sfx", ("sea", "wolf", "ocean", "nautical")),
+    ("sequential", "Sequential sounds. Ordered, sequenced.", "electronic", ("sequential", "ordered", "sequence")),
+    ("sf", "SF sounds. Science fiction.", "sfx", ("sf", "sci-fi", "science-fiction")),
+    ("sheffield", "Sheffield sounds. UK electronic.", "electronic", ("sheffield", "uk", "electronic")),
+    ("short", "Short sounds. Brief, staccato.", "misc", ("short", "brief", "staccato")),
+    ("sid", "SID chip sounds. C64, 8-bit.", "electronic", ("sid", "c64", "8-bit", "chiptune")),
+    ("simplesine", "Simple sine wave. Pure, clean sine tone. Fundamental, sub bass, test tone.", "melodic", ("sine", "simple", "pure", "test-tone", "sub")),
+    ("sine", "Sine wave samples. Pure tone.", "melodic", ("sine", "pure", "tone")),
+    ("sitar", "Sitar samples. Indian string instrument. World, psychedelic.", "world", ("sitar", "indian", "world")),
+    ("sn", "Snare drum alternate. Different snare character.", "drums", ("snare", "alternate")),
+    ("space", "Space sounds. Cosmic, sci-fi.", "sfx", ("space", "cosmic", "sci-fi")),
+    ("speakspell", "Speak and spell sounds. Retro toy.", "vocal", ("speak-spell", "retro", "toy")),
+    ("speech", "Speech samples. Spoken word.", "vocal", ("speech", "spoken", "word")),
+    ("speechless", "Speechless sounds. Non-verbal.", "vocal", ("speechless", "non-verbal")),
+    ("speedupdown", "Speed up/down sounds. Tempo effects.", "sfx", ("speed", "tempo", "effect")),
+    ("stab", "Synth stab. Short chord hit. House, disco, rhythmic chords.", "melodic", ("stab", "chord", "house")),
+    ("stomp", "Stomp sounds. Foot stomps, body percussion.", "percussion", ("stomp", "foot", "body-percussion")),
+    ("subroc3d", "Sub Roc 3D game sounds. Retro arcade.", "electronic", ("subroc", "arcade", "retro", "game")),
+    ("sugar", "Sugar samples. Sweet, pleasant sounds.", "misc", ("sugar", "sweet", "pleasant")),
+    ("sundance", "Sundance samples. Festival, outdoor.", "misc", ("sundance", "festival")),
+
+    # T samples
+    ("tabla", "Tabla drums. Indian classical percussion. Intricate, melodic drums.", "world", ("tabla", "indian", "percussion")),
+    ("tabla2", "Tabla drums variant. More tabla sounds.", "world", ("tabla", "indian", "variant")),
+    ("tablex", "Tabla extended. More tabla samples.", "world", ("tabla", "extended")),
+    ("tacscan", "Tac Scan game sounds. Retro arcade.", "electronic", ("tacscan", "arcade", "retro")),
+    ("tech", "Tech sounds. Technical, electronic.", "electronic", ("tech", "technical", "electronic")),
+    ("techno", "Techno samples. Techno drums, sounds.", "electronic", ("techno", "drums", "electronic")),
+    ("tink", "Tink sounds. Small metallic hits.", "percussion", ("tink", "metallic", "small")),
+    ("tok", "Tok sounds. Click, tock.", "percussion", ("tok", "click", "tock")),
+    ("toys", "Toy sounds. Playful, childlike.", "sfx", ("toys", "playful", "childlike")),
+    ("trump", "Trump sounds. Trumpet-like.", "melodic", ("trump", "trumpet-like")),
+
+    # U samples
+    ("ul", "UL samples. Various sounds.", "misc", ("ul", "various")),
+    ("ulgab", "UL gabber sounds. Hardcore.", "electronic", ("ul", "gabber", "hardcore")),
+    ("uxay", "Uxay samples. Experimental.", "experimental", ("uxay", "experimental")),
+
+    # V samples
+    ("v", "V sample collection. Various sounds.", "misc", ("v", "collection")),
+    ("voodoo", "Voodoo sounds. Dark, mystical.", "sfx", ("voodoo", "dark", "mystical")),
+
+    # W samples
+    ("wind", "Wind sounds. Atmospheric, nature.", "sfx", ("wind", "atmospheric", "nature")),
+    ("wobble", "Wobble bass. Dubstep wobble sound.", "bass", ("wobble", "dubstep", "bass")),
+    ("world", "World music samples. Global, ethnic.", "world", ("world", "global", "ethnic")),
+
+    # X samples
+    ("xmas", "Christmas sounds. Holiday, festive.", "sfx", ("christmas", "holiday", "festive")),
+
+    # Y samples
+    ("yeah", "Yeah vocal samples. Exclamation, hype.", "vocal", ("yeah", "vocal", "exclamation", "hype")),
+)
+
+
+# ===========================================
+# BUILT-IN SYNTHS (always available)
+# Row: (id, description, category, tags, notes)
+# ===========================================
+
+BUILTIN_SYNTHS = (
+    ("sine", "Sine wave oscillator. Pure, smooth, fundamental tone. Sub bass, pure tones, gentle.", "oscillator", ("sine", "oscillator", "pure", "smooth", "sub", "gentle", "fundamental"), "c4 e4 g4"),
+    ("saw", "Sawtooth wave oscillator. Bright, buzzy, rich harmonics. Classic synth lead, bass.", "oscillator", ("sawtooth", "saw", "oscillator", "bright", "buzzy", "harmonics", "lead"), "c4 e4 g4"),
+    ("sawtooth", "Sawtooth wave oscillator. Alias for saw. Bright, buzzy, rich in harmonics.", "oscillator", ("sawtooth", "saw", "oscillator", "bright", "buzzy", "harmonics"), "c4 e4 g4"),
+    ("square", "Square wave oscillator. Hollow, woody, retro. Chiptune, 8-bit, video game.", "oscillator", ("square", "oscillator", "hollow", "woody", "retro", "chiptune", "8-bit"), "c4 e4 g4"),
+    ("triangle", "Triangle wave oscillator. Soft, mellow, between sine and square. Gentle leads.", "oscillator", ("triangle", "oscillator", "soft", "mellow", "gentle"), "c4 e4 g4"),
+    ("tri", "Triangle wave oscillator. Alias for triangle. Soft, mellow tone.", "oscillator", ("triangle", "tri", "oscillator", "soft", "mellow"), "c4 e4 g4"),
+)
+
+
+# ===========================================
+# TIDAL DRUM MACHINES (72 machines)
+# Use with .bank() function in Strudel
+# Row: (name, description, tags); id/example/kit suffix derived
+# ===========================================
+
+DRUM_MACHINES = (
+    # A
+    ("AJKPercusyn", "AJK Percusyn drum synth. Analog percussion synthesizer. Unique electronic drums.", ("percusyn", "analog", "synth-drums", "electronic")),
+    ("AkaiLinn", "Akai Linn MPC hybrid. Combines Akai sampling with Linn character. Hip-hop, R&B.", ("akai", "linn", "mpc", "hip-hop", "r&b", "sampling")),
+    ("AkaiMPC60", "Akai MPC60 drum machine. Classic hip-hop sampler. Boom bap, golden era.", ("akai", "mpc60", "hip-hop", "boom-bap", "sampler", "classic")),
+    ("AkaiXR10", "Akai XR10 drum machine. 90s Akai drums. Punchy electronic kit.", ("akai", "xr10", "90s", "electronic", "punchy")),
+    ("AlesisHR16", "Alesis HR-16 drum machine. 80s/90s digital drums. Clean, punchy hits.", ("alesis", "hr16", "digital", "80s", "90s", "punchy")),
+    ("AlesisSR16", "Alesis SR-16 drum machine. Popular 90s drums. Versatile, studio standard.", ("alesis", "sr16", "90s", "studio", "versatile")),
+
+    # B
+    ("BossDR110", "Boss DR-110 Dr. Rhythm. Compact analog drums. Lo-fi, characterful.", ("boss", "dr110", "analog", "lo-fi", "compact")),
+    ("BossDR220", "Boss DR-220 Dr. Rhythm. 80s digital drums. Clean, versatile.", ("boss", "dr220", "digital", "80s", "clean")),
+    ("BossDR55", "Boss DR-55 Dr. Rhythm. Early analog drum machine. Simple, punchy, classic.", ("boss", "dr55", "analog", "classic", "simple")),
+    ("BossDR550", "Boss DR-550 Dr. Rhythm. 90s digital drums. Wide sound selection.", ("boss", "dr550", "digital", "90s", "versatile")),
+    ("BossDR660", "Boss DR-660 Dr. Rhythm. Advanced 90s drums. High-quality samples.", ("boss", "dr660", "digital", "90s", "high-quality")),
+
+    # C
+    ("CasioRZ1", "Casio RZ-1 sampling drum machine. 80s sampler with built-in sounds. Quirky, nostalgic.", ("casio", "rz1", "sampler", "80s", "quirky")),
+    ("CasioSK1", "Casio SK-1 sampling keyboard drums. Lo-fi, toy-like. Charming, nostalgic.", ("casio", "sk1", "lo-fi", "toy", "nostalgic")),
+    ("CasioVL1", "Casio VL-1 VL-Tone drums. Iconic toy calculator synth drums. 8-bit, retro.", ("casio", "vl1", "toy", "8-bit", "retro", "calculator")),
+
+    # D
+    ("DoepferMS404", "Doepfer MS-404 modular drums. Analog modular synth drums. Experimental, raw.", ("doepfer", "ms404", "modular", "analog", "experimental")),
+
+    # E
+    ("EmuDrumulator", "E-mu Drumulator. Classic 80s digital drums. Electro, hip-hop essential.", ("emu", "drumulator", "80s", "electro", "hip-hop", "digital")),
+    ("EmuModular", "E-mu Modular drum sounds. Modular synth drums. Experimental, unique.", ("emu", "modular", "synth", "experimental", "unique")),
+    ("EmuSP12", "E-mu SP-12 sampler drums. Hip-hop classic. Boom bap, punchy, gritty.", ("emu", "sp12", "hip-hop", "boom-bap", "punchy", "sampler")),
+
+    # K
+    ("KorgDDM110", "Korg DDM-110 Super Drums. 80s digital drums. Punchy, characterful.", ("korg", "ddm110", "digital", "80s", "punchy")),
+    ("KorgKPR77", "Korg KPR-77 drum machine. Analog drums, 80s character. Warm, punchy.", ("korg", "kpr77", "analog", "80s", "warm")),
+    ("KorgKR55", "Korg KR-55 analog drums. Vintage rhythm machine. Warm, organic feel.", ("korg", "kr55", "analog", "vintage", "warm")),
+    ("KorgKRZ", "Korg KRZ drum sounds. Korg rhythm sounds. Versatile, clean.", ("korg", "krz", "rhythm", "versatile")),
+    ("KorgM1", "Korg M1 drum sounds. Iconic 80s workstation drums. Pop, dance, studio.", ("korg", "m1", "workstation", "80s", "pop", "dance")),
+    ("KorgMinipops", "Korg Minipops rhythm machine. Vintage analog drums. Organ-combo style, retro.", ("korg", "minipops", "analog", "vintage", "retro")),
+    ("KorgPoly800", "Korg Poly-800 drums. 80s polysynth drums. Digital, characterful.", ("korg", "poly800", "80s", "digital", "synth")),
+    ("KorgT3", "Korg T3 workstation drums. 90s workstation sounds. Clean, professional.", ("korg", "t3", "workstation", "90s", "professional")),
+
+    # L
+    ("Linn9000", "Linn 9000 drum machine. Advanced Linn drums. Sampling, sequencing, 80s.", ("linn", "9000", "80s", "sampling", "sequencing")),
+    ("LinnDrum", "LinnDrum classic. Iconic 80s digital drums. Pop, rock, hip-hop essential.", ("linndrum", "linn", "80s", "pop", "rock", "iconic")),
+    ("LinnLM1", "Linn LM-1 first Linn drum machine. Revolutionary digital drums. Prince, 80s pop.", ("linn", "lm1", "80s", "pop", "revolutionary", "prince")),
+    ("LinnLM2", "Linn LM-2 drum machine. Refined LM-1. 80s pop, rock drums.", ("linn", "lm2", "80s", "pop", "rock")),
+
+    # M
+    ("MFB512", "MFB-512 analog drum machine. German analog drums. Punchy, raw, electronic.", ("mfb", "512", "analog", "german", "electronic", "raw")),
+    ("MPC1000", "Akai MPC1000 drums. 2000s MPC. Hip-hop, modern production.", ("akai", "mpc1000", "2000s", "hip-hop", "modern")),
+    ("MoogConcertMateMG1", "Moog Concertmate MG-1 drums. Moog analog synth drums. Warm, characterful.", ("moog", "concertmate", "mg1", "analog", "warm")),
+
+    # O
+    ("OberheimDMX", "Oberheim DMX drum machine. 80s classic. Electro, hip-hop, new wave.", ("oberheim", "dmx", "80s", "electro", "hip-hop", "new-wave")),
+
+    # R
+    ("RhodesPolaris", "Rhodes Polaris drums. Rhodes synth drum sounds. Warm, analog character.", ("rhodes", "polaris", "synth", "analog", "warm")),
+    ("RhythmAce", "Ace Tone Rhythm Ace. Vintage organ rhythm box. 60s/70s, retro, warm.", ("ace-tone", "rhythm-ace", "vintage", "60s", "70s", "organ")),
+    ("RolandCompurhythm1000", "Roland CR-1000 Compurhythm. Advanced preset drums. Clean, versatile.", ("roland", "cr1000", "compurhythm", "preset", "clean")),
+    ("RolandCompurhythm78", "Roland CR-78 Compurhythm. First programmable drum machine. Vintage, iconic.", ("roland", "cr78", "compurhythm", "vintage", "iconic", "programmable")),
+    ("RolandCompurhythm8000", "Roland CR-8000 Compurhythm. Analog preset drums. Warm, classic.", ("roland", "cr8000", "compurhythm", "analog", "warm")),
+    ("RolandD110", "Roland D-110 drum sounds. LA synthesis drums. 80s digital, clean.", ("roland", "d110", "la-synthesis", "80s", "digital")),
+    ("RolandD70", "Roland D-70 drums. 90s workstation drums. Versatile, professional.", ("roland", "d70", "workstation", "90s", "professional")),
+    ("RolandDDR30", "Roland DDR-30 drum machine. Digital drums. Clean, punchy.", ("roland", "ddr30", "digital", "punchy")),
+    ("RolandJD990", "Roland JD-990 drums. High-end 90s synth drums. Lush, professional.", ("roland", "jd990", "90s", "synth", "professional")),
+    ("RolandMC202", "Roland MC-202 drums. Micro Composer drums. Analog, TB-303 era.", ("roland", "mc202", "analog", "micro-composer")),
+    ("RolandMC303", "Roland MC-303 Groovebox drums. 90s dance machine. House, techno.", ("roland", "mc303", "groovebox", "90s", "house", "techno")),
+    ("RolandMT32", "Roland MT-32 drums. LA synthesis module drums. 80s game soundtracks.", ("roland", "mt32", "la-synthesis", "80s", "game")),
+    ("RolandR8", "Roland R-8 Human Rhythm Composer. High-end 80s drums. Realistic, versatile.", ("roland", "r8", "80s", "realistic", "human-rhythm")),
+    ("RolandS50", "Roland S-50 sampler drums. 80s sampler. Warm, vintage digital.", ("roland", "s50", "sampler", "80s", "warm")),
+    ("RolandSH09", "Roland SH-09 synth drums. Analog monosynth drums. Raw, punchy.", ("roland", "sh09", "analog", "monosynth", "raw")),
+    ("RolandSystem100", "Roland System-100 modular drums. Semi-modular analog. Raw, experimental.", ("roland", "system100", "modular", "analog", "experimental")),
+    ("RolandTR505", "Roland TR-505 drum machine. Digital successor to 606. Clean, usable.", ("roland", "tr505", "digital", "clean")),
+    ("RolandTR606", "Roland TR-606 Drumatix. Analog companion to TB-303. Acid house essential.", ("roland", "tr606", "analog", "acid", "house", "drumatix")),
+    ("RolandTR626", "Roland TR-626 Rhythm Composer. Digital drums. Latin sounds, 80s.", ("roland", "tr626", "digital", "latin", "80s")),
+    ("RolandTR707", "Roland TR-707 drum machine. Digital, clean 80s drums. Pop, dance.", ("roland", "tr707", "digital", "80s", "pop", "dance")),
+    ("RolandTR727", "Roland TR-727 Latin percussion. Latin version of 707. Congas, bongos, timbales.", ("roland", "tr727", "latin", "percussion", "congas", "bongos")),
+    ("RolandTR808", "Roland TR-808 Rhythm Composer. THE iconic drum machine. Hip-hop, electronic essential.", ("roland", "tr808", "808", "hip-hop", "electronic", "iconic", "classic")),
+    ("RolandTR909", "Roland TR-909 Rhythm Composer. House and techno essential. Punchy, powerful.", ("roland", "tr909", "909", "house", "techno", "essential", "punchy")),
+
+    # S
+    ("SakataDPM48", "Sakata DPM-48 drums. Rare Japanese drums. Unique, characterful.", ("sakata", "dpm48", "japanese", "rare", "unique")),
+    ("SequentialCircuitsDrumtracks", "Sequential Circuits Drumtracks. 80s digital drums. Clean, usable.", ("sequential", "drumtracks", "80s", "digital", "clean")),
+    ("SequentialCircuitsTom", "Sequential Circuits TOM. Analog drum synth. Tunable, unique.", ("sequential", "tom", "analog", "drum-synth", "tunable")),
+    ("SergeModular", "Serge Modular drums. Esoteric modular drums. Experimental, unique.", ("serge", "modular", "experimental", "unique", "esoteric")),
+    ("SimmonsSDS400", "Simmons SDS-400 electronic drums. 80s electronic drums. Iconic hex pads.", ("simmons", "sds400", "electronic", "80s", "hex-pads")),
+    ("SimmonsSDS5", "Simmons SDS-5 electronic drums. THE 80s electronic drum sound. Iconic.", ("simmons", "sds5", "electronic", "80s", "iconic")),
+    ("SoundmastersR88", "Soundmaster SR-88 drums. Budget analog drums. Lo-fi, characterful.", ("soundmaster", "sr88", "analog", "lo-fi", "budget")),
+
+    # U
+    ("UnivoxMicroRhythmer12", "Univox Micro Rhythmer 12. Vintage preset drums. 70s, retro.", ("univox", "micro-rhythmer", "vintage", "70s", "preset")),
+
+    # V
+    ("ViscoSpaceDrum", "Visco Space Drum. Unique electronic drums. Spacey, experimental.", ("visco", "space-drum", "electronic", "spacey", "experimental")),
+
+    # X
+    ("XdrumLM8953", "X-drum LM-8953. Custom drum sounds. Electronic, unique.", ("xdrum", "lm8953", "electronic", "custom")),
+
+    # Y
+    ("YamahaRM50", "Yamaha RM50 drum module. 90s drum module. High-quality, versatile.", ("yamaha", "rm50", "90s", "module", "high-quality")),
+    ("YamahaRX21", "Yamaha RX21 drum machine. Budget 80s drums. Digital, punchy.", ("yamaha", "rx21", "80s", "digital", "budget")),
+    ("YamahaRX5", "Yamaha RX5 drum machine. Premium 80s drums. High-quality samples.", ("yamaha", "rx5", "80s", "digital", "premium")),
+    ("YamahaRY30", "Yamaha RY30 drum machine. 90s AWM drums. Versatile, modern.", ("yamaha", "ry30", "90s", "awm", "versatile")),
+    ("YamahaTG33", "Yamaha TG33 drums. Vector synthesis drums. Unique, evolving.", ("yamaha", "tg33", "vector", "synthesis", "unique")),
+)
+
+# Standard kit sounds each drum machine supports
+KIT_SOUNDS = ("bd", "sd", "hh", "oh", "cp", "lt", "mt", "ht", "cy", "cb", "rs", "cr")
+_KIT_LIST = ", ".join(KIT_SOUNDS)
+
+# ===========================================
+# VCSL (Versilian Community Sample Library)
+# High-quality acoustic samples, CC0 licensed
+# Row: (name, description, category, tags); id gets a vcsl_ prefix
+# ===========================================
+
+VCSL_INSTRUMENTS = (
+    # Percussion
+    ("ballwhistle", "Ball whistle percussion. Sports referee whistle. Shrill, attention-getting.", "percussion", ("whistle", "ball", "sports", "sfx")),
+    ("bassdrum1", "VCSL acoustic bass drum 1. Deep orchestral kick. Concert, classical.", "percussion", ("bass-drum", "acoustic", "orchestral", "deep")),
+    ("bassdrum2", "VCSL acoustic bass drum 2. Variant with different character. Orchestral.", "percussion", ("bass-drum", "acoustic", "orchestral", "variant")),
+    ("bongo", "VCSL bongo drums. Hand drums, Latin percussion. Warm, organic.", "percussion", ("bongo", "hand-drum", "latin", "organic")),
+    ("conga", "VCSL conga drums. Tall hand drums. Latin, Afro-Cuban, warm.", "percussion", ("conga", "hand-drum", "latin", "afro-cuban")),
+    ("darbuka", "VCSL darbuka. Middle Eastern goblet drum. Arabic, Turkish, belly dance.", "percussion", ("darbuka", "middle-eastern", "goblet", "arabic")),
+    ("framedrum", "VCSL frame drum. Large circular drum. World, shamanic, bodhran-like.", "percussion", ("frame-drum", "world", "shamanic", "circular")),
+    ("snare_modern", "VCSL modern snare drum. Contemporary snare sound. Versatile, studio.", "percussion", ("snare", "modern", "studio", "versatile")),
+    ("snare_hi", "VCSL high-pitched snare. Bright, cutting snare. Piccolo-style.", "percussion", ("snare", "high", "bright", "piccolo")),
+    ("snare_low", "VCSL low snare drum. Deep snare sound. Fat, warm.", "percussion", ("snare", "low", "deep", "warm")),
+    ("snare_rim", "VCSL snare rim shot. Rim click/shot. Sharp, accented.", "percussion", ("snare", "rim", "rimshot", "sharp")),
+    ("tom_mallet", "VCSL tom with mallet. Soft attack tom. Orchestral, melodic.", "percussion", ("tom", "mallet", "soft", "orchestral")),
+    ("tom_stick", "VCSL tom with stick. Standard tom hit. Rock, pop drums.", "percussion", ("tom", "stick", "rock", "pop")),
+    ("tom_rim", "VCSL tom rim. Tom rim click. Accent, variation.", "percussion", ("tom", "rim", "accent")),
+    ("tom2_mallet", "VCSL tom 2 with mallet. Second tom, mallet hit.", "percussion", ("tom", "mallet", "variant")),
+    ("tom2_stick", "VCSL tom 2 with stick. Second tom, stick hit.", "percussion", ("tom", "stick", "variant")),
+    ("tom2_rim", "VCSL tom 2 rim. Second tom rim click.", "percussion", ("tom", "rim", "variant")),
+    ("timpani", "VCSL timpani. Orchestral kettle drums. Classical, dramatic.", "percussion", ("timpani", "orchestral", "classical", "dramatic")),
+    ("timpani_roll", "VCSL timpani roll. Sustained timpani tremolo. Building tension.", "percussion", ("timpani", "roll", "tremolo", "tension")),
+    ("timpani2", "VCSL timpani 2. Second timpani variant. Different tuning.", "percussion", ("timpani", "variant", "orchestral")),
+
+    # Woodwinds
+    ("recorder_alto_stacc", "VCSL alto recorder staccato. Short, detached notes. Renaissance.", "woodwind", ("recorder", "alto", "staccato", "renaissance")),
+    ("recorder_alto_vib", "VCSL alto recorder vibrato. Expressive with vibrato. Melodic.", "woodwind", ("recorder", "alto", "vibrato", "expressive")),
+    ("recorder_alto_sus", "VCSL alto recorder sustained. Long, held notes. Legato.", "woodwind", ("recorder", "alto", "sustained", "legato")),
+    ("recorder_bass_stacc", "VCSL bass recorder staccato. Low recorder, short notes.", "woodwind", ("recorder", "bass", "staccato", "low")),
+    ("recorder_bass_vib", "VCSL bass recorder vibrato. Low recorder with vibrato.", "woodwind", ("recorder", "bass", "vibrato", "low")),
+    ("recorder_bass_sus", "VCSL bass recorder sustained. Low recorder, long notes.", "woodwind", ("recorder", "bass", "sustained", "low")),
+    ("recorder_soprano_stacc", "VCSL soprano recorder staccato. High recorder, short.", "woodwind", ("recorder", "soprano", "staccato", "high")),
+    ("recorder_soprano_sus", "VCSL soprano recorder sustained. High recorder, long.", "woodwind", ("recorder", "soprano", "sustained", "high")),
+    ("recorder_tenor_stacc", "VCSL tenor recorder staccato. Mid-range recorder, short.", "woodwind", ("recorder", "tenor", "staccato")),
+    ("recorder_tenor_vib", "VCSL tenor recorder vibrato. Mid-range with vibrato.", "woodwind", ("recorder", "tenor", "vibrato")),
+    ("recorder_tenor_sus", "VCSL tenor recorder sustained. Mid-range, long notes.", "woodwind", ("recorder", "tenor", "sustained")),
+    ("ocarina_small_stacc", "VCSL small ocarina staccato. Small clay flute, short notes.", "woodwind", ("ocarina", "small", "staccato", "clay")),
+    ("ocarina_small", "VCSL small ocarina. High-pitched clay wind instrument.", "woodwind", ("ocarina", "small", "high", "clay")),
+    ("ocarina", "VCSL ocarina. Clay wind instrument. Zelda-like, pure, innocent.", "woodwind", ("ocarina", "clay", "pure", "zelda")),
+    ("ocarina_vib", "VCSL ocarina vibrato. Ocarina with expressive vibrato.", "woodwind", ("ocarina", "vibrato", "expressive")),
+    ("saxello", "VCSL saxello. Rare curved soprano sax. Unique, jazz.", "woodwind", ("saxello", "saxophone", "soprano", "jazz", "rare")),
+    ("saxello_stacc", "VCSL saxello staccato. Short, punchy sax notes.", "woodwind", ("saxello", "saxophone", "staccato")),
+    ("saxello_vib", "VCSL saxello vibrato. Expressive saxello with vibrato.", "woodwind", ("saxello", "saxophone", "vibrato")),
+    ("sax", "VCSL tenor saxophone. Classic jazz/R&B sax. Rich, soulful.", "woodwind", ("saxophone", "tenor", "jazz", "soulful")),
+    ("sax_stacc", "VCSL tenor sax staccato. Short, punchy sax hits.", "woodwind", ("saxophone", "tenor", "staccato")),
+    ("sax_vib", "VCSL tenor sax vibrato. Expressive sax with vibrato.", "woodwind", ("saxophone", "tenor", "vibrato")),
+
+    # Organs
+    ("pipeorgan_loud_pedal", "VCSL pipe organ loud pedal. Deep bass pedal, full power.", "organ", ("organ", "pipe", "pedal", "loud", "bass")),
+    ("pipeorgan_loud", "VCSL pipe organ loud. Full registration, powerful.", "organ", ("organ", "pipe", "loud", "powerful")),
+    ("pipeorgan_quiet_pedal", "VCSL pipe organ quiet pedal. Soft bass pedal.", "organ", ("organ", "pipe", "pedal", "quiet", "soft")),
+    ("pipeorgan_quiet", "VCSL pipe organ quiet. Soft registration, intimate.", "organ", ("organ", "pipe", "quiet", "intimate")),
+    ("organ_4inch", "VCSL 4-inch organ pipes. Small organ pipes, high.", "organ", ("organ", "small", "high", "pipes")),
+    ("organ_8inch", "VCSL 8-inch organ pipes. Standard organ pipes.", "organ", ("organ", "standard", "pipes")),
+    ("organ_full", "VCSL full organ. Complete organ registration. Rich, full.", "organ", ("organ", "full", "rich", "complete")),
+
+    # Keyboards
+    ("clavisynth", "VCSL clavisynth. Clavinet/synth hybrid. Funky, electronic.", "keyboards", ("clavinet", "synth", "funky", "electronic")),
+    ("fmpiano", "VCSL FM piano. DX7-style FM electric piano. 80s, digital, bright.", "keyboards", ("piano", "fm", "dx7", "80s", "digital")),
+    ("piano1", "VCSL piano 1. Acoustic grand piano. Classical, versatile.", "keyboards", ("piano", "acoustic", "grand", "classical")),
+    ("kawai", "VCSL Kawai piano. Kawai grand piano sample. Bright, clear.", "keyboards", ("piano", "kawai", "grand", "bright")),
+    ("steinway", "VCSL Steinway piano. Steinway grand piano. Rich, warm, concert.", "keyboards", ("piano", "steinway", "grand", "concert", "rich")),
+
+    # Strings
+    ("harp", "VCSL concert harp. Classical pedal harp. Ethereal, sweeping.", "strings", ("harp", "concert", "classical", "ethereal")),
+    ("folkharp", "VCSL folk harp. Celtic/lever harp. Folk, Celtic, intimate.", "strings", ("harp", "folk", "celtic", "lever")),
+    ("strumstick", "VCSL strumstick. Simple Appalachian string instrument. Folk, drone.", "strings", ("strumstick", "appalachian", "folk", "drone")),
+    ("psaltery_pluck", "VCSL psaltery plucked. Medieval plucked zither. Plucky, ancient.", "strings", ("psaltery", "plucked", "medieval", "zither")),
+    ("psaltery_spiccato", "VCSL psaltery spiccato. Short bowed psaltery notes.", "strings", ("psaltery", "spiccato", "bowed", "short")),
+    ("psaltery_bow", "VCSL bowed psaltery. Sustained bowed psaltery. Ethereal, haunting.", "strings", ("psaltery", "bowed", "ethereal", "haunting")),
+
+    # World
+    ("dantranh", "VCSL dan tranh. Vietnamese zither. Asian, traditional, delicate.", "world", ("dan-tranh", "vietnamese", "zither", "asian")),
+    ("dantranh_tremolo", "VCSL dan tranh tremolo. Tremolo technique on dan tranh.", "world", ("dan-tranh", "tremolo", "vietnamese")),
+    ("dantranh_vibrato", "VCSL dan tranh vibrato. Vibrato technique on dan tranh.", "world", ("dan-tranh", "vibrato", "vietnamese")),
+
+    # Woodwinds
+    ("harmonica", "VCSL harmonica. Blues harp. Expressive, folk, blues.", "woodwind", ("harmonica", "blues", "harp", "folk")),
+    ("harmonica_soft", "VCSL soft harmonica. Gentle harmonica playing.", "woodwind", ("harmonica", "soft", "gentle")),
+    ("harmonica_vib", "VCSL harmonica vibrato. Harmonica with vibrato.", "woodwind", ("harmonica", "vibrato", "expressive")),
+    ("super64", "VCSL Super 64 chromatic harmonica. Large chromatic harmonica.", "woodwind", ("harmonica", "chromatic", "super64")),
+    ("super64_acc", "VCSL Super 64 accented. Strong attack harmonica.", "woodwind", ("harmonica", "chromatic", "accented")),
+    ("super64_vib", "VCSL Super 64 vibrato. Chromatic harmonica with vibrato.", "woodwind", ("harmonica", "chromatic", "vibrato")),
+
+    # World
+    ("didgeridoo", "VCSL didgeridoo. Australian Aboriginal drone instrument. Deep, drone, circular breathing.", "world", ("didgeridoo", "australian", "drone", "aboriginal")),
+
+    # Percussion
+    ("agogo", "VCSL agogo bells. Brazilian percussion bells. Latin, samba, bright.", "percussion", ("agogo", "bells", "brazilian", "samba")),
+    ("anvil", "VCSL anvil. Metal anvil hit. Industrial, orchestral effect.", "percussion", ("anvil", "metal", "industrial", "orchestral")),
+    ("kalimba", "VCSL kalimba. African thumb piano. Plucky, gentle, melodic.", "percussion", ("kalimba", "thumb-piano", "african", "melodic")),
+    ("kalimba_pad", "VCSL kalimba pad. Sustained kalimba pad sound. Ambient, ethereal.", "percussion", ("kalimba", "pad", "ambient", "ethereal")),
+    ("marimba", "VCSL marimba. Large wooden mallet percussion. Warm, resonant.", "percussion", ("marimba", "mallet", "wooden", "warm")),
+    ("xylophone", "VCSL xylophone. Bright wooden mallet percussion. Crisp, piercing.", "percussion", ("xylophone", "mallet", "bright", "crisp")),
+    ("xylophone_hard", "VCSL xylophone hard mallets. Brighter, more attack.", "percussion", ("xylophone", "hard", "bright", "attack")),
+
+    # Sound Effects
+    ("trainwhistle", "VCSL train whistle. Steam locomotive whistle. Nostalgic, effect.", "sfx", ("train", "whistle", "steam", "nostalgic")),
+    ("siren", "VCSL siren. Emergency siren sound. Alert, urgent.", "sfx", ("siren", "emergency", "alert", "urgent")),
+    ("wineglass", "VCSL wineglass. Singing glass rim. Ethereal, glass harmonica-like.", "sfx", ("wineglass", "glass", "ethereal", "singing")),
+    ("wineglass_slow", "VCSL wineglass slow. Slowly bowed wineglass. Sustained, haunting.", "sfx", ("wineglass", "slow", "sustained", "haunting")),
+)
+
+
+# ===========================================
+# WAVETABLES (dough-waveforms and more)
+# Use with wt_ prefix for automatic looping
+# Row: (id, description, category, tags)
+# ===========================================
+
+WAVETABLES = (
+    # Numbered waveforms (basic synthesis textures); wt_02..wt_20 differ
+    # only by number, so their rows are generated
+    ("wt_01", "Wavetable waveform 01. Basic synthesis texture. Evolving, complex.", "wavetable", ("wavetable", "basic", "synthesis", "evolving")),
+    *(
+        (
+            f"wt_{n:02d}",
+            f"Wavetable waveform {n:02d}. Basic synthesis texture variant {n}.",
+            "wavetable",
+            ("wavetable", "basic", "synthesis"),
+        )
+        for n in range(2, 21)
+    ),
+
+    # Instrument, synthesis and special wavetables
+    ("wt_aguitar", "Wavetable acoustic guitar. Guitar harmonic content as wavetable. Organic, plucky.", "wavetable", ("wavetable", "guitar", "acoustic", "organic")),
+    ("wt_altosax", "Wavetable alto saxophone. Sax timbre as wavetable. Reedy, expressive.", "wavetable", ("wavetable", "saxophone", "alto", "reedy")),
+    ("wt_cello", "Wavetable cello. Cello harmonics as wavetable. Rich, bowed, strings.", "wavetable", ("wavetable", "cello", "strings", "bowed")),
+    ("wt_clarinett", "Wavetable clarinet. Clarinet timbre as wavetable. Woody, warm.", "wavetable", ("wavetable", "clarinet", "woody", "warm")),
+    ("wt_clavinet", "Wavetable clavinet. Funky clavinet as wavetable. Percussive, funky.", "wavetable", ("wavetable", "clavinet", "funky", "percussive")),
+    ("wt_dbass", "Wavetable double bass. Upright bass as wavetable. Deep, woody, organic.", "wavetable", ("wavetable", "bass", "double-bass", "woody")),
+    ("wt_ebass", "Wavetable electric bass. Electric bass as wavetable. Punchy, round.", "wavetable", ("wavetable", "bass", "electric", "punchy")),
+    ("wt_eguitar", "Wavetable electric guitar. Electric guitar as wavetable. Versatile, harmonic.", "wavetable", ("wavetable", "guitar", "electric", "harmonic")),
+    ("wt_eorgan", "Wavetable electric organ. Organ drawbars as wavetable. Classic, keys.", "wavetable", ("wavetable", "organ", "electric", "drawbar")),
+    ("wt_epiano", "Wavetable electric piano. Rhodes-style as wavetable. Warm, bell-like.", "wavetable", ("wavetable", "piano", "electric", "rhodes")),
+    ("wt_flute", "Wavetable flute. Flute timbre as wavetable. Airy, breathy.", "wavetable", ("wavetable", "flute", "airy", "breathy")),
+    ("wt_oboe", "Wavetable oboe. Oboe as wavetable. Nasal, expressive, reedy.", "wavetable", ("wavetable", "oboe", "nasal", "reedy")),
+    ("wt_piano", "Wavetable piano. Piano harmonics as wavetable. Bright, rich.", "wavetable", ("wavetable", "piano", "acoustic", "rich")),
+    ("wt_theremin", "Wavetable theremin. Theremin-style wavetable. Eerie, vocal-like, sci-fi.", "wavetable", ("wavetable", "theremin", "eerie", "sci-fi")),
+    ("wt_violin", "Wavetable violin. Violin as wavetable. Expressive, bowed, strings.", "wavetable", ("wavetable", "violin", "strings", "bowed")),
+    ("wt_fmsynth", "Wavetable FM synthesis. FM synth textures. Digital, bell-like, metallic.", "wavetable", ("wavetable", "fm", "digital", "metallic")),
+    ("wt_distorted", "Wavetable distorted. Heavy distortion wavetable. Aggressive, saturated.", "wavetable", ("wavetable", "distortion", "aggressive", "saturated")),
+    ("wt_granular", "Wavetable granular. Granular synthesis texture. Textural, fragmented.", "wavetable", ("wavetable", "granular", "textural", "fragmented")),
+    ("wt_birds", "Wavetable birds. Bird-like textures. Nature, chirping, organic.", "wavetable", ("wavetable", "birds", "nature", "organic")),
+    ("wt_bitreduced", "Wavetable bit-reduced. Lo-fi, crushed. 8-bit, retro, crunchy.", "wavetable", ("wavetable", "bitcrush", "lo-fi", "8-bit")),
+    ("wt_hdrawn", "Wavetable hand-drawn. Custom drawn waveforms. Unique, experimental.", "wavetable", ("wavetable", "hand-drawn", "custom", "experimental")),
+    ("wt_hvoice", "Wavetable harmonic voice. Vocal harmonics. Choir-like, ethereal.", "wavetable", ("wavetable", "voice", "harmonic", "ethereal")),
+    ("wt_linear", "Wavetable linear. Linear waveform morphing. Smooth, evolving.", "wavetable", ("wavetable", "linear", "smooth", "morphing")),
+    ("wt_oscchip", "Wavetable oscillator chip. Chip-style waveforms. 8-bit, chiptune, retro.", "wavetable", ("wavetable", "chip", "8-bit", "chiptune")),
+    ("wt_overtone", "Wavetable overtone. Rich overtone content. Harmonic, complex.", "wavetable", ("wavetable", "overtone", "harmonic", "complex")),
+    ("wt_pluckalgo", "Wavetable pluck algorithm. Karplus-Strong style. Plucky, string-like.", "wavetable", ("wavetable", "pluck", "karplus-strong", "string")),
+    ("wt_raw", "Wavetable raw. Unprocessed raw waveforms. Pure, fundamental.", "wavetable", ("wavetable", "raw", "pure", "unprocessed")),
+    ("wt_sinharm", "Wavetable sine harmonic. Additive sine harmonics. Clean, pure, harmonic.", "wavetable", ("wavetable", "sine", "harmonic", "additive")),
+    ("wt_snippets", "Wavetable snippets. Short audio snippets as wavetable. Glitchy, textural.", "wavetable", ("wavetable", "snippets", "glitch", "textural")),
+    ("wt_stereo", "Wavetable stereo. Wide stereo wavetables. Spacious, wide.", "wavetable", ("wavetable", "stereo", "wide", "spacious")),
+    ("wt_stringbox", "Wavetable string box. String ensemble wavetable. Lush, ensemble.", "wavetable", ("wavetable", "strings", "ensemble", "lush")),
+    ("wt_symetric", "Wavetable symmetric. Symmetric waveforms. Balanced, clean.", "wavetable", ("wavetable", "symmetric", "balanced", "clean")),
+    ("wt_vgame", "Wavetable video game. Video game sound textures. Retro, game, 8-bit.", "wavetable", ("wavetable", "video-game", "retro", "8-bit")),
+    ("wt_vgamebasic", "Wavetable video game basic. Simple game waveforms. Chiptune, simple.", "wavetable", ("wavetable", "video-game", "basic", "chiptune")),
+    ("wt_c604", "Wavetable C604. C64-style chip waveforms. Commodore, SID, 8-bit.", "wavetable", ("wavetable", "c64", "sid", "commodore")),
+
+    # Band-limited basics
+    ("wt_saw", "Wavetable sawtooth. Band-limited saw wave. Classic synth, aliasing-free.", "wavetable", ("wavetable", "sawtooth", "band-limited", "classic")),
+    ("wt_square", "Wavetable square. Band-limited square wave. Hollow, punchy.", "wavetable", ("wavetable", "square", "band-limited", "hollow")),
+    ("wt_triangle", "Wavetable triangle. Band-limited triangle wave. Soft, mellow.", "wavetable", ("wavetable", "triangle", "band-limited", "mellow")),
+    ("wt_sine", "Wavetable sine. Pure sine as wavetable. Pure, fundamental, sub.", "wavetable", ("wavetable", "sine", "pure", "fundamental")),
+)
+
+
+@functools.cache
+def _interned(tags: tuple[str, ...]) -> tuple[str, ...]:
+    """Intern tag strings so every occurrence of a tag shares one str object.
+
+    Tags like "jazz" or "big-band" repeat across dozens of entries; interning
+    collapses them to a single PyUnicode each (hyphenated strings are not
+    covered by CPython's automatic small-string interning). The cache also
+    canonicalizes whole tag tuples: rows with identical tags (e.g. the
+    generated wavetable variants) share one tuple object instead of each
+    carrying its own copy.
+    """
+    return tuple(sys.intern(t) for t in tags)
+
+
+# Per-source tag tails shared by every record in a section; interned once
+# here instead of once per record inside build_catalog().
+_DRUM_MACHINE_TAIL = _interned(("drum-machine", "kit"))
+_VCSL_TAIL = _interned(("vcsl", "acoustic", "sample-library"))
+_WAVETABLE_TAIL = _interned(("looping", "synthesis"))
+
+
+def _example(sound_id: str, notes: str | None) -> str:
+    """Build the usage example for a sound from its note pattern."""
+    if notes is None:
+        return f's("{sound_id}")'
+    return f'note("{notes}").s("{sound_id}")'
+
+
+@functools.cache
+def build_catalog() -> tuple[SoundEntry, ...]:
+    """Build the complete sound catalog.
+
+    Memoized: repeat calls in one process return the same immutable tuple
+    instead of re-running the table assembly. Each section is a generator
+    expression; one tuple() over the chained sections materializes the
+    catalog without intermediate lists or per-item append calls.
+    """
+    gm = (
+        SoundEntry(
+            sound_id,
+            sound_id,
+            description,
+            "soundfonts",
+            sys.intern(category),
+            _interned(tags),
+            _example(
+                sound_id,
+                _GM_NOTE_OVERRIDES.get(
+                    sound_id, _GM_DEFAULT_NOTES[GmCategory[category.upper()]]
+                ),
+            ),
+        )
+        for sound_id, description, category, tags in GM_SOUNDFONTS
+    )
+
+    dirt = (
+        SoundEntry(
+            sound_id,
+            sound_id,
+            description,
+            "dirt-samples",
+            sys.intern(category),
+            _interned(tags),
+            f's("{sound_id}")',
+        )
+        for sound_id, description, category, tags in DIRT_SAMPLES
+    )
+
+    synths = (
+        SoundEntry(
+            sound_id,
+            sound_id,
+            description,
+            "builtin",
+            sys.intern(category),
+            _interned(tags),
+            _example(sound_id, notes),
+        )
+        for sound_id, description, category, tags, notes in BUILTIN_SYNTHS
+    )
+
+    # Each drum machine is one entry with a kit description
+    machines = (
+        SoundEntry(
+            machine_name.lower(),
+            machine_name,
+            f"{description} Kit includes: {_KIT_LIST}.",
+            "drum-machines",
+            "drum_machine",
+            _interned(tags + _DRUM_MACHINE_TAIL),
+            f's("bd sd hh hh").bank("{machine_name}")',
+        )
+        for machine_name, description, tags in DRUM_MACHINES
+    )
+
+    vcsl = (
+        SoundEntry(
+            f"vcsl_{name}",
+            name,
+            description,
+            "vcsl",
+            sys.intern(category),
+            _interned(tags + _VCSL_TAIL),
+            f'note("c4 e4 g4").s("{name}")',
+        )
+        for name, description, category, tags in VCSL_INSTRUMENTS
+    )
+
+    wavetables = (
+        SoundEntry(
+            sound_id,
+            sound_id,
+            description,
+            "wavetables",
+            sys.intern(category),
+            _interned(tags + _WAVETABLE_TAIL),
+            f'note("c4 e4 g4").s("{sound_id}").clip(2)',
+        )
+        for sound_id, description, category, tags in WAVETABLES
+    )
+
+    return tuple(itertools.chain(gm, dirt, synths, machines, vcsl, wavetables))
+
+
+@functools.cache
+def as_columns() -> dict[str, tuple]:
+    """Transpose the catalog to struct-of-arrays: one tuple per field.
+
+    Column-wise consumers (per-field stats, numpy/pandas hand-off) then
+    iterate a single homogeneous sequence instead of pulling one field out
+    of every record; built lazily once and shared, like build_catalog().
+    """
+    return dict(zip(SoundEntry._fields, map(tuple, zip(*build_catalog()))))
+
+
+def load_catalog(rebuild: bool = False) -> tuple[SoundEntry, ...]:
+    """Load the catalog, using the on-disk pickle cache when it is fresh.
+
+    Rebuilding re-executes ~900 lines of table literals; unpickling the
+    cached blob is orders of magnitude cheaper for repeat invocations
+    (e.g. re-running the arrwDB indexer during development). The cache is
+    keyed on this file's mtime, so editing the tables invalidates it.
+    """
+    cache_path = Path(__file__).parent / "sound_catalog.pkl"
+    use_cache = (
+        not rebuild
+        and cache_path.exists()
+        and cache_path.stat().st_mtime >= Path(__file__).stat().st_mtime
+    )
+    # Rows are pickled as plain tuples so the cache does not depend on where
+    # the SoundEntry class was defined (__main__ vs module import).
+    if use_cache:
+        with open(cache_path, "rb") as f:
+            return tuple(SoundEntry._make(row) for row in pickle.load(f))
 
-    # Add GM soundfonts to catalog
-    for name, data in gm_soundfonts.items():
-        sounds.append({
-            "id": name,
-            "name": name,
-            "description": data["description"],
-            "source": "soundfonts",
-            "category": data["category"],
-            "tags": data["tags"],
-            "example": data["example"]
-        })
-
-    # ===========================================
-    # DIRT SAMPLES (from tidalcycles/dirt-samples)
-    # Complete list of ~200 sample banks
-    # ===========================================
-
-    # Full dirt-samples catalog with descriptions
-    dirt_samples = {
-        # 808 Drum Machine Family
-        "808": {"description": "Roland TR-808 drum machine. Classic hip-hop, electronic. Full kit - kicks, snares, hats, claps.", "category": "drum_machine", "tags": ["808", "roland", "drum-machine", "hip-hop", "electronic", "classic"]},
-        "808bd": {"description": "TR-808 bass drum, kick. Deep, boomy, iconic hip-hop kick.", "category": "drums", "tags": ["808", "kick", "bass-drum", "hip-hop", "deep", "boomy"]},
-        "808cy": {"description": "TR-808 cymbal. Metallic, splashy crash.", "category": "drums", "tags": ["808", "cymbal", "crash", "metallic"]},
-        "808hc": {"description": "TR-808 high conga. Latin percussion, electronic.", "category": "drums", "tags": ["808", "conga", "high", "latin", "percussion"]},
-        "808ht": {"description": "TR-808 high tom. Pitched tom sound.", "category": "drums", "tags": ["808", "tom", "high", "pitched"]},
-        "808lc": {"description": "TR-808 low conga. Deep latin percussion.", "category": "drums", "tags": ["808", "conga", "low", "latin", "deep"]},
-        "808lt": {"description": "TR-808 low tom. Deep pitched tom.", "category": "drums", "tags": ["808", "tom", "low", "deep"]},
-        "808mc": {"description": "TR-808 mid conga. Medium latin percussion.", "category": "drums", "tags": ["808", "conga", "mid", "latin"]},
-        "808mt": {"description": "TR-808 mid tom. Medium pitched tom.", "category": "drums", "tags": ["808", "tom", "mid"]},
-        "808oh": {"description": "TR-808 open hi-hat. Sizzling, sustained hat.", "category": "drums", "tags": ["808", "hi-hat", "open", "sizzle"]},
-        "808sd": {"description": "TR-808 snare drum. Crisp, snappy electronic snare.", "category": "drums", "tags": ["808", "snare", "crisp", "electronic"]},
-
-        # 909 Drum Machine
-        "909": {"description": "Roland TR-909 drum machine. House, techno essential. Punchy kicks, crisp hats.", "category": "drum_machine", "tags": ["909", "roland", "drum-machine", "house", "techno", "punchy"]},
-
-        # Alphabetical dirt-samples
-        "ab": {"description": "Abstract sounds. Experimental, textural, unusual.", "category": "experimental", "tags": ["abstract", "experimental", "texture", "unusual"]},
-        "ade": {"description": "Ade sample pack. Electronic textures.", "category": "electronic", "tags": ["ade", "electronic", "texture"]},
-        "ades2": {"description": "Ade sample pack 2. More electronic sounds.", "category": "electronic", "tags": ["ade", "electronic", "variant"]},
-        "ades3": {"description": "Ade sample pack 3. Electronic continuation.", "category": "electronic", "tags": ["ade", "electronic", "variant"]},
-        "ades4": {"description": "Ade sample pack 4. Electronic sounds.", "category": "electronic", "tags": ["ade", "electronic", "variant"]},
-        "alex": {"description": "Alex sample collection. Various sounds.", "category": "misc", "tags": ["alex", "collection", "various"]},
-        "alphabet": {"description": "Alphabet spoken letters. A to Z voice samples.", "category": "vocal", "tags": ["alphabet", "letters", "voice", "speech", "educational"]},
-        "amencutup": {"description": "Amen break chopped. Classic breakbeat sliced. Jungle, drum and bass.", "category": "breaks", "tags": ["amen", "breakbeat", "chopped", "jungle", "dnb", "classic"]},
-        "armora": {"description": "Armora sounds. Metallic, armored textures.", "category": "experimental", "tags": ["armora", "metallic", "texture"]},
-        "arp": {"description": "Arpeggio sounds. Sequenced melodic patterns.", "category": "melodic", "tags": ["arpeggio", "sequence", "melodic", "pattern"]},
-        "arpy": {"description": "Arpy synth. Short plucky synth for arpeggios. Electronic, chiptune-ish.", "category": "melodic", "tags": ["arpeggio", "synth", "plucky", "electronic"]},
-        "auto": {"description": "Auto sounds. Automotive, mechanical.", "category": "sfx", "tags": ["auto", "car", "mechanical", "engine"]},
-
-        # B samples
-        "baa": {"description": "Baa sheep sound. Animal bleat.", "category": "sfx", "tags": ["sheep", "animal", "bleat", "farm"]},
-        "baa2": {"description": "Baa sheep variant. Different sheep sounds.", "category": "sfx", "tags": ["sheep", "animal", "bleat", "variant"]},
-        "bass": {"description": "Bass samples. General bass sounds. Low frequency foundation.", "category": "bass", "tags": ["bass", "low", "foundation"]},
-        "bass0": {"description": "Bass variant 0. Alternative bass character.", "category": "bass", "tags": ["bass", "variant", "low"]},
-        "bass1": {"description": "Bass variant 1. Different bass timbre.", "category": "bass", "tags": ["bass", "variant", "low"]},
-        "bass2": {"description": "Bass variant 2. Another bass flavor.", "category": "bass", "tags": ["bass", "variant", "low"]},
-        "bass3": {"description": "Bass variant 3. Extended bass options.", "category": "bass", "tags": ["bass", "variant", "low"]},
-        "bassdm": {"description": "Bass drum samples. Kick drums, low percussion.", "category": "drums", "tags": ["bass", "drum", "kick", "low"]},
-        "bassfoo": {"description": "Bass foo experimental. Unusual bass sounds.", "category": "bass", "tags": ["bass", "experimental", "unusual"]},
-        "battles": {"description": "Battle sounds. Combat, action, warfare.", "category": "sfx", "tags": ["battle", "combat", "action", "warfare"]},
-        "bd": {"description": "Bass drum, kick drum. Electronic and acoustic kicks. Foundation of rhythm.", "category": "drums", "tags": ["kick", "bass-drum", "drums", "rhythm", "foundation"]},
-        "bend": {"description": "Bend sounds. Pitch bending, gliding tones.", "category": "melodic", "tags": ["bend", "pitch", "glide", "tone"]},
-        "bev": {"description": "Bev sample collection. Various sounds.", "category": "misc", "tags": ["bev", "collection", "various"]},
-        "bin": {"description": "Binary sounds. Digital, computer-like.", "category": "electronic", "tags": ["binary", "digital", "computer", "data"]},
-        "birds": {"description": "Bird sounds. Birdsong, nature, chirping.", "category": "sfx", "tags": ["birds", "nature", "chirp", "wildlife"]},
-        "birds3": {"description": "Birds variant 3. More bird sounds.", "category": "sfx", "tags": ["birds", "nature", "chirp", "variant"]},
-        "bleep": {"description": "Bleep sounds. Electronic beeps, UI sounds.", "category": "electronic", "tags": ["bleep", "beep", "electronic", "ui"]},
-        "blip": {"description": "Blip sounds. Short electronic beep. Glitch, UI, accent.", "category": "electronic", "tags": ["blip", "beep", "electronic", "glitch", "ui"]},
-        "blue": {"description": "Blue sample collection. Various sounds.", "category": "misc", "tags": ["blue", "collection", "various"]},
-        "bottle": {"description": "Bottle sounds. Glass, blown bottle, percussion.", "category": "percussion", "tags": ["bottle", "glass", "blown", "percussion"]},
-        "breaks125": {"description": "Breakbeat loops at 125 BPM. House tempo breaks.", "category": "breaks", "tags": ["breakbeat", "125bpm", "house", "loop"]},
-        "breaks152": {"description": "Breakbeat loops at 152 BPM. DnB tempo breaks.", "category": "breaks", "tags": ["breakbeat", "152bpm", "dnb", "loop"]},
-        "breaks157": {"description": "Breakbeat loops at 157 BPM. Fast breaks.", "category": "breaks", "tags": ["breakbeat", "157bpm", "fast", "loop"]},
-        "breaks165": {"description": "Breakbeat loops at 165 BPM. Jungle tempo.", "category": "breaks", "tags": ["breakbeat", "165bpm", "jungle", "loop"]},
-        "breath": {"description": "Breath sounds. Human breathing, wind.", "category": "sfx", "tags": ["breath", "human", "wind", "air"]},
-        "bubble": {"description": "Bubble sounds. Water bubbles, underwater.", "category": "sfx", "tags": ["bubble", "water", "underwater", "liquid"]},
-
-        # C samples
-        "can": {"description": "Can sounds. Metal can, percussion.", "category": "percussion", "tags": ["can", "metal", "percussion", "found-sound"]},
-        "casio": {"description": "Casio keyboard. Lo-fi keys, toy keyboard character. Nostalgic, lo-fi.", "category": "melodic", "tags": ["casio", "keyboard", "lo-fi", "toy", "nostalgic"]},
-        "cb": {"description": "Cowbell. Metallic percussion. Funk, latin, electronic classic.", "category": "drums", "tags": ["cowbell", "percussion", "metallic", "funk", "latin"]},
-        "cc": {"description": "CC samples. Various control sounds.", "category": "misc", "tags": ["cc", "control", "various"]},
-        "chin": {"description": "China cymbal or chin sounds. Trashy cymbal.", "category": "drums", "tags": ["china", "cymbal", "trashy", "crash"]},
-        "circus": {"description": "Circus sounds. Carnival, whimsical, fun.", "category": "sfx", "tags": ["circus", "carnival", "whimsical", "fun"]},
-        "clak": {"description": "Clak percussion. Click, clack sounds.", "category": "percussion", "tags": ["clak", "click", "clack", "percussion"]},
-        "click": {"description": "Click sounds. Digital clicks, percussion.", "category": "percussion", "tags": ["click", "digital", "percussion", "ui"]},
-        "clubkick": {"description": "Club kick drums. Big room, EDM kicks.", "category": "drums", "tags": ["kick", "club", "edm", "big-room"]},
-        "co": {"description": "Co sample collection. Various sounds.", "category": "misc", "tags": ["co", "collection", "various"]},
-        "coins": {"description": "Coin sounds. Money, jingling, arcade.", "category": "sfx", "tags": ["coins", "money", "jingle", "arcade"]},
-        "control": {"description": "Control sounds. Buttons, switches, UI.", "category": "sfx", "tags": ["control", "button", "switch", "ui"]},
-        "cosmicg": {"description": "Cosmic G sounds. Space, sci-fi textures.", "category": "electronic", "tags": ["cosmic", "space", "sci-fi", "texture"]},
-        "cp": {"description": "Clap, hand clap. Snappy, layered clap sound. Electronic music staple.", "category": "drums", "tags": ["clap", "handclap", "drums", "snappy"]},
-        "cr": {"description": "Crash cymbal. Explosive cymbal hit. Accents, transitions.", "category": "drums", "tags": ["crash", "cymbal", "drums", "accent", "transition"]},
-        "crow": {"description": "Crow sounds. Bird caw, nature.", "category": "sfx", "tags": ["crow", "bird", "caw", "nature"]},
-
-        # D samples
-        "d": {"description": "D sample collection. Various drum sounds.", "category": "drums", "tags": ["d", "drums", "collection"]},
-        "db": {"description": "DB samples. Database or deep bass.", "category": "bass", "tags": ["db", "deep", "bass"]},
-        "diphone": {"description": "Diphone speech synthesis. Robotic voice.", "category": "vocal", "tags": ["diphone", "speech", "synthesis", "robotic"]},
-        "diphone2": {"description": "Diphone variant 2. More speech synthesis.", "category": "vocal", "tags": ["diphone", "speech", "synthesis", "variant"]},
-        "dist": {"description": "Distorted sounds. Heavy distortion, aggressive.", "category": "electronic", "tags": ["distortion", "heavy", "aggressive", "noise"]},
-        "dork2": {"description": "Dork sounds 2. Quirky, unusual.", "category": "experimental", "tags": ["dork", "quirky", "unusual", "fun"]},
-        "dorkbot": {"description": "Dorkbot sounds. Electronic, robotic.", "category": "electronic", "tags": ["dorkbot", "electronic", "robotic"]},
-        "dr": {"description": "DR drum samples. Various drums.", "category": "drums", "tags": ["dr", "drums", "various"]},
-        "dr2": {"description": "DR drums variant 2.", "category": "drums", "tags": ["dr", "drums", "variant"]},
-        "dr55": {"description": "DR-55 drum machine. Boss Doctor Rhythm.", "category": "drum_machine", "tags": ["dr55", "boss", "drum-machine", "vintage"]},
-        "dr_few": {"description": "DR few selected drums.", "category": "drums", "tags": ["dr", "drums", "selected"]},
-        "drum": {"description": "General drum samples. Various drum hits.", "category": "drums", "tags": ["drum", "hits", "various"]},
-        "drumtraks": {"description": "Sequential DrumTraks samples. Vintage drum machine.", "category": "drum_machine", "tags": ["drumtraks", "sequential", "drum-machine", "vintage"]},
-
-        # E samples
-        "e": {"description": "E sample collection. Electronic sounds.", "category": "electronic", "tags": ["e", "electronic", "collection"]},
-        "east": {"description": "East sounds. Eastern, Asian influenced.", "category": "world", "tags": ["east", "asian", "eastern", "world"]},
-        "electro1": {"description": "Electro sounds 1. Electronic, 80s electro.", "category": "electronic", "tags": ["electro", "80s", "electronic", "breakdance"]},
-        "em2": {"description": "EM2 samples. Electronic music.", "category": "electronic", "tags": ["em2", "electronic", "music"]},
-        "erk": {"description": "Erk sounds. Unusual, experimental.", "category": "experimental", "tags": ["erk", "unusual", "experimental"]},
-
-        # F samples
-        "f": {"description": "F sample collection. Various sounds.", "category": "misc", "tags": ["f", "collection", "various"]},
-        "feel": {"description": "Feel samples. Textural, emotional.", "category": "experimental", "tags": ["feel", "texture", "emotional"]},
-        "feelfx": {"description": "Feel effects. Atmospheric, textural FX.", "category": "sfx", "tags": ["feel", "fx", "atmospheric", "texture"]},
-        "fest": {"description": "Festival sounds. Crowd, celebration.", "category": "sfx", "tags": ["festival", "crowd", "celebration"]},
-        "fire": {"description": "Fire sounds. Flames, crackling.", "category": "sfx", "tags": ["fire", "flames", "crackling", "nature"]},
-        "flick": {"description": "Flick sounds. Quick, snappy.", "category": "percussion", "tags": ["flick", "quick", "snappy"]},
-        "fm": {"description": "FM synthesis sounds. Digital, bell-like, metallic.", "category": "melodic", "tags": ["fm", "synthesis", "digital", "bell", "metallic"]},
-        "foo": {"description": "Foo samples. Various experimental sounds.", "category": "experimental", "tags": ["foo", "experimental", "various"]},
-        "future": {"description": "Future sounds. Futuristic, sci-fi.", "category": "electronic", "tags": ["future", "futuristic", "sci-fi"]},
-
-        # G samples
-        "gab": {"description": "Gabber sounds. Hardcore, distorted.", "category": "electronic", "tags": ["gabber", "hardcore", "distorted", "fast"]},
-        "gabba": {"description": "Gabba kicks. Hardcore techno kicks.", "category": "drums", "tags": ["gabba", "hardcore", "kick", "distorted"]},
-        "gabbaloud": {"description": "Gabba loud. Louder hardcore kicks.", "category": "drums", "tags": ["gabba", "hardcore", "loud", "kick"]},
-        "gabbalouder": {"description": "Gabba even louder. Maximum hardcore.", "category": "drums", "tags": ["gabba", "hardcore", "loudest", "extreme"]},
-        "glasstap": {"description": "Glass tap sounds. Delicate, percussive.", "category": "percussion", "tags": ["glass", "tap", "delicate", "percussion"]},
-        "glitch": {"description": "Glitch sounds. Digital artifacts, errors. Experimental, IDM.", "category": "electronic", "tags": ["glitch", "digital", "error", "idm", "experimental"]},
-        "glitch2": {"description": "Glitch variant 2. More digital artifacts.", "category": "electronic", "tags": ["glitch", "digital", "variant"]},
-        "gretsch": {"description": "Gretsch drum kit. Acoustic drum samples.", "category": "drums", "tags": ["gretsch", "acoustic", "drum-kit"]},
-        "gtr": {"description": "Electric guitar samples. Short stabs, limited. Guitar character.", "category": "guitar", "tags": ["guitar", "electric", "stabs"]},
-
-        # H samples
-        "h": {"description": "H sample collection. Various sounds.", "category": "misc", "tags": ["h", "collection", "various"]},
-        "hand": {"description": "Hand sounds. Claps, snaps, body percussion.", "category": "percussion", "tags": ["hand", "clap", "snap", "body-percussion"]},
-        "hardcore": {"description": "Hardcore sounds. Intense, aggressive.", "category": "electronic", "tags": ["hardcore", "intense", "aggressive"]},
-        "hardkick": {"description": "Hard kick drums. Punchy, powerful kicks.", "category": "drums", "tags": ["kick", "hard", "punchy", "powerful"]},
-        "haw": {"description": "Haw sounds. Various samples.", "category": "misc", "tags": ["haw", "various"]},
-        "hc": {"description": "Hardcore sounds or high conga.", "category": "drums", "tags": ["hc", "hardcore", "conga"]},
-        "hh": {"description": "Hi-hat, closed hi-hat. Tight, crisp high-frequency rhythm.", "category": "drums", "tags": ["hi-hat", "hihat", "drums", "crisp"]},
-        "hh27": {"description": "Hi-hat collection 27. Multiple hi-hat sounds.", "category": "drums", "tags": ["hi-hat", "collection", "variety"]},
-        "hit": {"description": "Hit sounds. Impact, stabs.", "category": "sfx", "tags": ["hit", "impact", "stab"]},
-        "hmm": {"description": "Hmm vocal sounds. Thinking, contemplation.", "category": "vocal", "tags": ["hmm", "vocal", "thinking"]},
-        "ho": {"description": "Ho sounds. Vocal exclamations.", "category": "vocal", "tags": ["ho", "vocal", "exclamation"]},
-        "hoover": {"description": "Hoover bass. Classic rave sound, mentasm.", "category": "bass", "tags": ["hoover", "rave", "mentasm", "bass"]},
-        "house": {"description": "House music samples. 4/4 beats, grooves.", "category": "electronic", "tags": ["house", "4/4", "groove", "electronic"]},
-        "ht": {"description": "High tom drum. High pitched tom. Fills, rolls.", "category": "drums", "tags": ["tom", "high", "fills"]},
-
-        # I samples
-        "if": {"description": "IF samples. Conditional, experimental.", "category": "experimental", "tags": ["if", "experimental"]},
-        "ifdrums": {"description": "IF drums. Experimental drum sounds.", "category": "drums", "tags": ["if", "drums", "experimental"]},
-        "incoming": {"description": "Incoming sounds. Approaching, building.", "category": "sfx", "tags": ["incoming", "approach", "build"]},
-        "industrial": {"description": "Industrial sounds. Factory, mechanical, harsh.", "category": "electronic", "tags": ["industrial", "factory", "mechanical", "harsh"]},
-        "insect": {"description": "Insect sounds. Bugs, buzzing, nature.", "category": "sfx", "tags": ["insect", "bugs", "buzzing", "nature"]},
-        "invaders": {"description": "Space invaders sounds. Retro arcade, 8-bit.", "category": "electronic", "tags": ["invaders", "arcade", "8-bit", "retro", "game"]},
-
-        # J samples
-        "jazz": {"description": "Jazz samples. Jazz drum kit, brushes.", "category": "drums", "tags": ["jazz", "brushes", "acoustic", "swing"]},
-        "jungbass": {"description": "Jungle bass. Sub-heavy bass for drum and bass, jungle. Deep, rolling.", "category": "bass", "tags": ["jungle", "bass", "dnb", "sub", "deep"]},
-        "jungle": {"description": "Jungle samples. Breakbeat, DnB drums.", "category": "breaks", "tags": ["jungle", "breakbeat", "dnb", "drums"]},
-        "juno": {"description": "Juno synth. Roland Juno character. Warm, analog, classic.", "category": "melodic", "tags": ["juno", "roland", "synth", "analog", "warm"]},
-        "jvbass": {"description": "JV bass. Roland JV synth bass. Punchy, electronic.", "category": "bass", "tags": ["jv", "roland", "bass", "synth", "punchy"]},
-
-        # K samples
-        "kicklinn": {"description": "Linn kick drums. LinnDrum kicks.", "category": "drums", "tags": ["linn", "kick", "drum-machine", "80s"]},
-        "koy": {"description": "Koy samples. Various sounds.", "category": "misc", "tags": ["koy", "various"]},
-        "kurt": {"description": "Kurt samples. Various sounds.", "category": "misc", "tags": ["kurt", "various"]},
-
-        # L samples
-        "latibro": {"description": "Latin brother samples. Latin percussion.", "category": "percussion", "tags": ["latin", "percussion", "brother"]},
-        "led": {"description": "LED sounds. Electronic, digital.", "category": "electronic", "tags": ["led", "electronic", "digital"]},
-        "less": {"description": "Less samples. Minimal sounds.", "category": "minimal", "tags": ["less", "minimal"]},
-        "lighter": {"description": "Lighter sounds. Click, flame.", "category": "sfx", "tags": ["lighter", "click", "flame"]},
-        "linnhats": {"description": "LinnDrum hi-hats. Classic 80s hats.", "category": "drums", "tags": ["linn", "hi-hat", "80s", "drum-machine"]},
-        "lt": {"description": "Low tom drum. Deep tom hit. Fills, tribal, floor tom.", "category": "drums", "tags": ["tom", "low", "deep", "tribal"]},
-
-        # M samples
-        "made": {"description": "Made samples. Various processed sounds.", "category": "misc", "tags": ["made", "processed", "various"]},
-        "made2": {"description": "Made samples variant 2.", "category": "misc", "tags": ["made", "variant"]},
-        "mash": {"description": "Mash samples. Mashup, mixed sounds.", "category": "electronic", "tags": ["mash", "mashup", "mixed"]},
-        "mash2": {"description": "Mash samples variant 2.", "category": "electronic", "tags": ["mash", "variant"]},
-        "metal": {"description": "Metal sounds. Heavy, metallic, industrial.", "category": "electronic", "tags": ["metal", "heavy", "metallic", "industrial"]},
-        "miniyeah": {"description": "Mini yeah vocal. Short vocal sample.", "category": "vocal", "tags": ["yeah", "vocal", "short"]},
-        "monsterb": {"description": "Monster bass. Heavy, aggressive bass.", "category": "bass", "tags": ["monster", "bass", "heavy", "aggressive"]},
-        "moog": {"description": "Moog synth. Moog synthesizer sounds. Fat, analog, bass-capable.", "category": "melodic", "tags": ["moog", "synth", "analog", "fat"]},
-        "mouth": {"description": "Mouth sounds. Human mouth percussion. Beatbox-like.", "category": "vocal", "tags": ["mouth", "beatbox", "percussion", "human"]},
-        "mp3": {"description": "MP3 artifacts. Compressed audio sounds.", "category": "electronic", "tags": ["mp3", "compressed", "artifact", "digital"]},
-        "msg": {"description": "Message sounds. Communication, notification.", "category": "sfx", "tags": ["message", "notification", "communication"]},
-        "mt": {"description": "Mid tom drum. Medium pitched tom. Fills.", "category": "drums", "tags": ["tom", "mid", "fills"]},
-        "mute": {"description": "Muted sounds. Dampened, quiet.", "category": "misc", "tags": ["mute", "dampened", "quiet"]},
-
-        # N samples
-        "newnotes": {"description": "New notes. Fresh melodic content.", "category": "melodic", "tags": ["notes", "melodic", "new"]},
-        "noise": {"description": "Noise samples. White noise, static. Texture, fills, risers.", "category": "electronic", "tags": ["noise", "white-noise", "static", "texture"]},
-        "noise2": {"description": "Noise variant 2. More noise textures.", "category": "electronic", "tags": ["noise", "variant", "texture"]},
-        "notes": {"description": "Notes samples. Melodic sounds.", "category": "melodic", "tags": ["notes", "melodic"]},
-        "num": {"description": "Number sounds. Numeric, counting audio.", "category": "vocal", "tags": ["num", "number", "count", "digits"]},
-        "numbers": {"description": "Number spoken samples. Count, digits.", "category": "vocal", "tags": ["numbers", "count", "digits", "speech"]},
-
-        # O samples
-        "oc": {"description": "OC samples. Various sounds.", "category": "misc", "tags": ["oc", "various"]},
-        "odx": {"description": "ODX samples. Electronic sounds.", "category": "electronic", "tags": ["odx", "electronic"]},
-        "off": {"description": "Off sounds. Switch off, ending.", "category": "sfx", "tags": ["off", "switch", "ending"]},
-        "outdoor": {"description": "Outdoor sounds. Nature, ambient.", "category": "sfx", "tags": ["outdoor", "nature", "ambient"]},
-
-        # P samples
-        "pad": {"description": "Synth pad. Sustained atmospheric sound. Chords, ambient, background.", "category": "pads", "tags": ["pad", "synth", "ambient", "atmospheric"]},
-        "padlong": {"description": "Long pad. Extended sustain pad. Drones, ambient, evolving.", "category": "pads", "tags": ["pad", "long", "drone", "ambient"]},
-        "pebbles": {"description": "Pebble sounds. Stones, gravel.", "category": "sfx", "tags": ["pebbles", "stones", "gravel"]},
-        "perc": {"description": "General percussion. Various percussion hits. Fills, accents.", "category": "percussion", "tags": ["percussion", "hits", "fills"]},
-        "peri": {"description": "Peri samples. Peripheral sounds.", "category": "misc", "tags": ["peri", "peripheral"]},
-        "pluck": {"description": "Plucked string. Generic pluck sound. Melodic, pizzicato-like.", "category": "melodic", "tags": ["pluck", "string", "melodic"]},
-        "popkick": {"description": "Pop kick drums. Modern pop kicks.", "category": "drums", "tags": ["kick", "pop", "modern"]},
-        "print": {"description": "Print sounds. Printer, mechanical.", "category": "sfx", "tags": ["print", "printer", "mechanical"]},
-        "proc": {"description": "Processed sounds. Manipulated audio.", "category": "electronic", "tags": ["processed", "manipulated"]},
-        "procshort": {"description": "Short processed sounds.", "category": "electronic", "tags": ["processed", "short"]},
-        "psr": {"description": "PSR keyboard sounds. Yamaha PSR.", "category": "melodic", "tags": ["psr", "yamaha", "keyboard"]},
-
-        # R samples
-        "rave": {"description": "Rave sounds. 90s rave, stabs, hits.", "category": "electronic", "tags": ["rave", "90s", "stabs", "rave-culture"]},
-        "rave2": {"description": "Rave sounds variant 2. More rave content.", "category": "electronic", "tags": ["rave", "variant"]},
-        "ravemono": {"description": "Rave mono sounds. Monophonic rave.", "category": "electronic", "tags": ["rave", "mono"]},
-        "realclaps": {"description": "Real claps. Acoustic hand claps.", "category": "drums", "tags": ["clap", "real", "acoustic"]},
-        "reverbkick": {"description": "Reverb kick. Kicks with reverb tail.", "category": "drums", "tags": ["kick", "reverb", "tail"]},
-        "rm": {"description": "RM samples. Ring modulation sounds.", "category": "electronic", "tags": ["rm", "ring-modulation"]},
-        "rs": {"description": "Rimshot samples. Sharp rim hits.", "category": "drums", "tags": ["rimshot", "rim", "sharp"]},
-
-        # S samples
-        "sax": {"description": "Saxophone samples. Jazz, R&B sax.", "category": "melodic", "tags": ["saxophone", "sax", "jazz", "r&b"]},
-        "sd": {"description": "Snare drum. Sharp, cracking backbeat. Essential drum sound.", "category": "drums", "tags": ["snare", "drums", "backbeat"]},
-        "seawolf": {"description": "Sea wolf sounds. Ocean, nautical.", "category": "sfx", "tags": ["sea", "wolf", "ocean", "nautical"]},
-        "sequential": {"description": "Sequential sounds. Ordered, sequenced.", "category": "electronic", "tags": ["sequential", "ordered", "sequence"]},
-        "sf": {"description": "SF sounds. Science fiction.", "category": "sfx", "tags": ["sf", "sci-fi", "science-fiction"]},
-        "sheffield": {"description": "Sheffield sounds. UK electronic.", "category": "electronic", "tags": ["sheffield", "uk", "electronic"]},
-        "short": {"description": "Short sounds. Brief, staccato.", "category": "misc", "tags": ["short", "brief", "staccato"]},
-        "sid": {"description": "SID chip sounds. C64, 8-bit.", "category": "electronic", "tags": ["sid", "c64", "8-bit", "chiptune"]},
-        "simplesine": {"description": "Simple sine wave. Pure, clean sine tone. Fundamental, sub bass, test tone.", "category": "melodic", "tags": ["sine", "simple", "pure", "test-tone", "sub"]},
-        "sine": {"description": "Sine wave samples. Pure tone.", "category": "melodic", "tags": ["sine", "pure", "tone"]},
-        "sitar": {"description": "Sitar samples. Indian string instrument. World, psychedelic.", "category": "world", "tags": ["sitar", "indian", "world"]},
-        "sn": {"description": "Snare drum alternate. Different snare character.", "category": "drums", "tags": ["snare", "alternate"]},
-        "space": {"description": "Space sounds. Cosmic, sci-fi.", "category": "sfx", "tags": ["space", "cosmic", "sci-fi"]},
-        "speakspell": {"description": "Speak and spell sounds. Retro toy.", "category": "vocal", "tags": ["speak-spell", "retro", "toy"]},
-        "speech": {"description": "Speech samples. Spoken word.", "category": "vocal", "tags": ["speech", "spoken", "word"]},
-        "speechless": {"description": "Speechless sounds. Non-verbal.", "category": "vocal", "tags": ["speechless", "non-verbal"]},
-        "speedupdown": {"description": "Speed up/down sounds. Tempo effects.", "category": "sfx", "tags": ["speed", "tempo", "effect"]},
-        "stab": {"description": "Synth stab. Short chord hit. House, disco, rhythmic chords.", "category": "melodic", "tags": ["stab", "chord", "house"]},
-        "stomp": {"description": "Stomp sounds. Foot stomps, body percussion.", "category": "percussion", "tags": ["stomp", "foot", "body-percussion"]},
-        "subroc3d": {"description": "Sub Roc 3D game sounds. Retro arcade.", "category": "electronic", "tags": ["subroc", "arcade", "retro", "game"]},
-        "sugar": {"description": "Sugar samples. Sweet, pleasant sounds.", "category": "misc", "tags": ["sugar", "sweet", "pleasant"]},
-        "sundance": {"description": "Sundance samples. Festival, outdoor.", "category": "misc", "tags": ["sundance", "festival"]},
-
-        # T samples
-        "tabla": {"description": "Tabla drums. Indian classical percussion. Intricate, melodic drums.", "category": "world", "tags": ["tabla", "indian", "percussion"]},
-        "tabla2": {"description": "Tabla drums variant. More tabla sounds.", "category": "world", "tags": ["tabla", "indian", "variant"]},
-        "tablex": {"description": "Tabla extended. More tabla samples.", "category": "world", "tags": ["tabla", "extended"]},
-        "tacscan": {"description": "Tac Scan game sounds. Retro arcade.", "category": "electronic", "tags": ["tacscan", "arcade", "retro"]},
-        "tech": {"description": "Tech sounds. Technical, electronic.", "category": "electronic", "tags": ["tech", "technical", "electronic"]},
-        "techno": {"description": "Techno samples. Techno drums, sounds.", "category": "electronic", "tags": ["techno", "drums", "electronic"]},
-        "tink": {"description": "Tink sounds. Small metallic hits.", "category": "percussion", "tags": ["tink", "metallic", "small"]},
-        "tok": {"description": "Tok sounds. Click, tock.", "category": "percussion", "tags": ["tok", "click", "tock"]},
-        "toys": {"description": "Toy sounds. Playful, childlike.", "category": "sfx", "tags": ["toys", "playful", "childlike"]},
-        "trump": {"description": "Trump sounds. Trumpet-like.", "category": "melodic", "tags": ["trump", "trumpet-like"]},
-
-        # U samples
-        "ul": {"description": "UL samples. Various sounds.", "category": "misc", "tags": ["ul", "various"]},
-        "ulgab": {"description": "UL gabber sounds. Hardcore.", "category": "electronic", "tags": ["ul", "gabber", "hardcore"]},
-        "uxay": {"description": "Uxay samples. Experimental.", "category": "experimental", "tags": ["uxay", "experimental"]},
-
-        # V samples
-        "v": {"description": "V sample collection. Various sounds.", "category": "misc", "tags": ["v", "collection"]},
-        "voodoo": {"description": "Voodoo sounds. Dark, mystical.", "category": "sfx", "tags": ["voodoo", "dark", "mystical"]},
-
-        # W samples
-        "wind": {"description": "Wind sounds. Atmospheric, nature.", "category": "sfx", "tags": ["wind", "atmospheric", "nature"]},
-        "wobble": {"description": "Wobble bass. Dubstep wobble sound.", "category": "bass", "tags": ["wobble", "dubstep", "bass"]},
-        "world": {"description": "World music samples. Global, ethnic.", "category": "world", "tags": ["world", "global", "ethnic"]},
-
-        # X-Y samples
-        "xmas": {"description": "Christmas sounds. Holiday, festive.", "category": "sfx", "tags": ["christmas", "holiday", "festive"]},
-        "yeah": {"description": "Yeah vocal samples. Exclamation, hype.", "category": "vocal", "tags": ["yeah", "vocal", "exclamation", "hype"]},
-    }
+    sounds = build_catalog()
+    with open(cache_path, "wb") as f:
+        pickle.dump([tuple(row) for row in sounds], f, protocol=pickle.HIGHEST_PROTOCOL)
+    return sounds
 
-    # Add dirt samples to catalog
-    for name, data in dirt_samples.items():
-        sounds.append({
-            "id": name,
-            "name": name,
-            "description": data["description"],
-            "source": "dirt-samples",
-            "category": data["category"],
-            "tags": data["tags"],
-            "example": f's("{name}")'
-        })
-
-    # ===========================================
-    # BUILT-IN SYNTHS (always available)
-    # ===========================================
-
-    builtin_synths = {
-        "sine": {
-            "description": "Sine wave oscillator. Pure, smooth, fundamental tone. Sub bass, pure tones, gentle.",
-            "category": "oscillator",
-            "tags": ["sine", "oscillator", "pure", "smooth", "sub", "gentle", "fundamental"],
-            "example": 'note("c4 e4 g4").s("sine")'
-        },
-        "saw": {
-            "description": "Sawtooth wave oscillator. Bright, buzzy, rich harmonics. Classic synth lead, bass.",
-            "category": "oscillator",
-            "tags": ["sawtooth", "saw", "oscillator", "bright", "buzzy", "harmonics", "lead"],
-            "example": 'note("c4 e4 g4").s("saw")'
-        },
-        "sawtooth": {
-            "description": "Sawtooth wave oscillator. Alias for saw. Bright, buzzy, rich in harmonics.",
-            "category": "oscillator",
-            "tags": ["sawtooth", "saw", "oscillator", "bright", "buzzy", "harmonics"],
-            "example": 'note("c4 e4 g4").s("sawtooth")'
-        },
-        "square": {
-            "description": "Square wave oscillator. Hollow, woody, retro. Chiptune, 8-bit, video game.",
-            "category": "oscillator",
-            "tags": ["square", "oscillator", "hollow", "woody", "retro", "chiptune", "8-bit"],
-            "example": 'note("c4 e4 g4").s("square")'
-        },
-        "triangle": {
-            "description": "Triangle wave oscillator. Soft, mellow, between sine and square. Gentle leads.",
-            "category": "oscillator",
-            "tags": ["triangle", "oscillator", "soft", "mellow", "gentle"],
-            "example": 'note("c4 e4 g4").s("triangle")'
-        },
-        "tri": {
-            "description": "Triangle wave oscillator. Alias for triangle. Soft, mellow tone.",
-            "category": "oscillator",
-            "tags": ["triangle", "tri", "oscillator", "soft", "mellow"],
-            "example": 'note("c4 e4 g4").s("tri")'
-        },
-    }
 
-    # Add built-in synths to catalog
-    for name, data in builtin_synths.items():
-        sounds.append({
-            "id": name,
-            "name": name,
-            "description": data["description"],
-            "source": "builtin",
-            "category": data["category"],
-            "tags": data["tags"],
-            "example": data["example"]
-        })
-
-    # ===========================================
-    # TIDAL DRUM MACHINES (72 machines)
-    # Use with .bank() function in Strudel
-    # ===========================================
-
-    drum_machines = {
-        # A
-        "AJKPercusyn": {"description": "AJK Percusyn drum synth. Analog percussion synthesizer. Unique electronic drums.", "tags": ["percusyn", "analog", "synth-drums", "electronic"]},
-        "AkaiLinn": {"description": "Akai Linn MPC hybrid. Combines Akai sampling with Linn character. Hip-hop, R&B.", "tags": ["akai", "linn", "mpc", "hip-hop", "r&b", "sampling"]},
-        "AkaiMPC60": {"description": "Akai MPC60 drum machine. Classic hip-hop sampler. Boom bap, golden era.", "tags": ["akai", "mpc60", "hip-hop", "boom-bap", "sampler", "classic"]},
-        "AkaiXR10": {"description": "Akai XR10 drum machine. 90s Akai drums. Punchy electronic kit.", "tags": ["akai", "xr10", "90s", "electronic", "punchy"]},
-        "AlesisHR16": {"description": "Alesis HR-16 drum machine. 80s/90s digital drums. Clean, punchy hits.", "tags": ["alesis", "hr16", "digital", "80s", "90s", "punchy"]},
-        "AlesisSR16": {"description": "Alesis SR-16 drum machine. Popular 90s drums. Versatile, studio standard.", "tags": ["alesis", "sr16", "90s", "studio", "versatile"]},
-
-        # B
-        "BossDR110": {"description": "Boss DR-110 Dr. Rhythm. Compact analog drums. Lo-fi, characterful.", "tags": ["boss", "dr110", "analog", "lo-fi", "compact"]},
-        "BossDR220": {"description": "Boss DR-220 Dr. Rhythm. 80s digital drums. Clean, versatile.", "tags": ["boss", "dr220", "digital", "80s", "clean"]},
-        "BossDR55": {"description": "Boss DR-55 Dr. Rhythm. Early analog drum machine. Simple, punchy, classic.", "tags": ["boss", "dr55", "analog", "classic", "simple"]},
-        "BossDR550": {"description": "Boss DR-550 Dr. Rhythm. 90s digital drums. Wide sound selection.", "tags": ["boss", "dr550", "digital", "90s", "versatile"]},
-        "BossDR660": {"description": "Boss DR-660 Dr. Rhythm. Advanced 90s drums. High-quality samples.", "tags": ["boss", "dr660", "digital", "90s", "high-quality"]},
-
-        # C
-        "CasioRZ1": {"description": "Casio RZ-1 sampling drum machine. 80s sampler with built-in sounds. Quirky, nostalgic.", "tags": ["casio", "rz1", "sampler", "80s", "quirky"]},
-        "CasioSK1": {"description": "Casio SK-1 sampling keyboard drums. Lo-fi, toy-like. Charming, nostalgic.", "tags": ["casio", "sk1", "lo-fi", "toy", "nostalgic"]},
-        "CasioVL1": {"description": "Casio VL-1 VL-Tone drums. Iconic toy calculator synth drums. 8-bit, retro.", "tags": ["casio", "vl1", "toy", "8-bit", "retro", "calculator"]},
-
-        # D
-        "DoepferMS404": {"description": "Doepfer MS-404 modular drums. Analog modular synth drums. Experimental, raw.", "tags": ["doepfer", "ms404", "modular", "analog", "experimental"]},
-
-        # E
-        "EmuDrumulator": {"description": "E-mu Drumulator. Classic 80s digital drums. Electro, hip-hop essential.", "tags": ["emu", "drumulator", "80s", "electro", "hip-hop", "digital"]},
-        "EmuModular": {"description": "E-mu Modular drum sounds. Modular synth drums. Experimental, unique.", "tags": ["emu", "modular", "synth", "experimental", "unique"]},
-        "EmuSP12": {"description": "E-mu SP-12 sampler drums. Hip-hop classic. Boom bap, punchy, gritty.", "tags": ["emu", "sp12", "hip-hop", "boom-bap", "punchy", "sampler"]},
-
-        # K
-        "KorgDDM110": {"description": "Korg DDM-110 Super Drums. 80s digital drums. Punchy, characterful.", "tags": ["korg", "ddm110", "digital", "80s", "punchy"]},
-        "KorgKPR77": {"description": "Korg KPR-77 drum machine. Analog drums, 80s character. Warm, punchy.", "tags": ["korg", "kpr77", "analog", "80s", "warm"]},
-        "KorgKR55": {"description": "Korg KR-55 analog drums. Vintage rhythm machine. Warm, organic feel.", "tags": ["korg", "kr55", "analog", "vintage", "warm"]},
-        "KorgKRZ": {"description": "Korg KRZ drum sounds. Korg rhythm sounds. Versatile, clean.", "tags": ["korg", "krz", "rhythm", "versatile"]},
-        "KorgM1": {"description": "Korg M1 drum sounds. Iconic 80s workstation drums. Pop, dance, studio.", "tags": ["korg", "m1", "workstation", "80s", "pop", "dance"]},
-        "KorgMinipops": {"description": "Korg Minipops rhythm machine. Vintage analog drums. Organ-combo style, retro.", "tags": ["korg", "minipops", "analog", "vintage", "retro"]},
-        "KorgPoly800": {"description": "Korg Poly-800 drums. 80s polysynth drums. Digital, characterful.", "tags": ["korg", "poly800", "80s", "digital", "synth"]},
-        "KorgT3": {"description": "Korg T3 workstation drums. 90s workstation sounds. Clean, professional.", "tags": ["korg", "t3", "workstation", "90s", "professional"]},
-
-        # L
-        "Linn9000": {"description": "Linn 9000 drum machine. Advanced Linn drums. Sampling, sequencing, 80s.", "tags": ["linn", "9000", "80s", "sampling", "sequencing"]},
-        "LinnDrum": {"description": "LinnDrum classic. Iconic 80s digital drums. Pop, rock, hip-hop essential.", "tags": ["linndrum", "linn", "80s", "pop", "rock", "iconic"]},
-        "LinnLM1": {"description": "Linn LM-1 first Linn drum machine. Revolutionary digital drums. Prince, 80s pop.", "tags": ["linn", "lm1", "80s", "pop", "revolutionary", "prince"]},
-        "LinnLM2": {"description": "Linn LM-2 drum machine. Refined LM-1. 80s pop, rock drums.", "tags": ["linn", "lm2", "80s", "pop", "rock"]},
-
-        # M
-        "MFB512": {"description": "MFB-512 analog drum machine. German analog drums. Punchy, raw, electronic.", "tags": ["mfb", "512", "analog", "german", "electronic", "raw"]},
-        "MPC1000": {"description": "Akai MPC1000 drums. 2000s MPC. Hip-hop, modern production.", "tags": ["akai", "mpc1000", "2000s", "hip-hop", "modern"]},
-        "MoogConcertMateMG1": {"description": "Moog Concertmate MG-1 drums. Moog analog synth drums. Warm, characterful.", "tags": ["moog", "concertmate", "mg1", "analog", "warm"]},
-
-        # O
-        "OberheimDMX": {"description": "Oberheim DMX drum machine. 80s classic. Electro, hip-hop, new wave.", "tags": ["oberheim", "dmx", "80s", "electro", "hip-hop", "new-wave"]},
-
-        # R
-        "RhodesPolaris": {"description": "Rhodes Polaris drums. Rhodes synth drum sounds. Warm, analog character.", "tags": ["rhodes", "polaris", "synth", "analog", "warm"]},
-        "RhythmAce": {"description": "Ace Tone Rhythm Ace. Vintage organ rhythm box. 60s/70s, retro, warm.", "tags": ["ace-tone", "rhythm-ace", "vintage", "60s", "70s", "organ"]},
-        "RolandCompurhythm1000": {"description": "Roland CR-1000 Compurhythm. Advanced preset drums. Clean, versatile.", "tags": ["roland", "cr1000", "compurhythm", "preset", "clean"]},
-        "RolandCompurhythm78": {"description": "Roland CR-78 Compurhythm. First programmable drum machine. Vintage, iconic.", "tags": ["roland", "cr78", "compurhythm", "vintage", "iconic", "programmable"]},
-        "RolandCompurhythm8000": {"description": "Roland CR-8000 Compurhythm. Analog preset drums. Warm, classic.", "tags": ["roland", "cr8000", "compurhythm", "analog", "warm"]},
-        "RolandD110": {"description": "Roland D-110 drum sounds. LA synthesis drums. 80s digital, clean.", "tags": ["roland", "d110", "la-synthesis", "80s", "digital"]},
-        "RolandD70": {"description": "Roland D-70 drums. 90s workstation drums. Versatile, professional.", "tags": ["roland", "d70", "workstation", "90s", "professional"]},
-        "RolandDDR30": {"description": "Roland DDR-30 drum machine. Digital drums. Clean, punchy.", "tags": ["roland", "ddr30", "digital", "punchy"]},
-        "RolandJD990": {"description": "Roland JD-990 drums. High-end 90s synth drums. Lush, professional.", "tags": ["roland", "jd990", "90s", "synth", "professional"]},
-        "RolandMC202": {"description": "Roland MC-202 drums. Micro Composer drums. Analog, TB-303 era.", "tags": ["roland", "mc202", "analog", "micro-composer"]},
-        "RolandMC303": {"description": "Roland MC-303 Groovebox drums. 90s dance machine. House, techno.", "tags": ["roland", "mc303", "groovebox", "90s", "house", "techno"]},
-        "RolandMT32": {"description": "Roland MT-32 drums. LA synthesis module drums. 80s game soundtracks.", "tags": ["roland", "mt32", "la-synthesis", "80s", "game"]},
-        "RolandR8": {"description": "Roland R-8 Human Rhythm Composer. High-end 80s drums. Realistic, versatile.", "tags": ["roland", "r8", "80s", "realistic", "human-rhythm"]},
-        "RolandS50": {"description": "Roland S-50 sampler drums. 80s sampler. Warm, vintage digital.", "tags": ["roland", "s50", "sampler", "80s", "warm"]},
-        "RolandSH09": {"description": "Roland SH-09 synth drums. Analog monosynth drums. Raw, punchy.", "tags": ["roland", "sh09", "analog", "monosynth", "raw"]},
-        "RolandSystem100": {"description": "Roland System-100 modular drums. Semi-modular analog. Raw, experimental.", "tags": ["roland", "system100", "modular", "analog", "experimental"]},
-        "RolandTR505": {"description": "Roland TR-505 drum machine. Digital successor to 606. Clean, usable.", "tags": ["roland", "tr505", "digital", "clean"]},
-        "RolandTR606": {"description": "Roland TR-606 Drumatix. Analog companion to TB-303. Acid house essential.", "tags": ["roland", "tr606", "analog", "acid", "house", "drumatix"]},
-        "RolandTR626": {"description": "Roland TR-626 Rhythm Composer. Digital drums. Latin sounds, 80s.", "tags": ["roland", "tr626", "digital", "latin", "80s"]},
-        "RolandTR707": {"description": "Roland TR-707 drum machine. Digital, clean 80s drums. Pop, dance.", "tags": ["roland", "tr707", "digital", "80s", "pop", "dance"]},
-        "RolandTR727": {"description": "Roland TR-727 Latin percussion. Latin version of 707. Congas, bongos, timbales.", "tags": ["roland", "tr727", "latin", "percussion", "congas", "bongos"]},
-        "RolandTR808": {"description": "Roland TR-808 Rhythm Composer. THE iconic drum machine. Hip-hop, electronic essential.", "tags": ["roland", "tr808", "808", "hip-hop", "electronic", "iconic", "classic"]},
-        "RolandTR909": {"description": "Roland TR-909 Rhythm Composer. House and techno essential. Punchy, powerful.", "tags": ["roland", "tr909", "909", "house", "techno", "essential", "punchy"]},
-
-        # S
-        "SakataDPM48": {"description": "Sakata DPM-48 drums. Rare Japanese drums. Unique, characterful.", "tags": ["sakata", "dpm48", "japanese", "rare", "unique"]},
-        "SequentialCircuitsDrumtracks": {"description": "Sequential Circuits Drumtracks. 80s digital drums. Clean, usable.", "tags": ["sequential", "drumtracks", "80s", "digital", "clean"]},
-        "SequentialCircuitsTom": {"description": "Sequential Circuits TOM. Analog drum synth. Tunable, unique.", "tags": ["sequential", "tom", "analog", "drum-synth", "tunable"]},
-        "SergeModular": {"description": "Serge Modular drums. Esoteric modular drums. Experimental, unique.", "tags": ["serge", "modular", "experimental", "unique", "esoteric"]},
-        "SimmonsSDS400": {"description": "Simmons SDS-400 electronic drums. 80s electronic drums. Iconic hex pads.", "tags": ["simmons", "sds400", "electronic", "80s", "hex-pads"]},
-        "SimmonsSDS5": {"description": "Simmons SDS-5 electronic drums. THE 80s electronic drum sound. Iconic.", "tags": ["simmons", "sds5", "electronic", "80s", "iconic"]},
-        "SoundmastersR88": {"description": "Soundmaster SR-88 drums. Budget analog drums. Lo-fi, characterful.", "tags": ["soundmaster", "sr88", "analog", "lo-fi", "budget"]},
-
-        # U-V
-        "UnivoxMicroRhythmer12": {"description": "Univox Micro Rhythmer 12. Vintage preset drums. 70s, retro.", "tags": ["univox", "micro-rhythmer", "vintage", "70s", "preset"]},
-        "ViscoSpaceDrum": {"description": "Visco Space Drum. Unique electronic drums. Spacey, experimental.", "tags": ["visco", "space-drum", "electronic", "spacey", "experimental"]},
-
-        # X
-        "XdrumLM8953": {"description": "X-drum LM-8953. Custom drum sounds. Electronic, unique.", "tags": ["xdrum", "lm8953", "electronic", "custom"]},
-
-        # Y
-        "YamahaRM50": {"description": "Yamaha RM50 drum module. 90s drum module. High-quality, versatile.", "tags": ["yamaha", "rm50", "90s", "module", "high-quality"]},
-        "YamahaRX21": {"description": "Yamaha RX21 drum machine. Budget 80s drums. Digital, punchy.", "tags": ["yamaha", "rx21", "80s", "digital", "budget"]},
-        "YamahaRX5": {"description": "Yamaha RX5 drum machine. Premium 80s drums. High-quality samples.", "tags": ["yamaha", "rx5", "80s", "digital", "premium"]},
-        "YamahaRY30": {"description": "Yamaha RY30 drum machine. 90s AWM drums. Versatile, modern.", "tags": ["yamaha", "ry30", "90s", "awm", "versatile"]},
-        "YamahaTG33": {"description": "Yamaha TG33 drums. Vector synthesis drums. Unique, evolving.", "tags": ["yamaha", "tg33", "vector", "synthesis", "unique"]},
-    }
+@functools.cache
+def _sorted_ids() -> tuple[str, ...]:
+    return tuple(sorted(sound.id for sound in build_catalog()))
 
-    # Standard kit sounds each drum machine supports
-    kit_sounds = ["bd", "sd", "hh", "oh", "cp", "lt", "mt", "ht", "cy", "cb", "rs", "cr"]
-
-    # Add drum machines to catalog (each machine as one entry with kit description)
-    for machine_name, data in drum_machines.items():
-        sounds.append({
-            "id": machine_name.lower(),
-            "name": machine_name,
-            "description": data["description"] + f" Kit includes: {', '.join(kit_sounds)}.",
-            "source": "drum-machines",
-            "category": "drum_machine",
-            "tags": data["tags"] + ["drum-machine", "kit"],
-            "example": f's("bd sd hh hh").bank("{machine_name}")'
-        })
-
-    # ===========================================
-    # VCSL (Versilian Community Sample Library)
-    # High-quality acoustic samples, CC0 licensed
-    # ===========================================
-
-    vcsl_instruments = {
-        # Percussion - Drums
-        "ballwhistle": {"description": "Ball whistle percussion. Sports referee whistle. Shrill, attention-getting.", "category": "percussion", "tags": ["whistle", "ball", "sports", "sfx"]},
-        "bassdrum1": {"description": "VCSL acoustic bass drum 1. Deep orchestral kick. Concert, classical.", "category": "percussion", "tags": ["bass-drum", "acoustic", "orchestral", "deep"]},
-        "bassdrum2": {"description": "VCSL acoustic bass drum 2. Variant with different character. Orchestral.", "category": "percussion", "tags": ["bass-drum", "acoustic", "orchestral", "variant"]},
-        "bongo": {"description": "VCSL bongo drums. Hand drums, Latin percussion. Warm, organic.", "category": "percussion", "tags": ["bongo", "hand-drum", "latin", "organic"]},
-        "conga": {"description": "VCSL conga drums. Tall hand drums. Latin, Afro-Cuban, warm.", "category": "percussion", "tags": ["conga", "hand-drum", "latin", "afro-cuban"]},
-        "darbuka": {"description": "VCSL darbuka. Middle Eastern goblet drum. Arabic, Turkish, belly dance.", "category": "percussion", "tags": ["darbuka", "middle-eastern", "goblet", "arabic"]},
-        "framedrum": {"description": "VCSL frame drum. Large circular drum. World, shamanic, bodhran-like.", "category": "percussion", "tags": ["frame-drum", "world", "shamanic", "circular"]},
-
-        # Percussion - Snares & Toms
-        "snare_modern": {"description": "VCSL modern snare drum. Contemporary snare sound. Versatile, studio.", "category": "percussion", "tags": ["snare", "modern", "studio", "versatile"]},
-        "snare_hi": {"description": "VCSL high-pitched snare. Bright, cutting snare. Piccolo-style.", "category": "percussion", "tags": ["snare", "high", "bright", "piccolo"]},
-        "snare_low": {"description": "VCSL low snare drum. Deep snare sound. Fat, warm.", "category": "percussion", "tags": ["snare", "low", "deep", "warm"]},
-        "snare_rim": {"description": "VCSL snare rim shot. Rim click/shot. Sharp, accented.", "category": "percussion", "tags": ["snare", "rim", "rimshot", "sharp"]},
-        "tom_mallet": {"description": "VCSL tom with mallet. Soft attack tom. Orchestral, melodic.", "category": "percussion", "tags": ["tom", "mallet", "soft", "orchestral"]},
-        "tom_stick": {"description": "VCSL tom with stick. Standard tom hit. Rock, pop drums.", "category": "percussion", "tags": ["tom", "stick", "rock", "pop"]},
-        "tom_rim": {"description": "VCSL tom rim. Tom rim click. Accent, variation.", "category": "percussion", "tags": ["tom", "rim", "accent"]},
-        "tom2_mallet": {"description": "VCSL tom 2 with mallet. Second tom, mallet hit.", "category": "percussion", "tags": ["tom", "mallet", "variant"]},
-        "tom2_stick": {"description": "VCSL tom 2 with stick. Second tom, stick hit.", "category": "percussion", "tags": ["tom", "stick", "variant"]},
-        "tom2_rim": {"description": "VCSL tom 2 rim. Second tom rim click.", "category": "percussion", "tags": ["tom", "rim", "variant"]},
-
-        # Percussion - Timpani
-        "timpani": {"description": "VCSL timpani. Orchestral kettle drums. Classical, dramatic.", "category": "percussion", "tags": ["timpani", "orchestral", "classical", "dramatic"]},
-        "timpani_roll": {"description": "VCSL timpani roll. Sustained timpani tremolo. Building tension.", "category": "percussion", "tags": ["timpani", "roll", "tremolo", "tension"]},
-        "timpani2": {"description": "VCSL timpani 2. Second timpani variant. Different tuning.", "category": "percussion", "tags": ["timpani", "variant", "orchestral"]},
-
-        # Woodwinds - Recorders
-        "recorder_alto_stacc": {"description": "VCSL alto recorder staccato. Short, detached notes. Renaissance.", "category": "woodwind", "tags": ["recorder", "alto", "staccato", "renaissance"]},
-        "recorder_alto_vib": {"description": "VCSL alto recorder vibrato. Expressive with vibrato. Melodic.", "category": "woodwind", "tags": ["recorder", "alto", "vibrato", "expressive"]},
-        "recorder_alto_sus": {"description": "VCSL alto recorder sustained. Long, held notes. Legato.", "category": "woodwind", "tags": ["recorder", "alto", "sustained", "legato"]},
-        "recorder_bass_stacc": {"description": "VCSL bass recorder staccato. Low recorder, short notes.", "category": "woodwind", "tags": ["recorder", "bass", "staccato", "low"]},
-        "recorder_bass_vib": {"description": "VCSL bass recorder vibrato. Low recorder with vibrato.", "category": "woodwind", "tags": ["recorder", "bass", "vibrato", "low"]},
-        "recorder_bass_sus": {"description": "VCSL bass recorder sustained. Low recorder, long notes.", "category": "woodwind", "tags": ["recorder", "bass", "sustained", "low"]},
-        "recorder_soprano_stacc": {"description": "VCSL soprano recorder staccato. High recorder, short.", "category": "woodwind", "tags": ["recorder", "soprano", "staccato", "high"]},
-        "recorder_soprano_sus": {"description": "VCSL soprano recorder sustained. High recorder, long.", "category": "woodwind", "tags": ["recorder", "soprano", "sustained", "high"]},
-        "recorder_tenor_stacc": {"description": "VCSL tenor recorder staccato. Mid-range recorder, short.", "category": "woodwind", "tags": ["recorder", "tenor", "staccato"]},
-        "recorder_tenor_vib": {"description": "VCSL tenor recorder vibrato. Mid-range with vibrato.", "category": "woodwind", "tags": ["recorder", "tenor", "vibrato"]},
-        "recorder_tenor_sus": {"description": "VCSL tenor recorder sustained. Mid-range, long notes.", "category": "woodwind", "tags": ["recorder", "tenor", "sustained"]},
-
-        # Woodwinds - Ocarinas
-        "ocarina_small_stacc": {"description": "VCSL small ocarina staccato. Small clay flute, short notes.", "category": "woodwind", "tags": ["ocarina", "small", "staccato", "clay"]},
-        "ocarina_small": {"description": "VCSL small ocarina. High-pitched clay wind instrument.", "category": "woodwind", "tags": ["ocarina", "small", "high", "clay"]},
-        "ocarina": {"description": "VCSL ocarina. Clay wind instrument. Zelda-like, pure, innocent.", "category": "woodwind", "tags": ["ocarina", "clay", "pure", "zelda"]},
-        "ocarina_vib": {"description": "VCSL ocarina vibrato. Ocarina with expressive vibrato.", "category": "woodwind", "tags": ["ocarina", "vibrato", "expressive"]},
-
-        # Woodwinds - Saxophones
-        "saxello": {"description": "VCSL saxello. Rare curved soprano sax. Unique, jazz.", "category": "woodwind", "tags": ["saxello", "saxophone", "soprano", "jazz", "rare"]},
-        "saxello_stacc": {"description": "VCSL saxello staccato. Short, punchy sax notes.", "category": "woodwind", "tags": ["saxello", "saxophone", "staccato"]},
-        "saxello_vib": {"description": "VCSL saxello vibrato. Expressive saxello with vibrato.", "category": "woodwind", "tags": ["saxello", "saxophone", "vibrato"]},
-        "sax": {"description": "VCSL tenor saxophone. Classic jazz/R&B sax. Rich, soulful.", "category": "woodwind", "tags": ["saxophone", "tenor", "jazz", "soulful"]},
-        "sax_stacc": {"description": "VCSL tenor sax staccato. Short, punchy sax hits.", "category": "woodwind", "tags": ["saxophone", "tenor", "staccato"]},
-        "sax_vib": {"description": "VCSL tenor sax vibrato. Expressive sax with vibrato.", "category": "woodwind", "tags": ["saxophone", "tenor", "vibrato"]},
-
-        # Keyboards - Organs
-        "pipeorgan_loud_pedal": {"description": "VCSL pipe organ loud pedal. Deep bass pedal, full power.", "category": "organ", "tags": ["organ", "pipe", "pedal", "loud", "bass"]},
-        "pipeorgan_loud": {"description": "VCSL pipe organ loud. Full registration, powerful.", "category": "organ", "tags": ["organ", "pipe", "loud", "powerful"]},
-        "pipeorgan_quiet_pedal": {"description": "VCSL pipe organ quiet pedal. Soft bass pedal.", "category": "organ", "tags": ["organ", "pipe", "pedal", "quiet", "soft"]},
-        "pipeorgan_quiet": {"description": "VCSL pipe organ quiet. Soft registration, intimate.", "category": "organ", "tags": ["organ", "pipe", "quiet", "intimate"]},
-        "organ_4inch": {"description": "VCSL 4-inch organ pipes. Small organ pipes, high.", "category": "organ", "tags": ["organ", "small", "high", "pipes"]},
-        "organ_8inch": {"description": "VCSL 8-inch organ pipes. Standard organ pipes.", "category": "organ", "tags": ["organ", "standard", "pipes"]},
-        "organ_full": {"description": "VCSL full organ. Complete organ registration. Rich, full.", "category": "organ", "tags": ["organ", "full", "rich", "complete"]},
-
-        # Keyboards - Synths & Pianos
-        "clavisynth": {"description": "VCSL clavisynth. Clavinet/synth hybrid. Funky, electronic.", "category": "keyboards", "tags": ["clavinet", "synth", "funky", "electronic"]},
-        "fmpiano": {"description": "VCSL FM piano. DX7-style FM electric piano. 80s, digital, bright.", "category": "keyboards", "tags": ["piano", "fm", "dx7", "80s", "digital"]},
-        "piano1": {"description": "VCSL piano 1. Acoustic grand piano. Classical, versatile.", "category": "keyboards", "tags": ["piano", "acoustic", "grand", "classical"]},
-        "kawai": {"description": "VCSL Kawai piano. Kawai grand piano sample. Bright, clear.", "category": "keyboards", "tags": ["piano", "kawai", "grand", "bright"]},
-        "steinway": {"description": "VCSL Steinway piano. Steinway grand piano. Rich, warm, concert.", "category": "keyboards", "tags": ["piano", "steinway", "grand", "concert", "rich"]},
-
-        # Strings - Harps & Plucked
-        "harp": {"description": "VCSL concert harp. Classical pedal harp. Ethereal, sweeping.", "category": "strings", "tags": ["harp", "concert", "classical", "ethereal"]},
-        "folkharp": {"description": "VCSL folk harp. Celtic/lever harp. Folk, Celtic, intimate.", "category": "strings", "tags": ["harp", "folk", "celtic", "lever"]},
-        "strumstick": {"description": "VCSL strumstick. Simple Appalachian string instrument. Folk, drone.", "category": "strings", "tags": ["strumstick", "appalachian", "folk", "drone"]},
-        "psaltery_pluck": {"description": "VCSL psaltery plucked. Medieval plucked zither. Plucky, ancient.", "category": "strings", "tags": ["psaltery", "plucked", "medieval", "zither"]},
-        "psaltery_spiccato": {"description": "VCSL psaltery spiccato. Short bowed psaltery notes.", "category": "strings", "tags": ["psaltery", "spiccato", "bowed", "short"]},
-        "psaltery_bow": {"description": "VCSL bowed psaltery. Sustained bowed psaltery. Ethereal, haunting.", "category": "strings", "tags": ["psaltery", "bowed", "ethereal", "haunting"]},
-
-        # World Strings
-        "dantranh": {"description": "VCSL dan tranh. Vietnamese zither. Asian, traditional, delicate.", "category": "world", "tags": ["dan-tranh", "vietnamese", "zither", "asian"]},
-        "dantranh_tremolo": {"description": "VCSL dan tranh tremolo. Tremolo technique on dan tranh.", "category": "world", "tags": ["dan-tranh", "tremolo", "vietnamese"]},
-        "dantranh_vibrato": {"description": "VCSL dan tranh vibrato. Vibrato technique on dan tranh.", "category": "world", "tags": ["dan-tranh", "vibrato", "vietnamese"]},
-
-        # Wind Instruments
-        "harmonica": {"description": "VCSL harmonica. Blues harp. Expressive, folk, blues.", "category": "woodwind", "tags": ["harmonica", "blues", "harp", "folk"]},
-        "harmonica_soft": {"description": "VCSL soft harmonica. Gentle harmonica playing.", "category": "woodwind", "tags": ["harmonica", "soft", "gentle"]},
-        "harmonica_vib": {"description": "VCSL harmonica vibrato. Harmonica with vibrato.", "category": "woodwind", "tags": ["harmonica", "vibrato", "expressive"]},
-        "super64": {"description": "VCSL Super 64 chromatic harmonica. Large chromatic harmonica.", "category": "woodwind", "tags": ["harmonica", "chromatic", "super64"]},
-        "super64_acc": {"description": "VCSL Super 64 accented. Strong attack harmonica.", "category": "woodwind", "tags": ["harmonica", "chromatic", "accented"]},
-        "super64_vib": {"description": "VCSL Super 64 vibrato. Chromatic harmonica with vibrato.", "category": "woodwind", "tags": ["harmonica", "chromatic", "vibrato"]},
-        "didgeridoo": {"description": "VCSL didgeridoo. Australian Aboriginal drone instrument. Deep, drone, circular breathing.", "category": "world", "tags": ["didgeridoo", "australian", "drone", "aboriginal"]},
-
-        # Mallet Percussion
-        "agogo": {"description": "VCSL agogo bells. Brazilian percussion bells. Latin, samba, bright.", "category": "percussion", "tags": ["agogo", "bells", "brazilian", "samba"]},
-        "anvil": {"description": "VCSL anvil. Metal anvil hit. Industrial, orchestral effect.", "category": "percussion", "tags": ["anvil", "metal", "industrial", "orchestral"]},
-        "kalimba": {"description": "VCSL kalimba. African thumb piano. Plucky, gentle, melodic.", "category": "percussion", "tags": ["kalimba", "thumb-piano", "african", "melodic"]},
-        "kalimba_pad": {"description": "VCSL kalimba pad. Sustained kalimba pad sound. Ambient, ethereal.", "category": "percussion", "tags": ["kalimba", "pad", "ambient", "ethereal"]},
-        "marimba": {"description": "VCSL marimba. Large wooden mallet percussion. Warm, resonant.", "category": "percussion", "tags": ["marimba", "mallet", "wooden", "warm"]},
-        "xylophone": {"description": "VCSL xylophone. Bright wooden mallet percussion. Crisp, piercing.", "category": "percussion", "tags": ["xylophone", "mallet", "bright", "crisp"]},
-        "xylophone_hard": {"description": "VCSL xylophone hard mallets. Brighter, more attack.", "category": "percussion", "tags": ["xylophone", "hard", "bright", "attack"]},
-
-        # Sound Effects
-        "trainwhistle": {"description": "VCSL train whistle. Steam locomotive whistle. Nostalgic, effect.", "category": "sfx", "tags": ["train", "whistle", "steam", "nostalgic"]},
-        "siren": {"description": "VCSL siren. Emergency siren sound. Alert, urgent.", "category": "sfx", "tags": ["siren", "emergency", "alert", "urgent"]},
-        "wineglass": {"description": "VCSL wineglass. Singing glass rim. Ethereal, glass harmonica-like.", "category": "sfx", "tags": ["wineglass", "glass", "ethereal", "singing"]},
-        "wineglass_slow": {"description": "VCSL wineglass slow. Slowly bowed wineglass. Sustained, haunting.", "category": "sfx", "tags": ["wineglass", "slow", "sustained", "haunting"]},
-    }
 
-    # Add VCSL instruments to catalog
-    for name, data in vcsl_instruments.items():
-        sounds.append({
-            "id": f"vcsl_{name}",
-            "name": name,
-            "description": data["description"],
-            "source": "vcsl",
-            "category": data["category"],
-            "tags": data["tags"] + ["vcsl", "acoustic", "sample-library"],
-            "example": f'note("c4 e4 g4").s("{name}")'
-        })
-
-    # ===========================================
-    # WAVETABLES (dough-waveforms and more)
-    # Use with wt_ prefix for automatic looping
-    # ===========================================
-
-    wavetables = {
-        # Numbered waveforms (basic synthesis textures)
-        "wt_01": {"description": "Wavetable waveform 01. Basic synthesis texture. Evolving, complex.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis", "evolving"]},
-        "wt_02": {"description": "Wavetable waveform 02. Basic synthesis texture variant 2.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_03": {"description": "Wavetable waveform 03. Basic synthesis texture variant 3.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_04": {"description": "Wavetable waveform 04. Basic synthesis texture variant 4.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_05": {"description": "Wavetable waveform 05. Basic synthesis texture variant 5.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_06": {"description": "Wavetable waveform 06. Basic synthesis texture variant 6.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_07": {"description": "Wavetable waveform 07. Basic synthesis texture variant 7.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_08": {"description": "Wavetable waveform 08. Basic synthesis texture variant 8.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_09": {"description": "Wavetable waveform 09. Basic synthesis texture variant 9.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_10": {"description": "Wavetable waveform 10. Basic synthesis texture variant 10.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_11": {"description": "Wavetable waveform 11. Basic synthesis texture variant 11.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_12": {"description": "Wavetable waveform 12. Basic synthesis texture variant 12.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_13": {"description": "Wavetable waveform 13. Basic synthesis texture variant 13.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_14": {"description": "Wavetable waveform 14. Basic synthesis texture variant 14.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_15": {"description": "Wavetable waveform 15. Basic synthesis texture variant 15.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_16": {"description": "Wavetable waveform 16. Basic synthesis texture variant 16.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_17": {"description": "Wavetable waveform 17. Basic synthesis texture variant 17.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_18": {"description": "Wavetable waveform 18. Basic synthesis texture variant 18.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_19": {"description": "Wavetable waveform 19. Basic synthesis texture variant 19.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-        "wt_20": {"description": "Wavetable waveform 20. Basic synthesis texture variant 20.", "category": "wavetable", "tags": ["wavetable", "basic", "synthesis"]},
-
-        # Acoustic instrument wavetables
-        "wt_aguitar": {"description": "Wavetable acoustic guitar. Guitar harmonic content as wavetable. Organic, plucky.", "category": "wavetable", "tags": ["wavetable", "guitar", "acoustic", "organic"]},
-        "wt_altosax": {"description": "Wavetable alto saxophone. Sax timbre as wavetable. Reedy, expressive.", "category": "wavetable", "tags": ["wavetable", "saxophone", "alto", "reedy"]},
-        "wt_cello": {"description": "Wavetable cello. Cello harmonics as wavetable. Rich, bowed, strings.", "category": "wavetable", "tags": ["wavetable", "cello", "strings", "bowed"]},
-        "wt_clarinett": {"description": "Wavetable clarinet. Clarinet timbre as wavetable. Woody, warm.", "category": "wavetable", "tags": ["wavetable", "clarinet", "woody", "warm"]},
-        "wt_clavinet": {"description": "Wavetable clavinet. Funky clavinet as wavetable. Percussive, funky.", "category": "wavetable", "tags": ["wavetable", "clavinet", "funky", "percussive"]},
-        "wt_dbass": {"description": "Wavetable double bass. Upright bass as wavetable. Deep, woody, organic.", "category": "wavetable", "tags": ["wavetable", "bass", "double-bass", "woody"]},
-        "wt_ebass": {"description": "Wavetable electric bass. Electric bass as wavetable. Punchy, round.", "category": "wavetable", "tags": ["wavetable", "bass", "electric", "punchy"]},
-        "wt_eguitar": {"description": "Wavetable electric guitar. Electric guitar as wavetable. Versatile, harmonic.", "category": "wavetable", "tags": ["wavetable", "guitar", "electric", "harmonic"]},
-        "wt_eorgan": {"description": "Wavetable electric organ. Organ drawbars as wavetable. Classic, keys.", "category": "wavetable", "tags": ["wavetable", "organ", "electric", "drawbar"]},
-        "wt_epiano": {"description": "Wavetable electric piano. Rhodes-style as wavetable. Warm, bell-like.", "category": "wavetable", "tags": ["wavetable", "piano", "electric", "rhodes"]},
-        "wt_flute": {"description": "Wavetable flute. Flute timbre as wavetable. Airy, breathy.", "category": "wavetable", "tags": ["wavetable", "flute", "airy", "breathy"]},
-        "wt_oboe": {"description": "Wavetable oboe. Oboe as wavetable. Nasal, expressive, reedy.", "category": "wavetable", "tags": ["wavetable", "oboe", "nasal", "reedy"]},
-        "wt_piano": {"description": "Wavetable piano. Piano harmonics as wavetable. Bright, rich.", "category": "wavetable", "tags": ["wavetable", "piano", "acoustic", "rich"]},
-        "wt_theremin": {"description": "Wavetable theremin. Theremin-style wavetable. Eerie, vocal-like, sci-fi.", "category": "wavetable", "tags": ["wavetable", "theremin", "eerie", "sci-fi"]},
-        "wt_violin": {"description": "Wavetable violin. Violin as wavetable. Expressive, bowed, strings.", "category": "wavetable", "tags": ["wavetable", "violin", "strings", "bowed"]},
-
-        # Synthesis & Effects wavetables
-        "wt_fmsynth": {"description": "Wavetable FM synthesis. FM synth textures. Digital, bell-like, metallic.", "category": "wavetable", "tags": ["wavetable", "fm", "digital", "metallic"]},
-        "wt_distorted": {"description": "Wavetable distorted. Heavy distortion wavetable. Aggressive, saturated.", "category": "wavetable", "tags": ["wavetable", "distortion", "aggressive", "saturated"]},
-        "wt_granular": {"description": "Wavetable granular. Granular synthesis texture. Textural, fragmented.", "category": "wavetable", "tags": ["wavetable", "granular", "textural", "fragmented"]},
-
-        # Special waveforms
-        "wt_birds": {"description": "Wavetable birds. Bird-like textures. Nature, chirping, organic.", "category": "wavetable", "tags": ["wavetable", "birds", "nature", "organic"]},
-        "wt_bitreduced": {"description": "Wavetable bit-reduced. Lo-fi, crushed. 8-bit, retro, crunchy.", "category": "wavetable", "tags": ["wavetable", "bitcrush", "lo-fi", "8-bit"]},
-        "wt_hdrawn": {"description": "Wavetable hand-drawn. Custom drawn waveforms. Unique, experimental.", "category": "wavetable", "tags": ["wavetable", "hand-drawn", "custom", "experimental"]},
-        "wt_hvoice": {"description": "Wavetable harmonic voice. Vocal harmonics. Choir-like, ethereal.", "category": "wavetable", "tags": ["wavetable", "voice", "harmonic", "ethereal"]},
-        "wt_linear": {"description": "Wavetable linear. Linear waveform morphing. Smooth, evolving.", "category": "wavetable", "tags": ["wavetable", "linear", "smooth", "morphing"]},
-        "wt_oscchip": {"description": "Wavetable oscillator chip. Chip-style waveforms. 8-bit, chiptune, retro.", "category": "wavetable", "tags": ["wavetable", "chip", "8-bit", "chiptune"]},
-        "wt_overtone": {"description": "Wavetable overtone. Rich overtone content. Harmonic, complex.", "category": "wavetable", "tags": ["wavetable", "overtone", "harmonic", "complex"]},
-        "wt_pluckalgo": {"description": "Wavetable pluck algorithm. Karplus-Strong style. Plucky, string-like.", "category": "wavetable", "tags": ["wavetable", "pluck", "karplus-strong", "string"]},
-        "wt_raw": {"description": "Wavetable raw. Unprocessed raw waveforms. Pure, fundamental.", "category": "wavetable", "tags": ["wavetable", "raw", "pure", "unprocessed"]},
-        "wt_sinharm": {"description": "Wavetable sine harmonic. Additive sine harmonics. Clean, pure, harmonic.", "category": "wavetable", "tags": ["wavetable", "sine", "harmonic", "additive"]},
-        "wt_snippets": {"description": "Wavetable snippets. Short audio snippets as wavetable. Glitchy, textural.", "category": "wavetable", "tags": ["wavetable", "snippets", "glitch", "textural"]},
-        "wt_stereo": {"description": "Wavetable stereo. Wide stereo wavetables. Spacious, wide.", "category": "wavetable", "tags": ["wavetable", "stereo", "wide", "spacious"]},
-        "wt_stringbox": {"description": "Wavetable string box. String ensemble wavetable. Lush, ensemble.", "category": "wavetable", "tags": ["wavetable", "strings", "ensemble", "lush"]},
-        "wt_symetric": {"description": "Wavetable symmetric. Symmetric waveforms. Balanced, clean.", "category": "wavetable", "tags": ["wavetable", "symmetric", "balanced", "clean"]},
-        "wt_vgame": {"description": "Wavetable video game. Video game sound textures. Retro, game, 8-bit.", "category": "wavetable", "tags": ["wavetable", "video-game", "retro", "8-bit"]},
-        "wt_vgamebasic": {"description": "Wavetable video game basic. Simple game waveforms. Chiptune, simple.", "category": "wavetable", "tags": ["wavetable", "video-game", "basic", "chiptune"]},
-        "wt_c604": {"description": "Wavetable C604. C64-style chip waveforms. Commodore, SID, 8-bit.", "category": "wavetable", "tags": ["wavetable", "c64", "sid", "commodore"]},
-
-        # Band-limited basics
-        "wt_saw": {"description": "Wavetable sawtooth. Band-limited saw wave. Classic synth, aliasing-free.", "category": "wavetable", "tags": ["wavetable", "sawtooth", "band-limited", "classic"]},
-        "wt_square": {"description": "Wavetable square. Band-limited square wave. Hollow, punchy.", "category": "wavetable", "tags": ["wavetable", "square", "band-limited", "hollow"]},
-        "wt_triangle": {"description": "Wavetable triangle. Band-limited triangle wave. Soft, mellow.", "category": "wavetable", "tags": ["wavetable", "triangle", "band-limited", "mellow"]},
-        "wt_sine": {"description": "Wavetable sine. Pure sine as wavetable. Pure, fundamental, sub.", "category": "wavetable", "tags": ["wavetable", "sine", "pure", "fundamental"]},
-    }
+def ids_with_prefix(prefix: str) -> tuple[str, ...]:
+    """Return every sound id starting with *prefix*, in sorted order.
 
-    # Add wavetables to catalog
-    for name, data in wavetables.items():
-        sounds.append({
-            "id": name,
-            "name": name,
-            "description": data["description"],
-            "source": "wavetables",
-            "category": data["category"],
-            "tags": data["tags"] + ["looping", "synthesis"],
-            "example": f'note("c4 e4 g4").s("{name}").clip(2)'
-        })
+    Ids share long prefixes (808, 808bd, 808cy, ...; gabba, gabbaloud,
+    gabbalouder), so autocomplete is two binary searches over a cached
+    sorted tuple: O(log n + matches) with no trie dependency, which is
+    plenty for ~550 ids.
+    """
+    ids = _sorted_ids()
+    lo = bisect.bisect_left(ids, prefix)
+    hi = bisect.bisect_left(ids, prefix + "\uffff", lo)
+    return ids[lo:hi]
 
-    return sounds
+
+# Autocomplete guard rails: don't answer 1-2 char prefixes (they match huge
+# swaths of the catalog) and never hand a caller more than one page.
+MIN_COMPLETE_PREFIX = 3
 
 
-def main():
+def complete_ids(prefix: str, limit: int = 50) -> tuple[str, ...]:
+    """Autocomplete sound ids for a UI: capped, and only for real prefixes.
+
+    Thin policy layer over ids_with_prefix(); the slice keeps the payload
+    bounded as the catalog grows, independent of how many ids match.
+    """
+    if len(prefix) < MIN_COMPLETE_PREFIX:
+        return ()
+    return ids_with_prefix(prefix)[:limit]
+
+
+@functools.cache
+def _keyword_index() -> tuple["re.Pattern[str]", dict[str, tuple[int, ...]]]:
+    """Compiled alternation over all ids and tags, plus word -> rows map."""
+    word_rows: dict[str, list[int]] = {}
+    for row, sound in enumerate(build_catalog()):
+        word_rows.setdefault(sound.id, []).append(row)
+        for tag in sound.tags:
+            word_rows.setdefault(tag, []).append(row)
+    # Longest-first so e.g. "gabbaloud" wins over "gabba" at the same spot
+    pattern = re.compile(
+        r"(?<!\w)(?:"
+        + "|".join(sorted(map(re.escape, word_rows), key=len, reverse=True))
+        + r")(?!\w)"
+    )
+    return pattern, {word: tuple(rows) for word, rows in word_rows.items()}
+
+
+def find_keyword_matches(text: str) -> tuple[SoundEntry, ...]:
+    """Return sounds whose id or tag occurs as a word in *text*.
+
+    One C-level scan of the text against a single compiled alternation of
+    the ~1400 ids/tags — the stdlib stand-in for an Aho-Corasick automaton,
+    which this vocabulary size does not justify as a dependency — instead
+    of an O(entries x keywords) nest of substring checks per query.
+    """
+    pattern, word_rows = _keyword_index()
+    sounds = build_catalog()
+    rows = {row for m in pattern.finditer(text.lower()) for row in word_rows[m.group()]}
+    return tuple(sounds[row] for row in sorted(rows))
+
+
+def build_indexes(sounds: tuple[SoundEntry, ...]) -> dict:
+    """Precompute inverted tag and category indexes over the catalog.
+
+    Filtering by tag or category is the main read pattern for this data;
+    resolving a query through a dict hit (plus a set intersection for
+    multi-tag filters) beats scanning all ~550 entries each time, and
+    building the maps once here removes that work from every consumer.
+
+    Tags are normalized through an integer vocabulary: "ids" maps row
+    number -> sound id, "tag_vocab" maps tag id -> tag string, and
+    "tag_index" is aligned with the vocab, each slot listing the rows
+    carrying that tag. Postings of small ints serialize far smaller than
+    repeated id/tag strings and intersect as plain integer sets.
+    """
+    vocab: dict[str, int] = {}
+    tag_index: list[list[int]] = []
+    category_index: dict[str, list[int]] = {}
+    for row, sound in enumerate(sounds):
+        category_index.setdefault(sound.category, []).append(row)
+        for tag in sound.tags:
+            tag_id = vocab.setdefault(tag, len(vocab))
+            if tag_id == len(tag_index):
+                tag_index.append([])
+            tag_index[tag_id].append(row)
+    return {
+        "ids": [sound.id for sound in sounds],
+        "tag_vocab": list(vocab),
+        "tag_index": tag_index,
+        "category_index": category_index,
+    }
+
+
+def _encode_json(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _write_catalog_json(records, path: Path) -> None:
+    """Stream records to *path* as one top-level JSON array.
+
+    Entries are encoded one at a time (one per line) so peak memory stays at
+    a single encoded entry rather than the whole payload; the 1 MiB buffer
+    coalesces the small per-entry writes into large ones.
+    """
+    # Entries are encoded individually, never the whole list at once: a
+    # single json.dump streams hundreds of tiny iterencode chunks
+    # (CPython #129711).
+    encode = _encode_json
+
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(b"[\n")
+        first = True
+        for record in records:
+            if not first:
+                f.write(b",\n")
+            first = False
+            f.write(b"  ")
+            f.write(encode(record))
+        f.write(b"\n]")
+
+
+def build_fts_db(sounds: tuple[SoundEntry, ...], path: Path) -> None:
+    """Build a SQLite FTS5 full-text index over descriptions and tags.
+
+    Boolean/phrase text queries like "roland AND (bass OR kick)" then run
+    through SQLite's C tokenizer with BM25 ranking instead of Python
+    string loops. The db is recreated from scratch so stale rows never
+    linger across rebuilds.
+    """
+    import sqlite3
+
+    path.unlink(missing_ok=True)
+    con = sqlite3.connect(path)
+    try:
+        con.execute(
+            "CREATE VIRTUAL TABLE sounds USING fts5("
+            "id UNINDEXED, description, category, tags, tokenize='unicode61')"
+        )
+        con.executemany(
+            "INSERT INTO sounds VALUES (?, ?, ?, ?)",
+            ((s.id, s.description, s.category, " ".join(s.tags)) for s in sounds),
+        )
+        con.commit()
+    finally:
+        con.close()
+
+
+def build_tag_bitmap(sounds: tuple[SoundEntry, ...], path: Path) -> None:
+    """Pack per-tag membership bits into a matrix for vectorized filtering.
+
+    Row t holds one bit per catalog entry (catalog order) saying whether
+    that entry carries tag t, with tags ordered as in
+    build_indexes()["tag_vocab"]. An AND-of-tags filter then becomes a
+    couple of numpy bitwise reductions over a few-KB array instead of
+    Python-level set work. Requires numpy (pulled in via torch et al. in
+    requirements.txt).
+    """
+    import numpy as np
+
+    indexes = build_indexes(sounds)
+    membership = np.zeros((len(indexes["tag_vocab"]), len(sounds)), dtype=bool)
+    for tag_id, rows in enumerate(indexes["tag_index"]):
+        membership[tag_id, rows] = True
+    np.savez_compressed(
+        path,
+        bits=np.packbits(membership, axis=1),
+        tag_vocab=np.array(indexes["tag_vocab"]),
+    )
+
+
+def build_ngram_index(sounds: tuple[SoundEntry, ...], path: Path) -> None:
+    """Build a char n-gram index over descriptions and tags for fuzzy search.
+
+    Indexing cost is paid once at build time instead of per query: fuzzy or
+    partial matching becomes a single sparse matrix-vector product against
+    the saved CSR matrix. Requires scikit-learn (see requirements.txt).
+    """
+    from scipy import sparse
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    texts = [f"{sound.description} {' '.join(sound.tags)}" for sound in sounds]
+    vectorizer = HashingVectorizer(
+        n_features=2**18, analyzer="char_wb", ngram_range=(3, 5)
+    )
+    sparse.save_npz(path, vectorizer.transform(texts))
+
+
+def main(
+    rebuild: bool = False,
+    ndjson: bool = False,
+    fts_db: bool = False,
+    tag_bitmap: bool = False,
+    ngram_index: bool = False,
+):
     """Generate and save the sound catalog."""
     print("Building sound catalog...")
 
-    sounds = build_catalog()
+    sounds = load_catalog(rebuild=rebuild)
 
-    # Save as JSON
+    # Save as JSON; entries only become dicts here, at emit time, and are
+    # streamed out one at a time
     output_path = Path(__file__).parent / "sound_catalog.json"
-    with open(output_path, "w") as f:
-        json.dump(sounds, f, indent=2)
+    _write_catalog_json((sound._asdict() for sound in sounds), output_path)
 
     print(f"Generated catalog with {len(sounds)} sounds")
     print(f"Saved to: {output_path}")
 
-    # Print summary by source
-    sources = {}
-    for sound in sounds:
-        source = sound["source"]
-        sources[source] = sources.get(source, 0) + 1
-
-    print("\nBreakdown by source:")
-    for source, count in sorted(sources.items()):
-        print(f"  {source}: {count}")
-
-    # Print summary by category
-    categories = {}
-    for sound in sounds:
-        cat = sound["category"]
-        categories[cat] = categories.get(cat, 0) + 1
-
-    print("\nBreakdown by category:")
-    for cat, count in sorted(categories.items(), key=lambda x: -x[1])[:15]:
-        print(f"  {cat}: {count}")
+    # Optional NDJSON mirror for stream-parsing consumers; the array form
+    # above stays the public schema (arrwDB upload contract)
+    if ndjson:
+        ndjson_path = output_path.with_suffix(".ndjson")
+        with open(ndjson_path, "wb", buffering=1 << 20) as f:
+            for sound in sounds:
+                f.write(_encode_json(sound._asdict()))
+                f.write(b"\n")
+        print(f"Saved NDJSON mirror to: {ndjson_path}")
+
+    # Inverted indexes, so consumers filter via dict lookups instead of
+    # scanning the whole catalog per query
+    index_path = Path(__file__).parent / "sound_catalog_index.json"
+    with open(index_path, "wb") as f:
+        f.write(_encode_json(build_indexes(sounds)))
+    print(f"Saved indexes to: {index_path}")
+
+    if fts_db:
+        db_path = Path(__file__).parent / "sound_catalog.db"
+        build_fts_db(sounds, db_path)
+        print(f"Saved FTS5 index to: {db_path}")
+
+    if tag_bitmap:
+        bitmap_path = Path(__file__).parent / "catalog_tag_bits.npz"
+        build_tag_bitmap(sounds, bitmap_path)
+        print(f"Saved tag bitmap to: {bitmap_path}")
+
+    if ngram_index:
+        ngram_path = Path(__file__).parent / "catalog_ngrams.npz"
+        build_ngram_index(sounds, ngram_path)
+        print(f"Saved n-gram index to: {ngram_path}")
+
+    # Print summaries; Counter ingests the generators in C, most_common(15)
+    # heap-selects instead of fully sorting, and the whole report goes out
+    # as one write instead of ~25 line-buffered prints
+    sources = Counter(sound.source for sound in sounds)
+    categories = Counter(sound.category for sound in sounds)
+    lines = ["", "Breakdown by source:"]
+    lines.extend(f"  {source}: {count}" for source, count in sorted(sources.items()))
+    lines.extend(("", "Breakdown by category:"))
+    lines.extend(f"  {cat}: {count}" for cat, count in categories.most_common(15))
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the sound catalog")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Ignore the pickle cache and rebuild from the tables")
+    parser.add_argument("--ndjson", action="store_true",
+                        help="Also write a newline-delimited JSON mirror")
+    parser.add_argument("--fts-db", action="store_true",
+                        help="Also write a SQLite FTS5 index for text search")
+    parser.add_argument("--tag-bitmap", action="store_true",
+                        help="Also write a bit-packed tag membership matrix")
+    parser.add_argument("--ngram-index", action="store_true",
+                        help="Also write a char n-gram index for fuzzy matching")
+
+    args = parser.parse_args()
+    main(rebuild=args.rebuild, ndjson=args.ndjson, fts_db=args.fts_db,
+         tag_bitmap=args.tag_bitmap, ngram_index=args.ngram_index)
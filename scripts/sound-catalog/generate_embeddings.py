@@ -14,75 +14,227 @@ BGE-M3 is used because:
 - Supports up to 8192 tokens
 """
 
+import functools
 import json
+import os
+import sys
 import time
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
-from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback; orjson is in requirements.txt
+    orjson = None
 
-def load_bge_m3():
+# Descriptions are short, so fairly large batches fit comfortably; batching
+# turns ~700 sequential forward passes into a handful of batched ones.
+DEFAULT_BATCH_SIZE = 64
+
+# Progress bars only earn their per-batch refresh cost when someone is
+# watching; piped/cron runs skip them (also silences FlagEmbedding's
+# internal tqdm).
+if not sys.stderr.isatty():
+    os.environ.setdefault("TQDM_DISABLE", "1")
+
+
+def load_bge_m3(backend: str = "auto", device: Optional[str] = None):
     """Load BGE-M3 model."""
     print("Loading BGE-M3 model (this may take a moment on first run)...")
     print("Model size: ~2.3GB - downloading if not cached...")
 
-    try:
-        # Try FlagEmbedding first (official BAAI implementation)
-        from FlagEmbedding import BGEM3FlagModel
+    if backend in ("auto", "flagembedding"):
+        try:
+            # Try FlagEmbedding first (official BAAI implementation)
+            from FlagEmbedding import BGEM3FlagModel
 
-        model = BGEM3FlagModel(
-            "BAAI/bge-m3",
-            use_fp16=True,  # Use half precision for faster inference
-        )
-        print("Loaded BGE-M3 via FlagEmbedding")
-        return model, "flagembedding"
+            model = BGEM3FlagModel(
+                "BAAI/bge-m3",
+                use_fp16=True,  # Use half precision for faster inference
+                device=device,
+            )
+            print("Loaded BGE-M3 via FlagEmbedding")
+            return model, "flagembedding"
 
-    except ImportError:
-        print("FlagEmbedding not found, trying sentence-transformers...")
+        except ImportError:
+            if backend == "flagembedding":
+                raise
+            print("FlagEmbedding not found, trying sentence-transformers...")
 
-        # Fallback to sentence-transformers
-        from sentence_transformers import SentenceTransformer
+    # Fallback to sentence-transformers
+    from sentence_transformers import SentenceTransformer
 
-        model = SentenceTransformer("BAAI/bge-m3")
-        print("Loaded BGE-M3 via sentence-transformers")
-        return model, "sentence-transformers"
+    model = SentenceTransformer("BAAI/bge-m3", device=device)
+    print("Loaded BGE-M3 via sentence-transformers")
+    return model, "sentence-transformers"
 
 
-def generate_embeddings_flagembedding(model, texts: list[str]) -> list[list[float]]:
-    """Generate embeddings using FlagEmbedding."""
-    # BGE-M3 returns dict with 'dense_vecs' for dense embeddings
-    result = model.encode(
-        texts,
-        batch_size=32,
-        max_length=512,  # More than enough for our short descriptions
-        return_dense=True,
-        return_sparse=False,
-        return_colbert_vecs=False,
+def _encode_length_sorted(encode, texts: list[str]) -> np.ndarray:
+    """Encode with inputs grouped by length, returning caller order.
+
+    Each batch pads to its longest member, so sorting by length first
+    keeps the padded token count near the minimum ("smart batching");
+    results are un-permuted back to catalog order afterwards.
+    sentence-transformers already does this internally; the FlagEmbedding
+    and ONNX paths do not, hence this wrapper.
+    """
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    encoded = np.asarray(encode([texts[i] for i in order]), dtype=np.float32)
+    return encoded[np.argsort(order)]
+
+
+def load_bge_m3_onnx(device: Optional[str] = None):
+    """Load BGE-M3 through ONNX Runtime.
+
+    optimum exports the model to a static graph once (cached under the HF
+    cache dir) with LayerNorm/GELU/attention fusion applied; on CPU this is
+    typically several times faster per batch than eager PyTorch. Requires
+    the optional optimum[onnxruntime] dependency (see requirements.txt).
+    """
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+
+    print("Loading BGE-M3 via ONNX Runtime (exports the graph on first run)...")
+    provider = (
+        "CUDAExecutionProvider"
+        if device is not None and device.startswith("cuda")
+        else "CPUExecutionProvider"
     )
+    model = ORTModelForFeatureExtraction.from_pretrained(
+        "BAAI/bge-m3", export=True, provider=provider
+    )
+    tokenizer = AutoTokenizer.from_pretrained("BAAI/bge-m3")
+    print("Loaded BGE-M3 via ONNX Runtime")
+    return (model, tokenizer), "onnx"
+
+
+def generate_embeddings_onnx(
+    model, texts: list[str], batch_size: int = DEFAULT_BATCH_SIZE
+) -> np.ndarray:
+    """Generate embeddings using the ONNX Runtime backend (CLS pooling)."""
+    ort_model, tokenizer = model
+
+    def encode(ordered: list[str]) -> np.ndarray:
+        embeddings = []
+        for start in range(0, len(ordered), batch_size):
+            encoded = tokenizer(
+                ordered[start : start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=512,
+                return_tensors="pt",
+            )
+            hidden = ort_model(**encoded).last_hidden_state
+            # CLS token, L2-normalized -- same dense output BGE-M3 ships
+            cls = hidden[:, 0].numpy().astype(np.float32)
+            cls /= np.linalg.norm(cls, axis=1, keepdims=True)
+            embeddings.append(cls)
+        return np.concatenate(embeddings)
+
+    return _encode_length_sorted(encode, texts)
+
+
+def load_bge_m3_dense(device: Optional[str] = None):
+    """Load the bare BGE-M3 encoder for dense-only output.
+
+    BGEM3FlagModel runs the sparse and ColBERT projection heads on every
+    forward pass even when their outputs are discarded; calling the
+    underlying AutoModel directly skips them for ~20-30% less work per
+    batch. CLS pooling + L2 norm matches the dense vectors it ships.
+    """
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    print("Loading BGE-M3 encoder (dense-only)...")
+    tokenizer = AutoTokenizer.from_pretrained("BAAI/bge-m3", use_fast=True)
+    model = AutoModel.from_pretrained("BAAI/bge-m3")
+    if device is None:
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    if device.startswith("cuda"):
+        model = model.half()
+    model = model.to(device).eval()
+    print("Loaded BGE-M3 dense-only encoder")
+    return (model, tokenizer), "dense"
+
+
+def generate_embeddings_dense(
+    model, texts: list[str], batch_size: int = DEFAULT_BATCH_SIZE
+) -> np.ndarray:
+    """Generate embeddings using the dense-only encoder (CLS pooling)."""
+    import torch
+
+    auto_model, tokenizer = model
+    device = next(auto_model.parameters()).device
+
+    def encode(ordered: list[str]) -> np.ndarray:
+        embeddings = []
+        with torch.inference_mode():
+            for start in range(0, len(ordered), batch_size):
+                encoded = tokenizer(
+                    ordered[start : start + batch_size],
+                    padding=True,
+                    truncation=True,
+                    max_length=512,
+                    return_tensors="pt",
+                ).to(device)
+                hidden = auto_model(**encoded).last_hidden_state
+                cls = hidden[:, 0].float().cpu().numpy()
+                cls /= np.linalg.norm(cls, axis=1, keepdims=True)
+                embeddings.append(cls)
+        return np.concatenate(embeddings)
+
+    return _encode_length_sorted(encode, texts)
+
+
+def generate_embeddings_flagembedding(
+    model, texts: list[str], batch_size: int = DEFAULT_BATCH_SIZE
+) -> np.ndarray:
+    """Generate embeddings using FlagEmbedding."""
 
-    # Extract dense vectors
-    embeddings = result["dense_vecs"]
+    def encode(ordered: list[str]) -> np.ndarray:
+        # BGE-M3 returns dict with 'dense_vecs' for dense embeddings
+        result = model.encode(
+            ordered,
+            batch_size=batch_size,
+            max_length=512,  # More than enough for our short descriptions
+            return_dense=True,
+            return_sparse=False,
+            return_colbert_vecs=False,
+        )
+
+        return result["dense_vecs"]
 
-    # Convert to list of lists for JSON serialization
-    return [emb.tolist() for emb in embeddings]
+    return _encode_length_sorted(encode, texts)
 
 
-def generate_embeddings_sentence_transformers(model, texts: list[str]) -> list[list[float]]:
+def generate_embeddings_sentence_transformers(
+    model, texts: list[str], batch_size: int = DEFAULT_BATCH_SIZE
+) -> np.ndarray:
     """Generate embeddings using sentence-transformers."""
     embeddings = model.encode(
         texts,
-        batch_size=32,
-        show_progress_bar=True,
+        batch_size=batch_size,
+        show_progress_bar=sys.stderr.isatty(),
         normalize_embeddings=True,
     )
 
-    return [emb.tolist() for emb in embeddings]
+    return np.asarray(embeddings, dtype=np.float32)
 
 
-# Cache for model (lazy loading)
-_model_cache = {"model": None, "backend": None}
+@functools.lru_cache(maxsize=1)
+def get_model(backend: str = "auto", device: Optional[str] = None):
+    """Load the model once per process, with torch threads pinned first.
+
+    torch's conservative intra-op default can leave most cores idle for
+    CPU inference, so size the pool to the machine before the first
+    forward pass.
+    """
+    import torch
+
+    torch.set_num_threads(os.cpu_count() or 1)
+    return load_bge_m3(backend, device)
 
 
 def generate_embedding(text: str) -> list[float]:
@@ -90,18 +242,33 @@ def generate_embedding(text: str) -> list[float]:
     Generate embedding for a single text query.
     Used by load_to_arrwdb.py for testing searches.
     """
-    if _model_cache["model"] is None:
-        _model_cache["model"], _model_cache["backend"] = load_bge_m3()
-
-    model = _model_cache["model"]
-    backend = _model_cache["backend"]
+    model, backend = get_model()
 
     if backend == "flagembedding":
         embeddings = generate_embeddings_flagembedding(model, [text])
     else:
         embeddings = generate_embeddings_sentence_transformers(model, [text])
 
-    return embeddings[0]
+    return embeddings[0].tolist()
+
+
+def quantize_embeddings(embeddings: np.ndarray, mode: str) -> dict:
+    """Quantize embeddings for compact storage.
+
+    int8 keeps a per-vector scale (max-abs / 127) alongside the quantized
+    values, ~4x smaller than FP32. binary packs sign bits 8-per-byte, ~32x
+    smaller; suitable for coarse Hamming-distance retrieval with FP32
+    re-ranking of the top results.
+    """
+    vecs = np.asarray(embeddings, dtype=np.float32)
+    if mode == "int8":
+        scales = np.abs(vecs).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.round(vecs / scales[:, None]).astype(np.int8)
+        return {"embeddings_int8": quantized, "scales": scales}
+    if mode == "binary":
+        return {"embeddings_bits": np.packbits(vecs > 0, axis=1)}
+    raise ValueError(f"Unknown quantization mode: {mode}")
 
 
 def build_search_text(sound: dict) -> str:
@@ -123,6 +290,12 @@ def build_search_text(sound: dict) -> str:
 def main(
     catalog_path: Optional[str] = None,
     output_path: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    quantize: Optional[str] = None,
+    backend: str = "auto",
+    device: Optional[str] = None,
+    npy: bool = False,
+    fp16: bool = False,
 ):
     """Generate embeddings for the sound catalog."""
 
@@ -145,7 +318,12 @@ def main(
     print(f"Loaded {len(sounds)} sounds")
 
     # Load model
-    model, backend = load_bge_m3()
+    if backend == "onnx":
+        model, backend = load_bge_m3_onnx(device)
+    elif backend == "dense":
+        model, backend = load_bge_m3_dense(device)
+    else:
+        model, backend = get_model(backend, device)
 
     # Build texts for embedding
     print("\nPreparing texts for embedding...")
@@ -154,29 +332,75 @@ def main(
     # Show sample
     print(f"\nSample search text:\n{texts[0][:200]}...")
 
+    # Embed each distinct text once; ids keep duplicates rare today, but a
+    # repeated search_text would otherwise repeat a full forward pass
+    unique_index: dict[str, int] = {}
+    inverse = [unique_index.setdefault(text, len(unique_index)) for text in texts]
+    unique_texts = list(unique_index)
+    if len(unique_texts) < len(texts):
+        print(f"Deduplicated {len(texts) - len(unique_texts)} repeated texts")
+
     # Generate embeddings
     print(f"\nGenerating embeddings with BGE-M3 ({backend})...")
     start_time = time.time()
 
     if backend == "flagembedding":
-        embeddings = generate_embeddings_flagembedding(model, texts)
+        embeddings = generate_embeddings_flagembedding(model, unique_texts, batch_size)
+    elif backend == "onnx":
+        embeddings = generate_embeddings_onnx(model, unique_texts, batch_size)
+    elif backend == "dense":
+        embeddings = generate_embeddings_dense(model, unique_texts, batch_size)
     else:
-        embeddings = generate_embeddings_sentence_transformers(model, texts)
+        embeddings = generate_embeddings_sentence_transformers(
+            model, unique_texts, batch_size
+        )
+    embeddings = embeddings[np.asarray(inverse)]
 
     elapsed = time.time() - start_time
     print(f"Generated {len(embeddings)} embeddings in {elapsed:.2f}s")
     print(f"Embedding dimension: {len(embeddings[0])}")
 
-    # Add embeddings to sounds
-    print("\nAdding embeddings to catalog...")
-    for i, sound in enumerate(sounds):
-        sound["embedding"] = embeddings[i]
-        sound["search_text"] = texts[i]
-
-    # Save output
+    # Optionally persist the raw matrix; consumers that only need vectors
+    # mmap this instead of re-parsing ASCII floats out of the JSON. FP16
+    # halves it again and is cosine-lossless for BGE-M3 (the model already
+    # runs in half precision).
+    if npy:
+        if fp16:
+            npy_path = output_path.with_suffix(".f16.npy")
+            np.save(npy_path, embeddings.astype(np.float16))
+            print(f"Wrote float16 embedding matrix to: {npy_path}")
+        else:
+            npy_path = output_path.with_suffix(".npy")
+            np.save(npy_path, embeddings)
+            print(f"Wrote float32 embedding matrix to: {npy_path}")
+
+    # Optionally persist a quantized sidecar next to the FP32 JSON
+    if quantize:
+        quant_path = output_path.with_suffix(f".{quantize}.npz")
+        np.savez_compressed(quant_path, **quantize_embeddings(embeddings, quantize))
+        print(f"Wrote {quantize}-quantized embeddings to: {quant_path}")
+
+    # Annotate and save, streaming one record at a time: each row's
+    # embedding becomes a Python list only while that record is being
+    # written, so peak memory stays at the float32 matrix plus one row
+    # instead of catalog + list-of-floats + full JSON string
     print(f"\nSaving to: {output_path}")
-    with open(output_path, "w") as f:
-        json.dump(sounds, f)
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        f.write(b"[")
+        for i, sound in enumerate(sounds):
+            if i:
+                f.write(b",")
+            sound["search_text"] = texts[i]
+            if orjson is not None:
+                # OPT_SERIALIZE_NUMPY encodes the float32 row in C -- no
+                # tolist() expansion at all
+                sound["embedding"] = embeddings[i]
+                f.write(orjson.dumps(sound, option=orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                sound["embedding"] = embeddings[i].tolist()
+                f.write(json.dumps(sound).encode())
+            del sound["embedding"]
+        f.write(b"]")
 
     # Calculate file size
     file_size_mb = output_path.stat().st_size / (1024 * 1024)
@@ -199,6 +423,24 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate embeddings for sound catalog")
     parser.add_argument("--catalog", type=str, help="Path to sound catalog JSON")
     parser.add_argument("--output", type=str, help="Path for output JSON with embeddings")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="Texts per model.encode batch")
+    parser.add_argument("--quantize", choices=["int8", "binary"],
+                        help="Also write a quantized .npz sidecar")
+    parser.add_argument("--backend", default="auto",
+                        choices=["auto", "flagembedding", "sentence-transformers",
+                                 "onnx", "dense"],
+                        help="Inference backend (auto tries FlagEmbedding, "
+                             "then sentence-transformers)")
+    parser.add_argument("--device", type=str,
+                        help="Inference device, e.g. cpu, cuda, cuda:0")
+    parser.add_argument("--npy", action="store_true",
+                        help="Also write the raw embedding matrix as .npy")
+    parser.add_argument("--fp16", action="store_true",
+                        help="Save the --npy sidecar as float16")
 
     args = parser.parse_args()
-    main(catalog_path=args.catalog, output_path=args.output)
+    main(catalog_path=args.catalog, output_path=args.output,
+         batch_size=args.batch_size, quantize=args.quantize,
+         backend=args.backend, device=args.device,
+         npy=args.npy, fp16=args.fp16)
@@ -15,6 +15,7 @@ Prerequisites:
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -108,25 +109,24 @@ def upload_sounds_batch(
     library_id: str,
     sounds: list[dict],
     batch_size: int = 50,
+    max_workers: int = 4,
 ) -> tuple[int, int]:
-    """Upload sounds in batches using pre-computed embeddings."""
+    """Upload sounds in parallel batches using pre-computed embeddings.
+
+    Uploads are network-bound, so a few threads sharing the (thread-safe)
+    httpx client keep requests in flight while arrwDB indexes each batch.
+    """
 
     total_success = 0
     total_failed = 0
 
-    # Process in batches
-    for i in range(0, len(sounds), batch_size):
-        batch = sounds[i : i + batch_size]
-        batch_num = i // batch_size + 1
-        total_batches = (len(sounds) + batch_size - 1) // batch_size
-
-        print(f"Uploading batch {batch_num}/{total_batches} ({len(batch)} sounds)...")
+    batches = [sounds[i : i + batch_size] for i in range(0, len(sounds), batch_size)]
 
-        # Prepare documents for arrwDB
-        documents = []
-        for sound in batch:
-            # Each sound becomes a document with one chunk
-            doc = {
+    def upload_one(batch: list[dict]) -> tuple[int, int]:
+        # Prepare documents for arrwDB; each sound becomes a document with
+        # one chunk
+        documents = [
+            {
                 "title": sound["name"],
                 "chunks": [
                     {
@@ -138,9 +138,9 @@ def upload_sounds_batch(
                 "document_type": "sound",
                 "tags": sound["tags"][:10],  # arrwDB limits tags
             }
-            documents.append(doc)
+            for sound in batch
+        ]
 
-        # Upload batch
         response = client.post(
             f"{ARRWDB_BASE_URL}/v1/libraries/{library_id}/documents/batch-with-embeddings",
             json={"documents": documents},
@@ -149,12 +149,19 @@ def upload_sounds_batch(
 
         if response.status_code == 201:
             result = response.json()
-            total_success += result["successful"]
-            total_failed += result["failed"]
-            print(f"  Success: {result['successful']}, Failed: {result['failed']}")
-        else:
-            print(f"  Error: {response.text}")
-            total_failed += len(batch)
+            return result["successful"], result["failed"]
+        print(f"  Error: {response.text}")
+        return 0, len(batch)
+
+    print(f"Uploading {len(batches)} batches with {max_workers} workers...")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for batch_num, (successful, failed) in enumerate(
+            executor.map(upload_one, batches), 1
+        ):
+            total_success += successful
+            total_failed += failed
+            print(f"  Batch {batch_num}/{len(batches)}: "
+                  f"success {successful}, failed {failed}")
 
     return total_success, total_failed
 